@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""Async PostgreSQL connection pool (psycopg 3) used by the async GraphQL resolvers"""
+
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Optional
+
+from psycopg.rows import dict_row
+from psycopg_pool import AsyncConnectionPool
+
+from .db import DATABASE_URL, DB_POOL_MIN_SIZE, DB_POOL_MAX_SIZE, DB_POOL_TIMEOUT
+
+
+_pool: Optional[AsyncConnectionPool] = None
+_pool_lock: Optional[asyncio.Lock] = None
+
+
+async def get_async_pool() -> AsyncConnectionPool:
+    """Return the process-wide async pool, opening it on first use"""
+    global _pool, _pool_lock
+    if _pool is not None:
+        return _pool
+
+    if _pool_lock is None:
+        _pool_lock = asyncio.Lock()
+    async with _pool_lock:
+        if _pool is None:
+            pool = AsyncConnectionPool(
+                DATABASE_URL,
+                min_size=DB_POOL_MIN_SIZE,
+                max_size=DB_POOL_MAX_SIZE,
+                timeout=DB_POOL_TIMEOUT,
+                # Same policy as the sync pool: read-only autocommit connections
+                kwargs={"autocommit": True, "row_factory": dict_row},
+                # Ping connections before handing them out so restarts of the DB heal themselves
+                check=AsyncConnectionPool.check_connection,
+                open=False,
+            )
+            await pool.open()
+            _pool = pool
+    return _pool
+
+
+async def close_async_pool():
+    """Close the process-wide async pool (called on server shutdown)"""
+    global _pool
+    if _pool is not None:
+        pool, _pool = _pool, None
+        await pool.close()
+
+
+@asynccontextmanager
+async def get_async_cursor():
+    """Borrow a pooled async connection and yield a dict-row cursor on it"""
+    pool = await get_async_pool()
+    async with pool.connection() as conn:
+        async with conn.cursor() as cursor:
+            yield cursor
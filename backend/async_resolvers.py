@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""Async GraphQL resolvers backed by the psycopg 3 async pool
+
+These mirror the functions in resolvers.py and reuse its SQL and builders.
+Each resolver borrows its own connection, so independent top-level fields in
+one query run concurrently on the event loop instead of serially on a worker
+thread. Per-resort fields go through per-request DataLoaders (see
+create_loaders) so aliased lookups in one query share a single batch.
+"""
+
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
+
+from strawberry.dataloader import DataLoader
+
+from .async_db import get_async_cursor
+from .cache import cached, cached_batch, SKI_DATA, WEATHER_DATA
+from .resolvers import (
+    LOCATIONS_SQL,
+    RESORTS_HOME_SQL,
+    RESORT_DETAIL_SQL,
+    GLOBAL_RECENT_LIFTS_SQL,
+    GLOBAL_RECENT_RUNS_SQL,
+    WEATHER_STATIONS_SQL,
+    WEATHER_DAILY_SQL,
+    WEATHER_HISTORICAL_SQL,
+    WEATHER_RESORT_NAMES_SQL,
+    FORECAST_SQL,
+    FORECAST_RESORT_NAMES_SQL,
+    normalize_resort_name,
+    hourly_query,
+    station_triplets_for,
+    build_resort_home_summaries,
+    build_resort_summaries,
+    build_global_recently_opened,
+    build_resort_weathers,
+    build_resort_forecasts,
+)
+from .schema import (
+    ResortSummary, ResortHomeSummary, GlobalRecentlyOpened,
+    ResortWeatherSummary, ResortForecast,
+)
+
+
+async def _fetch_column(sql: str, column: str) -> List[str]:
+    """Run a query and return a single column from every row"""
+    async with get_async_cursor() as cursor:
+        await cursor.execute(sql)
+        return [row[column] for row in await cursor.fetchall()]
+
+
+@cached(SKI_DATA)
+async def get_all_resorts() -> List[ResortSummary]:
+    """Get summary data for all ski resorts"""
+    locations = await _fetch_column(LOCATIONS_SQL, 'location')
+    return [resort for resort in await get_resorts_by_locations(locations) if resort]
+
+
+@cached(SKI_DATA)
+async def get_all_resorts_home() -> List[ResortHomeSummary]:
+    """Get pre-aggregated summary data for home page using v_resort_summary view"""
+    async with get_async_cursor() as cursor:
+        await cursor.execute(RESORTS_HOME_SQL)
+        rows = await cursor.fetchall()
+
+    return build_resort_home_summaries(rows)
+
+
+@cached_batch(SKI_DATA)
+async def get_resorts_by_locations(locations: List[str]) -> List[Optional[ResortSummary]]:
+    """Get detailed data for several resorts in a constant number of queries"""
+    if not locations:
+        return []
+
+    results = []
+    async with get_async_cursor() as cursor:
+        for sql in RESORT_DETAIL_SQL:
+            await cursor.execute(sql, (list(locations),))
+            results.append(await cursor.fetchall())
+
+    return build_resort_summaries(locations, results)
+
+
+async def get_resort_by_location(location: str) -> Optional[ResortSummary]:
+    """Get detailed data for a specific resort"""
+    return (await get_resorts_by_locations([location]))[0]
+
+
+@cached(SKI_DATA)
+async def get_global_recently_opened() -> GlobalRecentlyOpened:
+    """Get recently opened lifts and runs across all resorts"""
+    async with get_async_cursor() as cursor:
+        await cursor.execute(GLOBAL_RECENT_LIFTS_SQL)
+        lifts_data = await cursor.fetchall()
+
+        await cursor.execute(GLOBAL_RECENT_RUNS_SQL)
+        runs_data = await cursor.fetchall()
+
+    return build_global_recently_opened(lifts_data, runs_data)
+
+
+@cached_batch(WEATHER_DATA)
+async def get_resort_weather_batch(
+    resort_names: List[str],
+    days: int = 7,
+    resolution: int = 1,
+    max_points: Optional[int] = None,
+) -> List[Optional[ResortWeatherSummary]]:
+    """Get weather summaries for several resorts in a constant number of queries"""
+    normalized_names = [normalize_resort_name(name) for name in resort_names]
+    if not normalized_names:
+        return []
+
+    async with get_async_cursor() as cursor:
+        await cursor.execute(WEATHER_STATIONS_SQL, (normalized_names,))
+        station_rows = await cursor.fetchall()
+        if not station_rows:
+            return [None] * len(normalized_names)
+
+        station_triplets = station_triplets_for(station_rows)
+
+        await cursor.execute(WEATHER_DAILY_SQL, (station_triplets, days))
+        daily_rows = await cursor.fetchall()
+
+        await cursor.execute(*hourly_query(normalized_names, days, resolution))
+        hourly_rows = await cursor.fetchall()
+
+        await cursor.execute(WEATHER_HISTORICAL_SQL, (normalized_names, days))
+        daily_weather_rows = await cursor.fetchall()
+
+    return build_resort_weathers(
+        normalized_names, station_rows, daily_rows, hourly_rows, daily_weather_rows, max_points
+    )
+
+
+async def get_resort_weather(
+    resort_name: str,
+    days: int = 7,
+    resolution: int = 1,
+    max_points: Optional[int] = None,
+) -> Optional[ResortWeatherSummary]:
+    """Get weather summary for a specific resort from all SNOTEL stations with weighted averages"""
+    return (await get_resort_weather_batch([resort_name], days, resolution, max_points))[0]
+
+
+@cached(WEATHER_DATA)
+async def get_all_resort_weather(
+    days: int = 7,
+    resolution: int = 1,
+    max_points: Optional[int] = None,
+) -> List[ResortWeatherSummary]:
+    """Get weather summaries for all resorts"""
+    resort_names = await _fetch_column(WEATHER_RESORT_NAMES_SQL, 'resort_name')
+    return [weather for weather in await get_resort_weather_batch(resort_names, days, resolution, max_points) if weather]
+
+
+@cached_batch(WEATHER_DATA)
+async def get_resort_forecast_batch(resort_names: List[str], days: int = 7) -> List[Optional[ResortForecast]]:
+    """Get forecasts for several resorts in a single query"""
+    normalized_names = [normalize_resort_name(name) for name in resort_names]
+    if not normalized_names:
+        return []
+
+    async with get_async_cursor() as cursor:
+        await cursor.execute(FORECAST_SQL, (normalized_names, days))
+        forecast_rows = await cursor.fetchall()
+
+    return build_resort_forecasts(normalized_names, forecast_rows)
+
+
+async def get_resort_forecast(resort_name: str, days: int = 7) -> Optional[ResortForecast]:
+    """Get weather forecast for a specific resort from multiple sources"""
+    return (await get_resort_forecast_batch([resort_name], days))[0]
+
+
+@cached(WEATHER_DATA)
+async def get_all_resort_forecasts(days: int = 7) -> List[ResortForecast]:
+    """Get weather forecasts for all resorts"""
+    resort_names = await _fetch_column(FORECAST_RESORT_NAMES_SQL, 'resort_name')
+    return [forecast for forecast in await get_resort_forecast_batch(resort_names, days) if forecast]
+
+
+def _batch_by_args(batch_fn):
+    """Adapt a (names, *args) batch function to DataLoader keys of (name, *args)"""
+    async def load(keys: List[Tuple]) -> list:
+        names_by_args: Dict[Tuple, List[str]] = defaultdict(list)
+        for name, *args in keys:
+            names_by_args[tuple(args)].append(name)
+
+        results = {}
+        for args, names in names_by_args.items():
+            for name, value in zip(names, await batch_fn(names, *args)):
+                results[(name, *args)] = value
+        return [results[key] for key in keys]
+
+    return load
+
+
+def create_loaders() -> Dict[str, DataLoader]:
+    """Build a fresh set of DataLoaders (one set per GraphQL request)"""
+    return {
+        "resort": DataLoader(load_fn=get_resorts_by_locations),
+        "resort_weather": DataLoader(load_fn=_batch_by_args(get_resort_weather_batch)),
+        "resort_forecast": DataLoader(load_fn=_batch_by_args(get_resort_forecast_batch)),
+    }
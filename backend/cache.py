@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+"""In-process TTL/LRU cache for resolver results, invalidated by data version
+
+Scrapers and weather jobs write a few times a day, so most GraphQL requests
+can be answered from memory. Entries are keyed on the resolver, its
+arguments and the SKI_DATA.data_versions counters of the schemas it reads;
+a write bumps the counter, so the next lookup misses and recomputes. The
+TTL still bounds staleness for queries that depend on the current date.
+"""
+
+import asyncio
+import functools
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Tuple
+
+from .db import get_db_cursor
+
+
+RESOLVER_CACHE_ENABLED = os.getenv("RESOLVER_CACHE_ENABLED", "true").lower() in ("1", "true", "yes")
+RESOLVER_CACHE_TTL = float(os.getenv("RESOLVER_CACHE_TTL", "300"))
+RESOLVER_CACHE_MAX_ENTRIES = int(os.getenv("RESOLVER_CACHE_MAX_ENTRIES", "512"))
+# How long a fetched data version is trusted before asking Postgres again
+DATA_VERSION_CHECK_INTERVAL = float(os.getenv("DATA_VERSION_CHECK_INTERVAL", "5"))
+
+SKI_DATA = "SKI_DATA"
+WEATHER_DATA = "WEATHER_DATA"
+
+DATA_VERSIONS_SQL = "SELECT schema_name, version FROM SKI_DATA.data_versions"
+
+_MISSING = object()
+
+
+class TTLCache:
+    """Thread-safe LRU cache whose entries also expire after `ttl` seconds"""
+
+    def __init__(self, max_entries: int = RESOLVER_CACHE_MAX_ENTRIES, ttl: float = RESOLVER_CACHE_TTL):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable) -> Any:
+        """Return the cached value, or _MISSING if absent or expired"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] < time.monotonic():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return _MISSING
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key: Hashable, value: Any):
+        """Store a value, evicting the least recently used entry when full"""
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        """Drop every entry (counters are kept)"""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and occupancy"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "enabled": RESOLVER_CACHE_ENABLED,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else None,
+            }
+
+
+class DataVersions:
+    """Briefly cached copy of SKI_DATA.data_versions"""
+
+    def __init__(self, check_interval: float = DATA_VERSION_CHECK_INTERVAL):
+        self.check_interval = check_interval
+        self._versions: Dict[str, int] = {}
+        self._fetched_at = float("-inf")
+        self._lock = threading.Lock()
+
+    def _is_fresh(self) -> bool:
+        return time.monotonic() - self._fetched_at < self.check_interval
+
+    def _store(self, rows: Optional[list]):
+        with self._lock:
+            # On failure keep the previous versions; entries then rely on TTL alone
+            if rows is not None:
+                self._versions = {row['schema_name']: row['version'] for row in rows}
+            self._fetched_at = time.monotonic()
+
+    def get(self) -> Dict[str, int]:
+        """Current versions, querying Postgres at most once per check interval"""
+        if not self._is_fresh():
+            try:
+                with get_db_cursor() as cursor:
+                    cursor.execute(DATA_VERSIONS_SQL)
+                    rows = cursor.fetchall()
+            except Exception as e:
+                print(f"⚠️  Could not read data versions: {e}")
+                rows = None
+            self._store(rows)
+        return self._versions
+
+    async def get_async(self) -> Dict[str, int]:
+        """Async variant of get() using the async pool"""
+        if not self._is_fresh():
+            from .async_db import get_async_cursor
+            try:
+                async with get_async_cursor() as cursor:
+                    await cursor.execute(DATA_VERSIONS_SQL)
+                    rows = await cursor.fetchall()
+            except Exception as e:
+                print(f"⚠️  Could not read data versions: {e}")
+                rows = None
+            self._store(rows)
+        return self._versions
+
+
+resolver_cache = TTLCache()
+data_versions = DataVersions()
+
+
+def _freeze(value) -> Hashable:
+    """Make list arguments usable in a cache key"""
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def _make_key(fn: Callable, schemas: Tuple[str, ...], versions: Dict[str, int], args: Iterable, kwargs: dict) -> Hashable:
+    # Keyed by name (not module) so the sync and async resolvers share entries
+    return (
+        fn.__name__,
+        tuple(versions.get(schema) for schema in schemas),
+        _freeze(args),
+        tuple(sorted(kwargs.items())),
+    )
+
+
+def cached(*schemas: str):
+    """Cache a resolver's result until its schemas' data version changes or the TTL expires"""
+    def decorator(fn):
+        if asyncio.iscoroutinefunction(fn):
+            @functools.wraps(fn)
+            async def async_wrapper(*args, **kwargs):
+                if not RESOLVER_CACHE_ENABLED:
+                    return await fn(*args, **kwargs)
+                key = _make_key(fn, schemas, await data_versions.get_async(), args, kwargs)
+                value = resolver_cache.get(key)
+                if value is _MISSING:
+                    value = await fn(*args, **kwargs)
+                    resolver_cache.set(key, value)
+                return value
+            return async_wrapper
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not RESOLVER_CACHE_ENABLED:
+                return fn(*args, **kwargs)
+            key = _make_key(fn, schemas, data_versions.get(), args, kwargs)
+            value = resolver_cache.get(key)
+            if value is _MISSING:
+                value = fn(*args, **kwargs)
+                resolver_cache.set(key, value)
+            return value
+        return wrapper
+
+    return decorator
+
+
+def cached_batch(*schemas: str):
+    """Like cached(), for batch resolvers taking a list of keys first.
+
+    Each key is cached on its own, so a batch only fetches the keys that
+    missed and later batches reuse entries regardless of how keys are grouped.
+    """
+    def decorator(fn):
+        def split(versions, keys, args, kwargs) -> Tuple[List[Hashable], Dict[int, Any], List[int]]:
+            cache_keys = [_make_key(fn, schemas, versions, (key,) + tuple(args), kwargs) for key in keys]
+            found = {}
+            missing = []
+            for i, cache_key in enumerate(cache_keys):
+                value = resolver_cache.get(cache_key)
+                if value is _MISSING:
+                    missing.append(i)
+                else:
+                    found[i] = value
+            return cache_keys, found, missing
+
+        def merge(keys, cache_keys, found, missing, fetched) -> list:
+            for i, value in zip(missing, fetched):
+                resolver_cache.set(cache_keys[i], value)
+                found[i] = value
+            return [found[i] for i in range(len(keys))]
+
+        if asyncio.iscoroutinefunction(fn):
+            @functools.wraps(fn)
+            async def async_wrapper(keys, *args, **kwargs):
+                if not RESOLVER_CACHE_ENABLED or not keys:
+                    return await fn(keys, *args, **kwargs)
+                cache_keys, found, missing = split(await data_versions.get_async(), keys, args, kwargs)
+                fetched = await fn([keys[i] for i in missing], *args, **kwargs) if missing else []
+                return merge(keys, cache_keys, found, missing, fetched)
+            return async_wrapper
+
+        @functools.wraps(fn)
+        def wrapper(keys, *args, **kwargs):
+            if not RESOLVER_CACHE_ENABLED or not keys:
+                return fn(keys, *args, **kwargs)
+            cache_keys, found, missing = split(data_versions.get(), keys, args, kwargs)
+            fetched = fn([keys[i] for i in missing], *args, **kwargs) if missing else []
+            return merge(keys, cache_keys, found, missing, fetched)
+        return wrapper
+
+    return decorator
+
+
+def cache_stats() -> Dict[str, Any]:
+    """Counters for the /cache/stats endpoint"""
+    stats = resolver_cache.stats()
+    stats["data_versions"] = dict(data_versions._versions)
+    return stats
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""Process-wide PostgreSQL connection pool shared by all GraphQL resolvers"""
+
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Optional
+
+import psycopg2
+import psycopg2.extras
+from psycopg2 import pool as pg_pool
+
+
+# Database URL from environment variable
+DATABASE_URL = os.getenv("DATABASE_URL")
+
+# Pool configuration (override via environment)
+DB_POOL_MIN_SIZE = int(os.getenv("DB_POOL_MIN_SIZE", "2"))
+DB_POOL_MAX_SIZE = int(os.getenv("DB_POOL_MAX_SIZE", "10"))
+# Seconds to wait for a free connection before giving up
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+# Connections idle longer than this are pinged with SELECT 1 before being handed out
+DB_POOL_HEALTHCHECK_INTERVAL = float(os.getenv("DB_POOL_HEALTHCHECK_INTERVAL", "30"))
+
+
+class ConnectionPool:
+    """Thread-safe connection pool that blocks when exhausted and health-checks idle connections.
+
+    psycopg2's ThreadedConnectionPool raises immediately once maxconn connections are
+    checked out, so a bounded semaphore is used to make callers wait instead. Connections
+    are handed out in autocommit mode since the backend only reads, which avoids a
+    BEGIN/ROLLBACK round trip per checkout.
+    """
+
+    def __init__(
+        self,
+        dsn: str,
+        min_size: int = DB_POOL_MIN_SIZE,
+        max_size: int = DB_POOL_MAX_SIZE,
+        timeout: float = DB_POOL_TIMEOUT,
+        healthcheck_interval: float = DB_POOL_HEALTHCHECK_INTERVAL,
+    ):
+        self.min_size = min_size
+        self.max_size = max_size
+        self.timeout = timeout
+        self.healthcheck_interval = healthcheck_interval
+        self._pool = pg_pool.ThreadedConnectionPool(min_size, max_size, dsn)
+        self._slots = threading.BoundedSemaphore(max_size)
+        self._last_used: Dict[int, float] = {}
+        self._lock = threading.Lock()
+
+    def _is_healthy(self, conn) -> bool:
+        """Check a connection is still usable, pinging it if it has been idle a while"""
+        if conn.closed:
+            return False
+
+        try:
+            # Autocommit first, so a ping on a fresh connection doesn't leave a transaction open
+            if not conn.autocommit:
+                conn.autocommit = True
+        except psycopg2.Error:
+            return False
+
+        with self._lock:
+            last_used = self._last_used.get(id(conn))
+        if last_used is not None and time.monotonic() - last_used < self.healthcheck_interval:
+            return True
+
+        try:
+            with conn.cursor() as cursor:
+                cursor.execute("SELECT 1")
+            return True
+        except psycopg2.Error:
+            return False
+
+    def getconn(self):
+        """Check out a healthy connection, waiting up to `timeout` seconds for one to free up"""
+        if not self._slots.acquire(timeout=self.timeout):
+            raise pg_pool.PoolError(
+                f"Timed out after {self.timeout}s waiting for a database connection"
+            )
+
+        try:
+            # After a server restart or idle timeout every idle connection may be
+            # dead: keep discarding them until one answers or the pool, once
+            # drained, opens a fresh one
+            for _ in range(self.max_size + 1):
+                conn = self._pool.getconn()
+                if self._is_healthy(conn):
+                    return conn
+                self._discard(conn)
+            raise pg_pool.PoolError("Could not get a healthy database connection")
+        except Exception:
+            self._slots.release()
+            raise
+
+    def putconn(self, conn):
+        """Return a connection to the pool (broken connections are dropped)"""
+        try:
+            if conn.closed:
+                self._discard(conn)
+            else:
+                with self._lock:
+                    self._last_used[id(conn)] = time.monotonic()
+                self._pool.putconn(conn)
+        finally:
+            self._slots.release()
+
+    def _discard(self, conn):
+        """Close a connection and remove it from the pool so a fresh one can be opened"""
+        with self._lock:
+            self._last_used.pop(id(conn), None)
+        self._pool.putconn(conn, close=True)
+
+    def closeall(self):
+        """Close every connection held by the pool"""
+        self._pool.closeall()
+
+
+_pool: Optional[ConnectionPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_pool() -> ConnectionPool:
+    """Return the process-wide pool, creating it on first use"""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = ConnectionPool(DATABASE_URL)
+    return _pool
+
+
+def close_pool():
+    """Close the process-wide pool (called on server shutdown)"""
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.closeall()
+            _pool = None
+
+
+@contextmanager
+def get_db_connection():
+    """Borrow a pooled database connection for the duration of the block"""
+    pool = get_pool()
+    conn = pool.getconn()
+    try:
+        yield conn
+    finally:
+        pool.putconn(conn)
+
+
+@contextmanager
+def get_db_cursor():
+    """Borrow a pooled connection and yield a RealDictCursor on it"""
+    with get_db_connection() as conn:
+        cursor = conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor)
+        try:
+            yield cursor
+        finally:
+            cursor.close()
@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""HTTP caching for GraphQL GET requests (ETag / 304 / Cache-Control + persisted queries)
+
+Queries sent over GET (including Apollo automatic persisted queries, which
+send only a sha256 hash of the query) get a strong ETag derived from the
+SKI_DATA.data_versions counters, the current Mountain-time date and the
+request itself. A matching If-None-Match is answered with 304 before any
+resolver runs, and a configurable Cache-Control lets nginx and browsers
+serve repeat reads. POST requests pass through untouched.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from typing import Dict, Optional
+from urllib.parse import parse_qsl, urlencode
+
+import pytz
+from starlette.concurrency import run_in_threadpool
+
+from .cache import data_versions
+
+
+GRAPHQL_CACHE_CONTROL = os.getenv(
+    "GRAPHQL_CACHE_CONTROL", "public, max-age=60, stale-while-revalidate=300"
+)
+PERSISTED_QUERY_MAX_ENTRIES = int(os.getenv("PERSISTED_QUERY_MAX_ENTRIES", "1000"))
+
+MOUNTAIN_TZ = pytz.timezone("America/Denver")
+
+
+class PersistedQueryStore:
+    """Bounded LRU map of sha256 hash -> query text (Apollo APQ)"""
+
+    def __init__(self, max_entries: int = PERSISTED_QUERY_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._queries: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, sha256_hash: str) -> Optional[str]:
+        with self._lock:
+            query = self._queries.get(sha256_hash)
+            if query is not None:
+                self._queries.move_to_end(sha256_hash)
+            return query
+
+    def add(self, sha256_hash: str, query: str):
+        with self._lock:
+            self._queries[sha256_hash] = query
+            self._queries.move_to_end(sha256_hash)
+            while len(self._queries) > self.max_entries:
+                self._queries.popitem(last=False)
+
+
+persisted_queries = PersistedQueryStore()
+
+
+def _persisted_query_hash(params: Dict[str, str]) -> Optional[str]:
+    """Extract extensions.persistedQuery.sha256Hash from GET params, if present"""
+    try:
+        extensions = json.loads(params.get("extensions") or "{}")
+        return extensions.get("persistedQuery", {}).get("sha256Hash")
+    except (ValueError, AttributeError):
+        return None
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Check an If-None-Match header value against our ETag"""
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in candidates or etag in candidates
+
+
+def compute_etag(versions: Dict[str, int], params: Dict[str, str]) -> str:
+    """Strong ETag for a GET query: data versions + today's date + the request itself"""
+    today = datetime.now(MOUNTAIN_TZ).strftime("%Y-%m-%d")
+    material = json.dumps(
+        [
+            sorted(versions.items()),
+            today,
+            params.get("query"),
+            params.get("variables"),
+            params.get("operationName"),
+        ],
+        sort_keys=True,
+    )
+    return '"' + hashlib.sha256(material.encode("utf-8")).hexdigest()[:32] + '"'
+
+
+async def _send_json(send, status: int, body: dict, headers: list):
+    payload = json.dumps(body).encode("utf-8")
+    await send({
+        "type": "http.response.start",
+        "status": status,
+        "headers": [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(payload)).encode()),
+            *headers,
+        ],
+    })
+    await send({"type": "http.response.body", "body": payload})
+
+
+class GraphQLHTTPCacheMiddleware:
+    """ASGI middleware adding persisted-query resolution and ETag caching to GET /graphql"""
+
+    def __init__(self, app, path: str = "/graphql", use_async: bool = True, cache_control: str = GRAPHQL_CACHE_CONTROL):
+        self.app = app
+        self.path = path.rstrip("/")
+        self.use_async = use_async
+        self.cache_control = cache_control.encode()
+
+    async def _get_versions(self) -> Dict[str, int]:
+        if self.use_async:
+            return await data_versions.get_async()
+        return await run_in_threadpool(data_versions.get)
+
+    async def __call__(self, scope, receive, send):
+        if (
+            scope["type"] != "http"
+            or scope["method"] not in ("GET", "HEAD")
+            or scope["path"].rstrip("/") != self.path
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        params = dict(parse_qsl(scope.get("query_string", b"").decode("latin-1"), keep_blank_values=True))
+        sha256_hash = _persisted_query_hash(params)
+
+        if sha256_hash:
+            query = params.get("query")
+            if query:
+                if hashlib.sha256(query.encode("utf-8")).hexdigest() != sha256_hash:
+                    await _send_json(send, 400, {"errors": [{"message": "provided sha does not match query"}]}, [])
+                    return
+                persisted_queries.add(sha256_hash, query)
+            else:
+                query = persisted_queries.get(sha256_hash)
+                if query is None:
+                    # Apollo retries with the full query text when it sees this code
+                    await _send_json(send, 200, {
+                        "errors": [{
+                            "message": "PersistedQueryNotFound",
+                            "extensions": {"code": "PERSISTED_QUERY_NOT_FOUND"},
+                        }]
+                    }, [(b"cache-control", b"no-store")])
+                    return
+                params["query"] = query
+                scope = dict(scope, query_string=urlencode(params).encode("latin-1"))
+
+        # GET without a query is the GraphiQL page; nothing to cache
+        if not params.get("query"):
+            await self.app(scope, receive, send)
+            return
+
+        versions = await self._get_versions()
+        etag = compute_etag(versions, params).encode() if versions else None
+
+        if etag:
+            request_headers = dict(scope["headers"])
+            if_none_match = request_headers.get(b"if-none-match")
+            if if_none_match and _etag_matches(if_none_match.decode("latin-1"), etag.decode()):
+                await send({
+                    "type": "http.response.start",
+                    "status": 304,
+                    "headers": [(b"etag", etag), (b"cache-control", self.cache_control)],
+                })
+                await send({"type": "http.response.body", "body": b""})
+                return
+
+        # Buffer the (small, JSON) response so errors can be kept out of shared caches
+        start_message = None
+        body_chunks = []
+
+        async def buffered_send(message):
+            nonlocal start_message
+            if message["type"] == "http.response.start":
+                start_message = message
+                return
+            if message["type"] == "http.response.body":
+                body_chunks.append(message.get("body", b""))
+                if message.get("more_body"):
+                    return
+                body = b"".join(body_chunks)
+                headers = [
+                    (name, value) for name, value in start_message.get("headers", [])
+                    if name.lower() not in (b"cache-control", b"etag")
+                ]
+                if start_message["status"] == 200 and b'"errors"' not in body:
+                    if etag:
+                        headers.append((b"etag", etag))
+                    headers.append((b"cache-control", self.cache_control))
+                else:
+                    headers.append((b"cache-control", b"no-store"))
+                await send(dict(start_message, headers=headers))
+                await send({"type": "http.response.body", "body": body})
+                return
+            await send(message)
+
+        await self.app(scope, receive, buffered_send)
@@ -1,12 +1,21 @@
 #!/usr/bin/env python3
-"""GraphQL resolvers for querying ski resort data"""
+"""GraphQL resolvers for querying ski resort data
 
-import psycopg2
-import psycopg2.extras
-import os
-from typing import List, Optional
+SQL statements and the row-to-type builders live at module level so the async
+resolvers in async_resolvers.py can share them; only the code that talks to
+the database differs between the two paths.
+"""
+
+from collections import defaultdict
+from typing import Dict, List, Optional
+from .cache import cached, cached_batch, SKI_DATA, WEATHER_DATA
+from .db import get_db_cursor
+from .weather_aggregation import (
+    station_weights, pivot, weighted_means, to_rounded_lists,
+    column, half_change, nan_mean, nan_sum, last_valid, lttb_indices,
+)
 from .schema import (
-    ResortSummary, ResortHomeSummary, Lift, Run, RunsByDifficulty, HistoryDataPoint, 
+    ResortSummary, ResortHomeSummary, Lift, Run, RunsByDifficulty, HistoryDataPoint,
     RecentlyOpened, GlobalRecentlyOpened, RecentlyOpenedWithLocation,
     WeatherDataPoint, DailyWeatherSummary, WeatherTrend, ResortWeatherSummary,
     StationInfo, StationDailyData, ForecastDataPoint, ResortForecast,
@@ -14,67 +23,359 @@ from .schema import (
 )
 
 
-# Database URL from environment variable
-DATABASE_URL = os.getenv("DATABASE_URL")
+# Normalize resort name for case-insensitive matching
+RESORT_NAME_MAP = {
+    'arapahoe basin': 'Arapahoe Basin',
+    'a-basin': 'Arapahoe Basin',
+    'copper': 'Copper',
+    'copper mountain': 'Copper',
+    'loveland': 'Loveland',
+    'breckenridge': 'Breckenridge',
+    'breck': 'Breckenridge',
+    'winter park': 'Winter Park',
+    'keystone': 'Keystone',
+    'vail': 'Vail',
+    'crested butte': 'Crested Butte',
+    'steamboat': 'Steamboat',
+    'purgatory': 'Purgatory',
+    'telluride': 'Telluride',
+}
 
+# Daily SNOTEL aggregates weighted across stations (WEATHER_DAILY_SQL columns)
+DAILY_WEATHER_FIELDS = (
+    'snow_depth_avg_in',
+    'snow_depth_max_in',
+    'temp_min_f',
+    'temp_max_f',
+    'precip_total_in',
+    'wind_speed_avg_mph',
+    'wind_direction_avg_deg',
+)
+# Rounding per field index (default 1 decimal); wind direction is whole degrees
+DAILY_WEATHER_DECIMALS = {4: 2, 6: 0}
 
-def get_db_connection():
-    """Create and return a database connection"""
-    conn = psycopg2.connect(DATABASE_URL)
-    return conn
 
+# ---------------------------------------------------------------------------
+# SQL
+# ---------------------------------------------------------------------------
 
-def get_all_resorts() -> List[ResortSummary]:
-    """Get summary data for all ski resorts"""
-    conn = get_db_connection()
-    cursor = conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor)
-    
-    # Get all unique locations
-    cursor.execute("SELECT DISTINCT location FROM SKI_DATA.v_locations ORDER BY location")
-    locations = [row['location'] for row in cursor.fetchall()]
-    
-    resorts = []
-    for location in locations:
-        resort = get_resort_by_location(location)
-        if resort:
-            resorts.append(resort)
-    
-    conn.close()
-    return resorts
+LOCATIONS_SQL = "SELECT DISTINCT location FROM SKI_DATA.v_locations ORDER BY location"
 
+RESORTS_HOME_SQL = """
+    SELECT
+        location,
+        total_lifts,
+        open_lifts,
+        closed_lifts,
+        total_runs,
+        open_runs,
+        closed_runs,
+        green_runs,
+        blue_runs,
+        black_runs,
+        double_black_runs,
+        terrain_park_runs,
+        other_runs,
+        to_char(last_updated, 'YYYY-MM-DD') as last_updated,
+        lifts_history,
+        runs_history,
+        recently_opened_lifts,
+        recently_opened_runs
+    FROM SKI_DATA.v_resort_summary
+    ORDER BY location
+"""
 
-def get_all_resorts_home() -> List[ResortHomeSummary]:
-    """Get pre-aggregated summary data for home page using v_resort_summary view"""
-    conn = get_db_connection()
-    cursor = conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor)
-    
-    cursor.execute("""
-        SELECT 
+# The per-resort queries below are set-based: they take a list of locations
+# (or resort names) and return rows tagged with it, so the "all resorts"
+# resolvers cost a constant number of round trips however many resorts exist.
+
+# Current lifts with date opened
+RESORT_LIFTS_SQL = """
+    SELECT
+        v.location,
+        v.lift_name,
+        v.lift_type,
+        v.lift_status,
+        to_char(v.updated_date, 'YYYY-MM-DD') as updated_date,
+        to_char(fo.first_opened_date, 'YYYY-MM-DD') as date_opened
+    FROM SKI_DATA.v_lifts_current v
+    LEFT JOIN SKI_DATA.v_first_opened_latest fo
+        ON fo.item_type = 'lift' AND fo.location = v.location AND fo.item_name = v.lift_name
+    WHERE v.location = ANY(%s)
+    ORDER BY v.location, v.lift_name
+"""
+
+# Current runs with date opened
+RESORT_RUNS_SQL = """
+    SELECT
+        v.location,
+        v.run_name,
+        v.run_difficulty,
+        v.run_status,
+        v.run_area,
+        v.run_groomed,
+        to_char(v.updated_date, 'YYYY-MM-DD') as updated_date,
+        to_char(fo.first_opened_date, 'YYYY-MM-DD') as date_opened
+    FROM SKI_DATA.v_runs_current v
+    LEFT JOIN SKI_DATA.v_first_opened_latest fo
+        ON fo.item_type = 'run' AND fo.location = v.location AND fo.item_name = v.run_name
+    WHERE v.location = ANY(%s)
+    ORDER BY v.location, v.run_name
+"""
+
+# Lifts history (last 7 days per location)
+RESORT_LIFTS_HISTORY_SQL = """
+    SELECT location, date, open_count
+    FROM (
+        SELECT
             location,
-            total_lifts,
-            open_lifts,
-            closed_lifts,
-            total_runs,
-            open_runs,
-            closed_runs,
-            green_runs,
-            blue_runs,
-            black_runs,
-            double_black_runs,
-            terrain_park_runs,
-            other_runs,
-            last_updated,
-            lifts_history,
-            runs_history,
-            recently_opened_lifts,
-            recently_opened_runs
-        FROM SKI_DATA.v_resort_summary
-        ORDER BY location
-    """)
-    
-    rows = cursor.fetchall()
-    conn.close()
-    
+            to_char(updated_date, 'YYYY-MM-DD') as date,
+            open_count,
+            ROW_NUMBER() OVER (PARTITION BY location ORDER BY updated_date DESC) as rn
+        FROM SKI_DATA.v_lifts_history
+        WHERE location = ANY(%s)
+    ) h
+    WHERE rn <= 7
+    ORDER BY location, date DESC
+"""
+
+# Runs history (last 7 days per location)
+RESORT_RUNS_HISTORY_SQL = """
+    SELECT location, date, open_count
+    FROM (
+        SELECT
+            location,
+            to_char(updated_date, 'YYYY-MM-DD') as date,
+            open_count,
+            ROW_NUMBER() OVER (PARTITION BY location ORDER BY updated_date DESC) as rn
+        FROM SKI_DATA.v_runs_history
+        WHERE location = ANY(%s)
+    ) h
+    WHERE rn <= 7
+    ORDER BY location, date DESC
+"""
+
+# Recently opened lifts (top 3 per location)
+RESORT_RECENT_LIFTS_SQL = """
+    SELECT location, lift_name, date_opened
+    FROM (
+        SELECT
+            location,
+            item_name as lift_name,
+            to_char(first_opened_date, 'YYYY-MM-DD') as date_opened,
+            ROW_NUMBER() OVER (PARTITION BY location ORDER BY first_opened_date DESC) as rn
+        FROM SKI_DATA.v_first_opened_latest
+        WHERE item_type = 'lift' AND location = ANY(%s)
+    ) r
+    WHERE rn <= 3
+    ORDER BY location, date_opened DESC
+"""
+
+# Recently opened runs (top 3 per location)
+RESORT_RECENT_RUNS_SQL = """
+    SELECT location, run_name, date_opened
+    FROM (
+        SELECT
+            location,
+            item_name as run_name,
+            to_char(first_opened_date, 'YYYY-MM-DD') as date_opened,
+            ROW_NUMBER() OVER (PARTITION BY location ORDER BY first_opened_date DESC) as rn
+        FROM SKI_DATA.v_first_opened_latest
+        WHERE item_type = 'run' AND location = ANY(%s)
+    ) r
+    WHERE rn <= 3
+    ORDER BY location, date_opened DESC
+"""
+
+# Queries run (in order, each with a list of locations) for the resort detail view
+RESORT_DETAIL_SQL = (
+    RESORT_LIFTS_SQL,
+    RESORT_RUNS_SQL,
+    RESORT_LIFTS_HISTORY_SQL,
+    RESORT_RUNS_HISTORY_SQL,
+    RESORT_RECENT_LIFTS_SQL,
+    RESORT_RECENT_RUNS_SQL,
+)
+
+# Recently opened lifts across all locations with lift category from mapping table
+GLOBAL_RECENT_LIFTS_SQL = """
+    SELECT
+        fo.item_name as lift_name,
+        fo.location,
+        to_char(fo.first_opened_date, 'YYYY-MM-DD') as date_opened,
+        v.lift_type,
+        COALESCE(m.lift_category, 'Unknown') as lift_category,
+        m.lift_size
+    FROM SKI_DATA.v_first_opened_latest fo
+    LEFT JOIN SKI_DATA.v_lifts_current v
+        ON fo.location = v.location AND fo.item_name = v.lift_name
+    LEFT JOIN SKI_DATA.ref__lift_mapping m
+        ON v.lift_type = m.lift_type
+    WHERE fo.item_type = 'lift'
+    ORDER BY date_opened DESC
+"""
+
+# Recently opened runs across all locations
+GLOBAL_RECENT_RUNS_SQL = """
+    SELECT item_name as run_name, location, to_char(first_opened_date, 'YYYY-MM-DD') as date_opened
+    FROM SKI_DATA.v_first_opened_latest
+    WHERE item_type = 'run'
+    ORDER BY date_opened DESC
+"""
+
+# Closest SNOTEL stations for each resort (up to 3)
+WEATHER_STATIONS_SQL = """
+    SELECT resort_name, station_triplet, distance_miles, station_name
+    FROM WEATHER_DATA.v_resort_station_weights
+    WHERE resort_name = ANY(%s)
+    ORDER BY resort_name, distance_miles ASC
+"""
+
+# Daily aggregates per station
+WEATHER_DAILY_SQL = """
+    SELECT
+        station_triplet,
+        observation_date::text as date,
+        AVG(snow_depth_in) as snow_depth_avg_in,
+        MAX(snow_depth_in) as snow_depth_max_in,
+        MIN(temp_observed_f) as temp_min_f,
+        MAX(temp_observed_f) as temp_max_f,
+        MAX(precip_accum_in) - MIN(precip_accum_in) as precip_total_in,
+        AVG(wind_speed_avg_mph) as wind_speed_avg_mph,
+        AVG(wind_direction_avg_deg) as wind_direction_avg_deg
+    FROM WEATHER_DATA.snotel_observations
+    WHERE station_triplet = ANY(%s)
+      AND observation_date >= (CURRENT_TIMESTAMP AT TIME ZONE 'America/Denver')::date - make_interval(days => %s)
+    GROUP BY station_triplet, observation_date
+    ORDER BY observation_date ASC, station_triplet ASC
+"""
+
+# Hourly observations, already inverse-distance weighted per resort in SQL
+WEATHER_HOURLY_SQL = """
+    SELECT
+        resort_name,
+        observation_date::text as date,
+        observation_hour as hour,
+        snow_depth_in,
+        snow_water_equivalent_in,
+        temp_observed_f,
+        precip_accum_in,
+        wind_speed_avg_mph,
+        wind_speed_max_mph
+    FROM WEATHER_DATA.v_resort_weather_hourly
+    WHERE resort_name = ANY(%s)
+      AND observation_date >= (CURRENT_TIMESTAMP AT TIME ZONE 'America/Denver')::date - make_interval(days => %s)
+    ORDER BY resort_name, observation_date ASC, observation_hour ASC
+"""
+
+# Same series averaged into fixed buckets of N hours (%s = bucket size, twice).
+# Hour is the start of the bucket; the daily bucket (24) reports hour 0.
+# Accumulated precip and peak wind keep their maxima, and the bucket's
+# temperature range is returned in temp_min_f / temp_max_f.
+WEATHER_HOURLY_BUCKETED_SQL = """
+    SELECT
+        resort_name,
+        observation_date::text as date,
+        (observation_hour / %s) * %s as hour,
+        ROUND(AVG(snow_depth_in), 1) as snow_depth_in,
+        ROUND(AVG(snow_water_equivalent_in), 1) as snow_water_equivalent_in,
+        ROUND(AVG(temp_observed_f), 1) as temp_observed_f,
+        MIN(temp_observed_f) as temp_min_f,
+        MAX(temp_observed_f) as temp_max_f,
+        MAX(precip_accum_in) as precip_accum_in,
+        ROUND(AVG(wind_speed_avg_mph), 1) as wind_speed_avg_mph,
+        MAX(wind_speed_max_mph) as wind_speed_max_mph
+    FROM WEATHER_DATA.v_resort_weather_hourly
+    WHERE resort_name = ANY(%s)
+      AND observation_date >= (CURRENT_TIMESTAMP AT TIME ZONE 'America/Denver')::date - make_interval(days => %s)
+    GROUP BY resort_name, observation_date, 3
+    ORDER BY resort_name, observation_date ASC, hour ASC
+"""
+
+
+def hourly_query(normalized_names: List[str], days: int, resolution: int = 1):
+    """SQL and params for the hourly series at `resolution` hours per point"""
+    if resolution <= 1:
+        return WEATHER_HOURLY_SQL, (normalized_names, days)
+    return WEATHER_HOURLY_BUCKETED_SQL, (resolution, resolution, normalized_names, days)
+
+
+# Daily aggregated historical weather from the view (much smaller response)
+WEATHER_HISTORICAL_SQL = """
+    SELECT
+        resort_name,
+        observation_date::text as date,
+        temp_min_f,
+        temp_max_f,
+        temp_avg_f,
+        precip_total_in,
+        snowfall_total_in
+    FROM WEATHER_DATA.historical_weather_daily
+    WHERE resort_name = ANY(%s)
+      AND observation_date >= (CURRENT_TIMESTAMP AT TIME ZONE 'America/Denver')::date - make_interval(days => %s)
+    ORDER BY resort_name, observation_date ASC
+"""
+
+WEATHER_RESORT_NAMES_SQL = """
+    SELECT DISTINCT resort_name
+    FROM WEATHER_DATA.resort_station_mapping
+    ORDER BY resort_name
+"""
+
+# Forecasts from all sources (use Mountain Time to include today's forecast)
+FORECAST_SQL = """
+    SELECT
+        resort_name,
+        source,
+        forecast_time::text as forecast_time,
+        valid_time::text as valid_time,
+        temp_high_f,
+        temp_low_f,
+        snow_amount_in,
+        precip_amount_in,
+        precip_prob_pct,
+        wind_speed_mph,
+        wind_direction_deg,
+        wind_gust_mph,
+        conditions_text,
+        icon_code
+    FROM WEATHER_DATA.weather_forecasts
+    WHERE resort_name = ANY(%s)
+      AND valid_time >= (CURRENT_TIMESTAMP AT TIME ZONE 'America/Denver')::date
+      AND valid_time <= (CURRENT_TIMESTAMP AT TIME ZONE 'America/Denver')::date + make_interval(days => %s)
+    ORDER BY resort_name, source, valid_time ASC
+"""
+
+# All unique resort names from forecasts (use Mountain Time to include today)
+FORECAST_RESORT_NAMES_SQL = """
+    SELECT DISTINCT resort_name
+    FROM WEATHER_DATA.weather_forecasts
+    WHERE valid_time >= (CURRENT_TIMESTAMP AT TIME ZONE 'America/Denver')::date
+    ORDER BY resort_name
+"""
+
+
+# ---------------------------------------------------------------------------
+# Row -> GraphQL type builders (shared by sync and async resolvers)
+# ---------------------------------------------------------------------------
+
+def normalize_resort_name(resort_name: str) -> str:
+    """Map user-supplied resort names onto the names stored in WEATHER_DATA"""
+    return RESORT_NAME_MAP.get(resort_name.lower(), resort_name)
+
+
+def _to_float(value) -> Optional[float]:
+    """Convert a Decimal/numeric column to float, preserving NULLs"""
+    return float(value) if value is not None else None
+
+
+def _to_int(value) -> Optional[int]:
+    """Convert a numeric column to int, preserving NULLs"""
+    return int(value) if value is not None else None
+
+
+def build_resort_home_summaries(rows: list) -> List[ResortHomeSummary]:
+    """Build home page summaries from v_resort_summary rows"""
     resorts = []
     for row in rows:
         # Parse JSON arrays from the view
@@ -94,7 +395,7 @@ def get_all_resorts_home() -> List[ResortHomeSummary]:
             RecentlyOpened(name=h['name'], date_opened=h['dateOpened'])
             for h in (row['recently_opened_runs'] or [])[:3]
         ]
-        
+
         resorts.append(ResortHomeSummary(
             location=row['location'],
             total_lifts=row['total_lifts'],
@@ -117,40 +418,27 @@ def get_all_resorts_home() -> List[ResortHomeSummary]:
             recently_opened_lifts=recently_opened_lifts,
             recently_opened_runs=recently_opened_runs
         ))
-    
+
     return resorts
 
 
-def get_resort_by_location(location: str) -> Optional[ResortSummary]:
-    """Get detailed data for a specific resort"""
-    conn = get_db_connection()
-    cursor = conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor)
-    
-    # Get current lifts for this location with date opened
-    cursor.execute("""
-        SELECT 
-            v.lift_name, 
-            v.lift_type, 
-            v.lift_status, 
-            v.updated_date,
-            (SELECT MIN(updated_date) 
-             FROM SKI_DATA.lifts 
-             WHERE location = v.location 
-             AND lift_name = v.lift_name 
-             AND lift_status = 'true') as date_opened
-        FROM SKI_DATA.v_lifts_current v
-        WHERE v.location = %s
-        ORDER BY v.lift_name
-    """, (location,))
-    
-    lifts_data = cursor.fetchall()
+def build_resort_summary(
+    location: str,
+    lifts_data: list,
+    runs_data: list,
+    lifts_history_data: list,
+    runs_history_data: list,
+    recently_opened_lifts_data: list,
+    recently_opened_runs_data: list,
+) -> Optional[ResortSummary]:
+    """Build a detailed resort summary from the RESORT_DETAIL_SQL results"""
     lifts = []
     open_lifts = 0
     closed_lifts = 0
     last_updated = ""
-    
+
     for row in lifts_data:
-        lift_status = "Open" if row['lift_status'] in ['Open', 'open', True, 1, '1', 'true', 'True'] else "Closed"
+        lift_status = "Open" if row['lift_status'] else "Closed"
         lifts.append(Lift(
             lift_name=row['lift_name'],
             lift_type=row['lift_type'] or "Unknown",
@@ -161,34 +449,14 @@ def get_resort_by_location(location: str) -> Optional[ResortSummary]:
             open_lifts += 1
         else:
             closed_lifts += 1
-        
+
         if row['updated_date'] and (not last_updated or row['updated_date'] > last_updated):
             last_updated = row['updated_date']
-    
-    # Get current runs for this location with date opened
-    cursor.execute("""
-        SELECT 
-            v.run_name, 
-            v.run_difficulty, 
-            v.run_status, 
-            v.run_area, 
-            v.run_groomed, 
-            v.updated_date,
-            (SELECT MIN(updated_date) 
-             FROM SKI_DATA.runs 
-             WHERE location = v.location 
-             AND run_name = v.run_name 
-             AND run_status = 'true') as date_opened
-        FROM SKI_DATA.v_runs_current v
-        WHERE v.location = %s
-        ORDER BY v.run_name
-    """, (location,))
-    
-    runs_data = cursor.fetchall()
+
     runs = []
     open_runs = 0
     closed_runs = 0
-    
+
     # Track runs by difficulty (open runs only)
     difficulty_counts = {
         'green': 0,
@@ -198,11 +466,11 @@ def get_resort_by_location(location: str) -> Optional[ResortSummary]:
         'terrain_park': 0,
         'other': 0
     }
-    
+
     for row in runs_data:
-        run_status = "Open" if row['run_status'] in ['Open', 'open', True, 1, '1', 'true', 'True'] else "Closed"
+        run_status = "Open" if row['run_status'] else "Closed"
         difficulty = (row['run_difficulty'] or "Unknown").lower().strip()
-        
+
         runs.append(Run(
             run_name=row['run_name'],
             run_difficulty=row['run_difficulty'] or "Unknown",
@@ -211,10 +479,10 @@ def get_resort_by_location(location: str) -> Optional[ResortSummary]:
             run_groomed=bool(row['run_groomed']),
             date_opened=row['date_opened'] if run_status == "Open" else None
         ))
-        
+
         if run_status == "Open":
             open_runs += 1
-            
+
             # Categorize by difficulty
             if 'green' in difficulty or 'easiest' in difficulty or 'beginner' in difficulty:
                 difficulty_counts['green'] += 1
@@ -230,78 +498,31 @@ def get_resort_by_location(location: str) -> Optional[ResortSummary]:
                 difficulty_counts['other'] += 1
         else:
             closed_runs += 1
-        
+
         if row['updated_date'] and (not last_updated or row['updated_date'] > last_updated):
             last_updated = row['updated_date']
-    
-    # Get lifts history (last 7 days)
-    cursor.execute("""
-        SELECT updated_date as date, open_count
-        FROM SKI_DATA.v_lifts_history
-        WHERE location = %s
-        ORDER BY updated_date DESC
-        LIMIT 7
-    """, (location,))
-    
-    lifts_history_data = cursor.fetchall()
+
+    # Return None if no data found for this location
+    if not lifts and not runs:
+        return None
+
     lifts_history = [
         HistoryDataPoint(date=row['date'], open_count=row['open_count'])
         for row in reversed(lifts_history_data)  # Reverse to show oldest to newest
     ]
-    
-    # Get runs history (last 7 days)
-    cursor.execute("""
-        SELECT updated_date as date, open_count
-        FROM SKI_DATA.v_runs_history
-        WHERE location = %s
-        ORDER BY updated_date DESC
-        LIMIT 7
-    """, (location,))
-    
-    runs_history_data = cursor.fetchall()
     runs_history = [
         HistoryDataPoint(date=row['date'], open_count=row['open_count'])
         for row in reversed(runs_history_data)  # Reverse to show oldest to newest
     ]
-    
-    # Get recently opened lifts (top 3)
-    cursor.execute("""
-        SELECT lift_name, MIN(updated_date) as date_opened
-        FROM SKI_DATA.lifts
-        WHERE location = %s AND lift_status = 'true'
-        GROUP BY lift_name
-        ORDER BY date_opened DESC
-        LIMIT 3
-    """, (location,))
-    
-    recently_opened_lifts_data = cursor.fetchall()
     recently_opened_lifts = [
         RecentlyOpened(name=row['lift_name'], date_opened=row['date_opened'])
         for row in recently_opened_lifts_data
     ]
-    
-    # Get recently opened runs (top 3)
-    cursor.execute("""
-        SELECT run_name, MIN(updated_date) as date_opened
-        FROM SKI_DATA.runs
-        WHERE location = %s AND run_status = 'true'
-        GROUP BY run_name
-        ORDER BY date_opened DESC
-        LIMIT 3
-    """, (location,))
-    
-    recently_opened_runs_data = cursor.fetchall()
     recently_opened_runs = [
         RecentlyOpened(name=row['run_name'], date_opened=row['date_opened'])
         for row in recently_opened_runs_data
     ]
-    
-    conn.close()
-    
-    # Return None if no data found for this location
-    if not lifts and not runs:
-        return None
-    
+
     return ResortSummary(
         location=location,
         total_lifts=len(lifts),
@@ -328,31 +549,8 @@ def get_resort_by_location(location: str) -> Optional[ResortSummary]:
     )
 
 
-def get_global_recently_opened() -> GlobalRecentlyOpened:
-    """Get recently opened lifts and runs across all resorts"""
-    conn = get_db_connection()
-    cursor = conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor)
-    
-    # Get recently opened lifts across all locations with lift category from mapping table
-    cursor.execute("""
-        SELECT 
-            l.lift_name, 
-            l.location, 
-            MIN(l.updated_date) as date_opened,
-            v.lift_type,
-            COALESCE(m.lift_category, 'Unknown') as lift_category,
-            m.lift_size
-        FROM SKI_DATA.lifts l
-        LEFT JOIN SKI_DATA.v_lifts_current v 
-            ON l.location = v.location AND l.lift_name = v.lift_name
-        LEFT JOIN SKI_DATA.ref__lift_mapping m 
-            ON v.lift_type = m.lift_type
-        WHERE l.lift_status = 'true'
-        GROUP BY l.location, l.lift_name, v.lift_type, m.lift_category, m.lift_size
-        ORDER BY date_opened DESC
-    """)
-    
-    lifts_data = cursor.fetchall()
+def build_global_recently_opened(lifts_data: list, runs_data: list) -> GlobalRecentlyOpened:
+    """Build the cross-resort recently opened lists"""
     lifts = [
         RecentlyOpenedWithLocation(
             name=row['lift_name'],
@@ -364,17 +562,6 @@ def get_global_recently_opened() -> GlobalRecentlyOpened:
         )
         for row in lifts_data
     ]
-    
-    # Get top 10 recently opened runs across all locations
-    cursor.execute("""
-        SELECT run_name, location, MIN(updated_date) as date_opened
-        FROM SKI_DATA.runs
-        WHERE run_status = 'true'
-        GROUP BY location, run_name
-        ORDER BY date_opened DESC
-    """)
-    
-    runs_data = cursor.fetchall()
     runs = [
         RecentlyOpenedWithLocation(
             name=row['run_name'],
@@ -383,55 +570,12 @@ def get_global_recently_opened() -> GlobalRecentlyOpened:
         )
         for row in runs_data
     ]
-    
-    conn.close()
-    
     return GlobalRecentlyOpened(lifts=lifts, runs=runs)
 
 
-def get_resort_weather(resort_name: str, days: int = 7) -> Optional[ResortWeatherSummary]:
-    """Get weather summary for a specific resort from all SNOTEL stations with weighted averages"""
-    conn = get_db_connection()
-    cursor = conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor)
-    
-    # Normalize resort name for case-insensitive matching
-    resort_name_map = {
-        'arapahoe basin': 'Arapahoe Basin',
-        'a-basin': 'Arapahoe Basin',
-        'copper': 'Copper',
-        'copper mountain': 'Copper',
-        'loveland': 'Loveland',
-        'breckenridge': 'Breckenridge',
-        'breck': 'Breckenridge',
-        'winter park': 'Winter Park',
-        'keystone': 'Keystone',
-        'vail': 'Vail',
-        'crested butte': 'Crested Butte',
-        'steamboat': 'Steamboat',
-    }
-    
-    normalized_name = resort_name_map.get(resort_name.lower(), resort_name)
-    
-    # Get ALL SNOTEL stations for this resort (up to 3)
-    cursor.execute("""
-        SELECT 
-            rsm.station_triplet, 
-            rsm.distance_miles,
-            ss.station_name
-        FROM WEATHER_DATA.resort_station_mapping rsm
-        JOIN WEATHER_DATA.snotel_stations ss ON rsm.station_triplet = ss.station_triplet
-        WHERE rsm.resort_name = %s
-        ORDER BY rsm.distance_miles ASC
-        LIMIT 3
-    """, (normalized_name,))
-    
-    station_rows = cursor.fetchall()
-    if not station_rows:
-        conn.close()
-        return None
-    
-    # Build station info list
-    stations = [
+def build_station_infos(station_rows: list) -> List[StationInfo]:
+    """Build station info list from resort_station_mapping rows"""
+    return [
         StationInfo(
             station_name=row['station_name'],
             station_triplet=row['station_triplet'],
@@ -439,203 +583,89 @@ def get_resort_weather(resort_name: str, days: int = 7) -> Optional[ResortWeathe
         )
         for row in station_rows
     ]
-    
-    # Calculate inverse distance weights (closer stations have more weight)
-    # Use inverse distance weighting: weight = 1 / distance
-    # Add small epsilon to avoid division by zero for very close stations
-    epsilon = 0.1
-    weights = {}
-    total_weight = 0
-    for station in stations:
-        weight = 1.0 / (station.distance_miles + epsilon)
-        weights[station.station_triplet] = weight
-        total_weight += weight
-    
-    # Normalize weights to sum to 1
-    for triplet in weights:
-        weights[triplet] /= total_weight
-    
-    # Get daily data for each station
-    station_triplets = [s.station_triplet for s in stations]
-    triplets_tuple = tuple(station_triplets)
-    
-    cursor.execute("""
-        SELECT 
-            station_triplet,
-            observation_date::text as date,
-            AVG(snow_depth_in) as snow_depth_avg_in,
-            MAX(snow_depth_in) as snow_depth_max_in,
-            MIN(temp_observed_f) as temp_min_f,
-            MAX(temp_observed_f) as temp_max_f,
-            MAX(precip_accum_in) - MIN(precip_accum_in) as precip_total_in,
-            AVG(wind_speed_avg_mph) as wind_speed_avg_mph,
-            AVG(wind_direction_avg_deg) as wind_direction_avg_deg
-        FROM WEATHER_DATA.snotel_observations
-        WHERE station_triplet IN %s
-          AND observation_date >= (CURRENT_TIMESTAMP AT TIME ZONE 'America/Denver')::date - INTERVAL '%s days'
-        GROUP BY station_triplet, observation_date
-        ORDER BY observation_date ASC, station_triplet ASC
-    """, (triplets_tuple, days))
-    
-    daily_rows = cursor.fetchall()
-    
-    # Organize data by date
-    daily_by_date = {}
-    for row in daily_rows:
-        date = row['date']
-        if date not in daily_by_date:
-            daily_by_date[date] = {}
-        daily_by_date[date][row['station_triplet']] = row
-    
-    # Build station lookup for names
-    station_lookup = {s.station_triplet: s for s in stations}
-    
-    # Calculate weighted averages for each day
+
+
+def build_resort_weather(
+    normalized_name: str,
+    stations: List[StationInfo],
+    daily_rows: list,
+    hourly_rows: list,
+    daily_weather_rows: list,
+    max_points: Optional[int] = None,
+) -> ResortWeatherSummary:
+    """Combine per-station daily SNOTEL rows into inverse-distance weighted series"""
+    triplets = [s.station_triplet for s in stations]
+    weights = station_weights([s.distance_miles for s in stations])
+
+    # One vectorized pass over the field x day x station cube
+    dates, cube = pivot(daily_rows, 'date', 'station_triplet', triplets, DAILY_WEATHER_FIELDS)
+    means = to_rounded_lists(weighted_means(cube, weights), DAILY_WEATHER_DECIMALS)
+    reported = {(row['date'], row['station_triplet']) for row in daily_rows}
+    snow_depth_by_station = cube[0].tolist()
+
     daily_data = []
-    for date in sorted(daily_by_date.keys()):
-        date_data = daily_by_date[date]
-        
-        # Build per-station data for this date
-        station_data = []
-        for station in stations:
-            triplet = station.station_triplet
-            if triplet in date_data:
-                row = date_data[triplet]
-                station_data.append(StationDailyData(
-                    station_name=station.station_name,
-                    station_triplet=triplet,
-                    distance_miles=station.distance_miles,
-                    snow_depth_avg_in=float(row['snow_depth_avg_in']) if row['snow_depth_avg_in'] is not None else None,
-                ))
-        
-        # Calculate weighted averages
-        def weighted_avg(values_with_triplets):
-            """Calculate weighted average from list of (value, triplet) tuples"""
-            total = 0.0
-            weight_sum = 0.0
-            for val, triplet in values_with_triplets:
-                if val is not None:
-                    # Convert Decimal to float for multiplication
-                    total += float(val) * weights[triplet]
-                    weight_sum += weights[triplet]
-            return total / weight_sum if weight_sum > 0 else None
-        
-        snow_depths = [(float(date_data[t]['snow_depth_avg_in']), t) for t in date_data if date_data[t]['snow_depth_avg_in'] is not None]
-        snow_maxes = [(float(date_data[t]['snow_depth_max_in']), t) for t in date_data if date_data[t]['snow_depth_max_in'] is not None]
-        temp_mins = [(float(date_data[t]['temp_min_f']), t) for t in date_data if date_data[t]['temp_min_f'] is not None]
-        temp_maxes = [(float(date_data[t]['temp_max_f']), t) for t in date_data if date_data[t]['temp_max_f'] is not None]
-        precips = [(float(date_data[t]['precip_total_in']), t) for t in date_data if date_data[t]['precip_total_in'] is not None]
-        wind_speeds = [(float(date_data[t]['wind_speed_avg_mph']), t) for t in date_data if date_data[t]['wind_speed_avg_mph'] is not None]
-        wind_dirs = [(float(date_data[t]['wind_direction_avg_deg']), t) for t in date_data if date_data[t]['wind_direction_avg_deg'] is not None]
-        
+    for t, date in enumerate(dates):
+        # Per-station data for this date
+        station_data = [
+            StationDailyData(
+                station_name=station.station_name,
+                station_triplet=station.station_triplet,
+                distance_miles=station.distance_miles,
+                snow_depth_avg_in=None if depth != depth else depth,
+            )
+            for station, depth in zip(stations, snow_depth_by_station[t])
+            if (date, station.station_triplet) in reported
+        ]
+
         daily_data.append(DailyWeatherSummary(
             date=date,
-            snow_depth_avg_in=round(weighted_avg(snow_depths), 1) if snow_depths else None,
-            snow_depth_max_in=round(weighted_avg(snow_maxes), 1) if snow_maxes else None,
-            temp_min_f=round(weighted_avg(temp_mins), 1) if temp_mins else None,
-            temp_max_f=round(weighted_avg(temp_maxes), 1) if temp_maxes else None,
-            precip_total_in=round(weighted_avg(precips), 2) if precips else None,
-            wind_speed_avg_mph=round(weighted_avg(wind_speeds), 1) if wind_speeds else None,
-            wind_direction_avg_deg=round(weighted_avg(wind_dirs)) if wind_dirs else None,
+            **{field: means[f][t] for f, field in enumerate(DAILY_WEATHER_FIELDS)},
             station_data=station_data,
         ))
-    
-    # Get hourly data (use weighted average from all stations)
-    cursor.execute("""
-        SELECT 
-            station_triplet,
-            observation_date::text as date,
-            observation_hour as hour,
-            snow_depth_in,
-            snow_water_equivalent_in,
-            temp_observed_f,
-            precip_accum_in,
-            wind_speed_avg_mph,
-            wind_speed_max_mph
-        FROM WEATHER_DATA.snotel_observations
-        WHERE station_triplet IN %s
-          AND observation_date >= (CURRENT_TIMESTAMP AT TIME ZONE 'America/Denver')::date - INTERVAL '%s days'
-        ORDER BY observation_date ASC, observation_hour ASC, station_triplet ASC
-    """, (triplets_tuple, days))
-    
-    hourly_rows = cursor.fetchall()
-    
-    # Organize hourly data by (date, hour)
-    hourly_by_datetime = {}
-    for row in hourly_rows:
-        key = (row['date'], row['hour'])
-        if key not in hourly_by_datetime:
-            hourly_by_datetime[key] = {}
-        hourly_by_datetime[key][row['station_triplet']] = row
-    
-    # Calculate weighted averages for hourly data
-    hourly_data = []
-    for (date, hour) in sorted(hourly_by_datetime.keys()):
-        datetime_data = hourly_by_datetime[(date, hour)]
-        
-        def weighted_avg_hourly(field):
-            total = 0.0
-            weight_sum = 0.0
-            for triplet, row in datetime_data.items():
-                val = row[field]
-                if val is not None:
-                    total += float(val) * weights[triplet]
-                    weight_sum += weights[triplet]
-            return round(total / weight_sum, 1) if weight_sum > 0 else None
-        
-        hourly_data.append(WeatherDataPoint(
-            date=date,
-            hour=hour,
-            snow_depth_in=weighted_avg_hourly('snow_depth_in'),
-            snow_water_equivalent_in=weighted_avg_hourly('snow_water_equivalent_in'),
-            temp_observed_f=weighted_avg_hourly('temp_observed_f'),
-            precip_accum_in=weighted_avg_hourly('precip_accum_in'),
-            wind_speed_avg_mph=weighted_avg_hourly('wind_speed_avg_mph'),
-            wind_speed_max_mph=weighted_avg_hourly('wind_speed_max_mph'),
-        ))
-    
-    # Get daily aggregated historical weather from the view (much smaller response)
-    cursor.execute("""
-        SELECT 
-            observation_date::text as date,
-            temp_min_f,
-            temp_max_f,
-            temp_avg_f,
-            precip_total_in,
-            snowfall_total_in
-        FROM WEATHER_DATA.historical_weather_daily
-        WHERE resort_name = %s
-          AND observation_date >= (CURRENT_TIMESTAMP AT TIME ZONE 'America/Denver')::date - INTERVAL '%s days'
-        ORDER BY observation_date ASC
-    """, (normalized_name, days))
-    
-    daily_weather_rows = cursor.fetchall()
+
+    # Hourly rows arrive already weighted and ordered (v_resort_weather_hourly)
+    hourly_data = [
+        WeatherDataPoint(
+            date=row['date'],
+            hour=row['hour'],
+            snow_depth_in=_to_float(row['snow_depth_in']),
+            snow_water_equivalent_in=_to_float(row['snow_water_equivalent_in']),
+            temp_observed_f=_to_float(row['temp_observed_f']),
+            temp_min_f=_to_float(row.get('temp_min_f')),
+            temp_max_f=_to_float(row.get('temp_max_f')),
+            precip_accum_in=_to_float(row['precip_accum_in']),
+            wind_speed_avg_mph=_to_float(row['wind_speed_avg_mph']),
+            wind_speed_max_mph=_to_float(row['wind_speed_max_mph']),
+        )
+        for row in hourly_rows
+    ]
+    if max_points is not None:
+        hourly_data = downsample_hourly(hourly_data, max_points)
+
     historical_weather = [
         DailyHistoricalWeather(
             date=row['date'],
-            temp_min_f=float(row['temp_min_f']) if row['temp_min_f'] is not None else None,
-            temp_max_f=float(row['temp_max_f']) if row['temp_max_f'] is not None else None,
-            temp_avg_f=float(row['temp_avg_f']) if row['temp_avg_f'] is not None else None,
-            precip_total_in=float(row['precip_total_in']) if row['precip_total_in'] is not None else None,
-            snowfall_total_in=float(row['snowfall_total_in']) if row['snowfall_total_in'] is not None else None,
+            temp_min_f=_to_float(row['temp_min_f']),
+            temp_max_f=_to_float(row['temp_max_f']),
+            temp_avg_f=_to_float(row['temp_avg_f']),
+            precip_total_in=_to_float(row['precip_total_in']),
+            snowfall_total_in=_to_float(row['snowfall_total_in']),
         )
         for row in daily_weather_rows
     ]
-    
+
     # Keep hourly_temperature empty for backward compatibility (deprecated)
     hourly_temperature: List[HourlyTemperaturePoint] = []
-    
+
     # Update daily_data with snowfall totals from historical_weather
     daily_snowfall = {row['date']: float(row['snowfall_total_in']) if row['snowfall_total_in'] else 0 for row in daily_weather_rows}
     for d in daily_data:
         if d.date in daily_snowfall:
             d.snowfall_total_in = round(daily_snowfall[d.date], 2)
-    
+
     # Calculate trend based on weighted daily data
     trend = _calculate_weather_trend(daily_data, hourly_data)
-    
-    conn.close()
-    
+
     return ResortWeatherSummary(
         resort_name=normalized_name,
         stations=stations,
@@ -647,22 +677,115 @@ def get_resort_weather(resort_name: str, days: int = 7) -> Optional[ResortWeathe
     )
 
 
+def downsample_hourly(points: List[WeatherDataPoint], max_points: int) -> List[WeatherDataPoint]:
+    """Keep at most `max_points` hourly points, picked by LTTB on temperature"""
+    if len(points) <= max_points:
+        return points
+    temps = column(p.temp_observed_f for p in points)
+    return [points[i] for i in lttb_indices(temps, max_points)]
+
+
+def build_resort_forecast(normalized_name: str, forecast_rows: list) -> Optional[ResortForecast]:
+    """Build a multi-source forecast from weather_forecasts rows"""
+    if not forecast_rows:
+        return None
+
+    forecasts = [
+        ForecastDataPoint(
+            source=row['source'],
+            forecast_time=row['forecast_time'],
+            valid_time=row['valid_time'],
+            temp_high_f=_to_float(row['temp_high_f']),
+            temp_low_f=_to_float(row['temp_low_f']),
+            snow_amount_in=_to_float(row['snow_amount_in']),
+            precip_amount_in=_to_float(row['precip_amount_in']),
+            precip_prob_pct=_to_int(row['precip_prob_pct']),
+            wind_speed_mph=_to_float(row['wind_speed_mph']),
+            wind_direction_deg=_to_int(row['wind_direction_deg']),
+            wind_gust_mph=_to_float(row['wind_gust_mph']),
+            conditions_text=row['conditions_text'],
+            icon_code=row['icon_code'],
+        )
+        for row in forecast_rows
+    ]
+
+    return ResortForecast(
+        resort_name=normalized_name,
+        forecasts=forecasts
+    )
+
+
+def group_rows(rows: list, key: str) -> Dict[str, list]:
+    """Group query rows by a column, preserving row order within each group"""
+    grouped: Dict[str, list] = defaultdict(list)
+    for row in rows:
+        grouped[row[key]].append(row)
+    return grouped
+
+
+def build_resort_summaries(locations: List[str], results: List[list]) -> List[Optional[ResortSummary]]:
+    """Split batched RESORT_DETAIL_SQL results per location (aligned with `locations`)"""
+    grouped = [group_rows(rows, 'location') for rows in results]
+    return [
+        build_resort_summary(location, *(group.get(location, []) for group in grouped))
+        for location in locations
+    ]
+
+
+def build_resort_weathers(
+    resort_names: List[str],
+    station_rows: list,
+    daily_rows: list,
+    hourly_rows: list,
+    daily_weather_rows: list,
+    max_points: Optional[int] = None,
+) -> List[Optional[ResortWeatherSummary]]:
+    """Split batched SNOTEL rows per resort (aligned with `resort_names`)"""
+    stations_by_resort = group_rows(station_rows, 'resort_name')
+    # Stations can be shared between neighbouring resorts, so index by station
+    daily_by_station = group_rows(daily_rows, 'station_triplet')
+    hourly_by_resort = group_rows(hourly_rows, 'resort_name')
+    historical_by_resort = group_rows(daily_weather_rows, 'resort_name')
+
+    summaries = []
+    for resort_name in resort_names:
+        if resort_name not in stations_by_resort:
+            summaries.append(None)
+            continue
+
+        stations = build_station_infos(stations_by_resort[resort_name])
+        triplets = [s.station_triplet for s in stations]
+        summaries.append(build_resort_weather(
+            resort_name,
+            stations,
+            [row for t in triplets for row in daily_by_station.get(t, [])],
+            hourly_by_resort.get(resort_name, []),
+            historical_by_resort.get(resort_name, []),
+            max_points,
+        ))
+
+    return summaries
+
+
+def build_resort_forecasts(resort_names: List[str], forecast_rows: list) -> List[Optional[ResortForecast]]:
+    """Split batched forecast rows per resort (aligned with `resort_names`)"""
+    grouped = group_rows(forecast_rows, 'resort_name')
+    return [build_resort_forecast(name, grouped.get(name, [])) for name in resort_names]
+
+
+def station_triplets_for(station_rows: list) -> List[str]:
+    """Distinct station triplets referenced by a batch of WEATHER_STATIONS_SQL rows"""
+    return sorted({row['station_triplet'] for row in station_rows})
+
+
 def _calculate_weather_trend(daily_data: List[DailyWeatherSummary], hourly_data: List[WeatherDataPoint]) -> WeatherTrend:
     """Calculate weather trend from daily and hourly data"""
-    
-    # Get snow depth values that are not None
-    snow_depths = [d.snow_depth_avg_in for d in daily_data if d.snow_depth_avg_in is not None]
-    
-    # Calculate snow depth change
-    if len(snow_depths) >= 2:
-        first_half = snow_depths[:len(snow_depths)//2]
-        second_half = snow_depths[len(snow_depths)//2:]
-        first_avg = sum(first_half) / len(first_half) if first_half else 0
-        second_avg = sum(second_half) / len(second_half) if second_half else 0
-        snow_depth_change = second_avg - first_avg
-    else:
-        snow_depth_change = 0.0
-    
+
+    snow_depths = column(d.snow_depth_avg_in for d in daily_data)
+
+    # Change between the mean of the first and second half of the window
+    snow_depth_change = half_change(snow_depths)
+
     # Determine trend direction
     if snow_depth_change > 1.0:
         snow_depth_trend = "increasing"
@@ -670,19 +793,18 @@ def _calculate_weather_trend(daily_data: List[DailyWeatherSummary], hourly_data:
         snow_depth_trend = "decreasing"
     else:
         snow_depth_trend = "stable"
-    
-    # Calculate average temperature
-    temps = [d.temp_max_f for d in daily_data if d.temp_max_f is not None]
-    temps += [d.temp_min_f for d in daily_data if d.temp_min_f is not None]
-    temp_avg = sum(temps) / len(temps) if temps else None
-    
+
+    # Average temperature over both daily highs and lows
+    temp_avg = nan_mean(
+        column(d.temp_max_f for d in daily_data),
+        column(d.temp_min_f for d in daily_data),
+    )
+
     # Calculate total precipitation
-    precips = [d.precip_total_in for d in daily_data if d.precip_total_in is not None]
-    total_precip = sum(precips) if precips else 0.0
-    
-    # Get latest snow depth
-    latest_snow_depth = snow_depths[-1] if snow_depths else None
-    
+    total_precip = nan_sum(column(d.precip_total_in for d in daily_data))
+
+    latest_snow_depth = last_valid(snow_depths)
+
     # Determine snow conditions based on snow depth and trend
     if latest_snow_depth is None:
         snow_conditions = "unknown"
@@ -694,7 +816,7 @@ def _calculate_weather_trend(daily_data: List[DailyWeatherSummary], hourly_data:
         snow_conditions = "fair"
     else:
         snow_conditions = "poor"
-    
+
     return WeatherTrend(
         snow_depth_change_in=round(snow_depth_change, 1),
         snow_depth_trend=snow_depth_trend,
@@ -705,132 +827,147 @@ def _calculate_weather_trend(daily_data: List[DailyWeatherSummary], hourly_data:
     )
 
 
-def get_all_resort_weather(days: int = 7) -> List[ResortWeatherSummary]:
+# ---------------------------------------------------------------------------
+# Synchronous resolvers
+# ---------------------------------------------------------------------------
+
+@cached(SKI_DATA)
+def get_all_resorts() -> List[ResortSummary]:
+    """Get summary data for all ski resorts"""
+    with get_db_cursor() as cursor:
+        # Get all unique locations
+        cursor.execute(LOCATIONS_SQL)
+        locations = [row['location'] for row in cursor.fetchall()]
+
+    return [resort for resort in get_resorts_by_locations(locations) if resort]
+
+
+@cached(SKI_DATA)
+def get_all_resorts_home() -> List[ResortHomeSummary]:
+    """Get pre-aggregated summary data for home page using v_resort_summary view"""
+    with get_db_cursor() as cursor:
+        cursor.execute(RESORTS_HOME_SQL)
+        rows = cursor.fetchall()
+
+    return build_resort_home_summaries(rows)
+
+
+@cached_batch(SKI_DATA)
+def get_resorts_by_locations(locations: List[str]) -> List[Optional[ResortSummary]]:
+    """Get detailed data for several resorts in a constant number of queries"""
+    if not locations:
+        return []
+
+    results = []
+    with get_db_cursor() as cursor:
+        for sql in RESORT_DETAIL_SQL:
+            cursor.execute(sql, (list(locations),))
+            results.append(cursor.fetchall())
+
+    return build_resort_summaries(locations, results)
+
+
+def get_resort_by_location(location: str) -> Optional[ResortSummary]:
+    """Get detailed data for a specific resort"""
+    return get_resorts_by_locations([location])[0]
+
+
+@cached(SKI_DATA)
+def get_global_recently_opened() -> GlobalRecentlyOpened:
+    """Get recently opened lifts and runs across all resorts"""
+    with get_db_cursor() as cursor:
+        cursor.execute(GLOBAL_RECENT_LIFTS_SQL)
+        lifts_data = cursor.fetchall()
+
+        cursor.execute(GLOBAL_RECENT_RUNS_SQL)
+        runs_data = cursor.fetchall()
+
+    return build_global_recently_opened(lifts_data, runs_data)
+
+
+@cached_batch(WEATHER_DATA)
+def get_resort_weather_batch(
+    resort_names: List[str],
+    days: int = 7,
+    resolution: int = 1,
+    max_points: Optional[int] = None,
+) -> List[Optional[ResortWeatherSummary]]:
+    """Get weather summaries for several resorts in a constant number of queries"""
+    normalized_names = [normalize_resort_name(name) for name in resort_names]
+    if not normalized_names:
+        return []
+
+    with get_db_cursor() as cursor:
+        cursor.execute(WEATHER_STATIONS_SQL, (normalized_names,))
+        station_rows = cursor.fetchall()
+        if not station_rows:
+            return [None] * len(normalized_names)
+
+        station_triplets = station_triplets_for(station_rows)
+
+        cursor.execute(WEATHER_DAILY_SQL, (station_triplets, days))
+        daily_rows = cursor.fetchall()
+
+        cursor.execute(*hourly_query(normalized_names, days, resolution))
+        hourly_rows = cursor.fetchall()
+
+        cursor.execute(WEATHER_HISTORICAL_SQL, (normalized_names, days))
+        daily_weather_rows = cursor.fetchall()
+
+    return build_resort_weathers(
+        normalized_names, station_rows, daily_rows, hourly_rows, daily_weather_rows, max_points
+    )
+
+
+def get_resort_weather(
+    resort_name: str,
+    days: int = 7,
+    resolution: int = 1,
+    max_points: Optional[int] = None,
+) -> Optional[ResortWeatherSummary]:
+    """Get weather summary for a specific resort from all SNOTEL stations with weighted averages"""
+    return get_resort_weather_batch([resort_name], days, resolution, max_points)[0]
+
+
+@cached(WEATHER_DATA)
+def get_all_resort_weather(
+    days: int = 7,
+    resolution: int = 1,
+    max_points: Optional[int] = None,
+) -> List[ResortWeatherSummary]:
     """Get weather summaries for all resorts"""
-    conn = get_db_connection()
-    cursor = conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor)
-    
-    # Get all unique resort names from the mapping
-    cursor.execute("""
-        SELECT DISTINCT resort_name
-        FROM WEATHER_DATA.resort_station_mapping
-        ORDER BY resort_name
-    """)
-    
-    resort_names = [row['resort_name'] for row in cursor.fetchall()]
-    conn.close()
-    
-    # Get weather for each resort
-    weather_summaries = []
-    for resort_name in resort_names:
-        weather = get_resort_weather(resort_name, days)
-        if weather:
-            weather_summaries.append(weather)
-    
-    return weather_summaries
+    with get_db_cursor() as cursor:
+        # Get all unique resort names from the mapping
+        cursor.execute(WEATHER_RESORT_NAMES_SQL)
+        resort_names = [row['resort_name'] for row in cursor.fetchall()]
+
+    return [weather for weather in get_resort_weather_batch(resort_names, days, resolution, max_points) if weather]
+
+
+@cached_batch(WEATHER_DATA)
+def get_resort_forecast_batch(resort_names: List[str], days: int = 7) -> List[Optional[ResortForecast]]:
+    """Get forecasts for several resorts in a single query"""
+    normalized_names = [normalize_resort_name(name) for name in resort_names]
+    if not normalized_names:
+        return []
+
+    with get_db_cursor() as cursor:
+        cursor.execute(FORECAST_SQL, (normalized_names, days))
+        forecast_rows = cursor.fetchall()
+
+    return build_resort_forecasts(normalized_names, forecast_rows)
 
 
 def get_resort_forecast(resort_name: str, days: int = 7) -> Optional[ResortForecast]:
     """Get weather forecast for a specific resort from multiple sources"""
-    conn = get_db_connection()
-    cursor = conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor)
-    
-    # Normalize resort name for case-insensitive matching
-    resort_name_map = {
-        'arapahoe basin': 'Arapahoe Basin',
-        'a-basin': 'Arapahoe Basin',
-        'copper': 'Copper',
-        'copper mountain': 'Copper',
-        'loveland': 'Loveland',
-        'breckenridge': 'Breckenridge',
-        'breck': 'Breckenridge',
-        'winter park': 'Winter Park',
-        'keystone': 'Keystone',
-        'vail': 'Vail',
-        'crested butte': 'Crested Butte',
-        'steamboat': 'Steamboat',
-        'purgatory': 'Purgatory',
-        'telluride': 'Telluride',
-    }
-    
-    normalized_name = resort_name_map.get(resort_name.lower(), resort_name)
-    
-    # Get forecasts from all sources (use Mountain Time to include today's forecast)
-    cursor.execute("""
-        SELECT 
-            source,
-            forecast_time::text as forecast_time,
-            valid_time::text as valid_time,
-            temp_high_f,
-            temp_low_f,
-            snow_amount_in,
-            precip_amount_in,
-            precip_prob_pct,
-            wind_speed_mph,
-            wind_direction_deg,
-            wind_gust_mph,
-            conditions_text,
-            icon_code
-        FROM WEATHER_DATA.weather_forecasts
-        WHERE resort_name = %s
-          AND valid_time >= (CURRENT_TIMESTAMP AT TIME ZONE 'America/Denver')::date
-          AND valid_time <= (CURRENT_TIMESTAMP AT TIME ZONE 'America/Denver')::date + INTERVAL '%s days'
-        ORDER BY source, valid_time ASC
-    """, (normalized_name, days))
-    
-    forecast_rows = cursor.fetchall()
-    conn.close()
-    
-    if not forecast_rows:
-        return None
-    
-    forecasts = [
-        ForecastDataPoint(
-            source=row['source'],
-            forecast_time=row['forecast_time'],
-            valid_time=row['valid_time'],
-            temp_high_f=float(row['temp_high_f']) if row['temp_high_f'] is not None else None,
-            temp_low_f=float(row['temp_low_f']) if row['temp_low_f'] is not None else None,
-            snow_amount_in=float(row['snow_amount_in']) if row['snow_amount_in'] is not None else None,
-            precip_amount_in=float(row['precip_amount_in']) if row['precip_amount_in'] is not None else None,
-            precip_prob_pct=int(row['precip_prob_pct']) if row['precip_prob_pct'] is not None else None,
-            wind_speed_mph=float(row['wind_speed_mph']) if row['wind_speed_mph'] is not None else None,
-            wind_direction_deg=int(row['wind_direction_deg']) if row['wind_direction_deg'] is not None else None,
-            wind_gust_mph=float(row['wind_gust_mph']) if row['wind_gust_mph'] is not None else None,
-            conditions_text=row['conditions_text'],
-            icon_code=row['icon_code'],
-        )
-        for row in forecast_rows
-    ]
-    
-    return ResortForecast(
-        resort_name=normalized_name,
-        forecasts=forecasts
-    )
+    return get_resort_forecast_batch([resort_name], days)[0]
 
 
+@cached(WEATHER_DATA)
 def get_all_resort_forecasts(days: int = 7) -> List[ResortForecast]:
     """Get weather forecasts for all resorts"""
-    conn = get_db_connection()
-    cursor = conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor)
-    
-    # Get all unique resort names from forecasts (use Mountain Time to include today)
-    cursor.execute("""
-        SELECT DISTINCT resort_name
-        FROM WEATHER_DATA.weather_forecasts
-        WHERE valid_time >= (CURRENT_TIMESTAMP AT TIME ZONE 'America/Denver')::date
-        ORDER BY resort_name
-    """)
-    
-    resort_names = [row['resort_name'] for row in cursor.fetchall()]
-    conn.close()
-    
-    # Get forecasts for each resort
-    forecast_summaries = []
-    for resort_name in resort_names:
-        forecast = get_resort_forecast(resort_name, days)
-        if forecast:
-            forecast_summaries.append(forecast)
-    
-    return forecast_summaries
+    with get_db_cursor() as cursor:
+        cursor.execute(FORECAST_RESORT_NAMES_SQL)
+        resort_names = [row['resort_name'] for row in cursor.fetchall()]
 
+    return [forecast for forecast in get_resort_forecast_batch(resort_names, days) if forecast]
@@ -2,6 +2,7 @@
 """GraphQL schema definitions for ski resort data"""
 
 import strawberry
+from enum import Enum
 from typing import List, Optional
 
 
@@ -121,6 +122,22 @@ class WeatherDataPoint:
     wind_speed_max_mph: Optional[float] = None
 
 
+@strawberry.enum
+class HourlyResolution(Enum):
+    """Bucket size for ResortWeatherSummary.hourly_data (value = hours per point)"""
+    HOURLY = 1
+    THREE_HOURS = 3
+    SIX_HOURS = 6
+    DAILY = 24
+
+
+def validate_max_points(max_points: Optional[int]) -> None:
+    """Reject a maxPoints argument LTTB downsampling can't honour"""
+    from .weather_aggregation import LTTB_MIN_POINTS
+    if max_points is not None and max_points < LTTB_MIN_POINTS:
+        raise ValueError(f"maxPoints must be at least {LTTB_MIN_POINTS} (got {max_points})")
+
+
 @strawberry.type
 class HourlyTemperaturePoint:
     """Hourly temperature observation from Open-Meteo"""
@@ -253,16 +270,29 @@ class Query:
         return get_global_recently_opened()
     
     @strawberry.field
-    def resort_weather(self, resort_name: str, days: int = 7) -> Optional[ResortWeatherSummary]:
-        """Get weather summary for a specific resort"""
+    def resort_weather(
+        self,
+        resort_name: str,
+        days: int = 7,
+        resolution: HourlyResolution = HourlyResolution.HOURLY,
+        max_points: Optional[int] = None,
+    ) -> Optional[ResortWeatherSummary]:
+        """Get weather summary for a specific resort (hourly_data bucketed by resolution, capped at max_points)"""
+        validate_max_points(max_points)
         from .resolvers import get_resort_weather
-        return get_resort_weather(resort_name, days)
+        return get_resort_weather(resort_name, days, resolution.value, max_points)
     
     @strawberry.field
-    def all_resort_weather(self, days: int = 7) -> List[ResortWeatherSummary]:
-        """Get weather summaries for all resorts"""
+    def all_resort_weather(
+        self,
+        days: int = 7,
+        resolution: HourlyResolution = HourlyResolution.HOURLY,
+        max_points: Optional[int] = None,
+    ) -> List[ResortWeatherSummary]:
+        """Get weather summaries for all resorts (hourly_data bucketed by resolution, capped at max_points)"""
+        validate_max_points(max_points)
         from .resolvers import get_all_resort_weather
-        return get_all_resort_weather(days)
+        return get_all_resort_weather(days, resolution.value, max_points)
     
     @strawberry.field
     def resort_forecast(self, resort_name: str, days: int = 7) -> Optional[ResortForecast]:
@@ -276,3 +306,71 @@ class Query:
         from .resolvers import get_all_resort_forecasts
         return get_all_resort_forecasts(days)
 
+
+
+@strawberry.type(name="Query")
+class AsyncQuery:
+    """GraphQL query root backed by the async resolvers (same fields as Query)
+
+    Single-resort fields go through the per-request DataLoaders in
+    info.context["loaders"], so aliased lookups in one query are batched.
+    """
+    
+    @strawberry.field
+    async def resorts(self) -> List[ResortSummary]:
+        """Get summary data for all ski resorts (includes individual lifts/runs)"""
+        from .async_resolvers import get_all_resorts
+        return await get_all_resorts()
+    
+    @strawberry.field
+    async def resorts_home(self) -> List[ResortHomeSummary]:
+        """Get pre-aggregated summary data for home page (no individual lifts/runs)"""
+        from .async_resolvers import get_all_resorts_home
+        return await get_all_resorts_home()
+    
+    @strawberry.field
+    async def resort(self, info: strawberry.Info, location: str) -> Optional[ResortSummary]:
+        """Get detailed data for a specific resort"""
+        return await info.context["loaders"]["resort"].load(location)
+    
+    @strawberry.field
+    async def global_recently_opened(self) -> GlobalRecentlyOpened:
+        """Get recently opened lifts and runs across all resorts"""
+        from .async_resolvers import get_global_recently_opened
+        return await get_global_recently_opened()
+    
+    @strawberry.field
+    async def resort_weather(
+        self,
+        info: strawberry.Info,
+        resort_name: str,
+        days: int = 7,
+        resolution: HourlyResolution = HourlyResolution.HOURLY,
+        max_points: Optional[int] = None,
+    ) -> Optional[ResortWeatherSummary]:
+        """Get weather summary for a specific resort (hourly_data bucketed by resolution, capped at max_points)"""
+        validate_max_points(max_points)
+        return await info.context["loaders"]["resort_weather"].load((resort_name, days, resolution.value, max_points))
+    
+    @strawberry.field
+    async def all_resort_weather(
+        self,
+        days: int = 7,
+        resolution: HourlyResolution = HourlyResolution.HOURLY,
+        max_points: Optional[int] = None,
+    ) -> List[ResortWeatherSummary]:
+        """Get weather summaries for all resorts (hourly_data bucketed by resolution, capped at max_points)"""
+        validate_max_points(max_points)
+        from .async_resolvers import get_all_resort_weather
+        return await get_all_resort_weather(days, resolution.value, max_points)
+    
+    @strawberry.field
+    async def resort_forecast(self, info: strawberry.Info, resort_name: str, days: int = 7) -> Optional[ResortForecast]:
+        """Get weather forecast for a specific resort from multiple sources"""
+        return await info.context["loaders"]["resort_forecast"].load((resort_name, days))
+    
+    @strawberry.field
+    async def all_resort_forecasts(self, days: int = 7) -> List[ResortForecast]:
+        """Get weather forecasts for all resorts from multiple sources"""
+        from .async_resolvers import get_all_resort_forecasts
+        return await get_all_resort_forecasts(days)
@@ -7,10 +7,16 @@ from fastapi.middleware.cors import CORSMiddleware
 from strawberry.fastapi import GraphQLRouter
 import strawberry
 
-from .schema import Query
+from .cache import cache_stats
+from .db import close_pool
+from .http_cache import GraphQLHTTPCacheMiddleware
+from .schema import Query, AsyncQuery
+
+# Use the async resolvers (psycopg 3 async pool) unless explicitly disabled
+GRAPHQL_ASYNC = os.getenv("GRAPHQL_ASYNC", "true").lower() in ("1", "true", "yes")
 
 # Create Strawberry schema
-schema = strawberry.Schema(query=Query)
+schema = strawberry.Schema(query=AsyncQuery if GRAPHQL_ASYNC else Query)
 
 # Create FastAPI app
 app = FastAPI(title="Ski Resort API", version="1.0.0")
@@ -24,6 +30,9 @@ else:
     # Default to localhost for development
     allowed_origins = ["http://localhost:5173", "http://localhost:3000", "http://localhost:5174"]
 
+# ETag/Cache-Control for GET queries; added first so CORS headers wrap its 304s
+app.add_middleware(GraphQLHTTPCacheMiddleware, path="/graphql", use_async=GRAPHQL_ASYNC)
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=allowed_origins,
@@ -32,13 +41,29 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+
+async def get_context() -> dict:
+    """Per-request GraphQL context with fresh DataLoaders for the async resolvers"""
+    from .async_resolvers import create_loaders
+    return {"loaders": create_loaders()}
+
+
 # Create GraphQL router
-graphql_app = GraphQLRouter(schema)
+graphql_app = GraphQLRouter(schema, context_getter=get_context if GRAPHQL_ASYNC else None)
 
 # Mount GraphQL endpoint
 app.include_router(graphql_app, prefix="/graphql")
 
 
+@app.on_event("shutdown")
+async def shutdown_db_pool():
+    """Close pooled database connections when the server stops"""
+    close_pool()
+    if GRAPHQL_ASYNC:
+        from .async_db import close_async_pool
+        await close_async_pool()
+
+
 @app.get("/")
 async def root():
     """Root endpoint"""
@@ -54,6 +79,12 @@ async def health():
     return {"status": "healthy"}
 
 
+@app.get("/cache/stats")
+async def resolver_cache_stats():
+    """Resolver cache hit/miss counters"""
+    return cache_stats()
+
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8000)
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""Columnar (NumPy) aggregation for multi-station SNOTEL data
+
+Rows for one resort are pivoted into a fields x time x stations cube (NaN
+where a station did not report), and inverse-distance weighted means for
+every field and time step are computed in one vectorized pass. Weights are
+renormalized per cell over the stations that actually reported, matching
+the per-value loop this replaces.
+"""
+
+from typing import Dict, Hashable, Iterable, List, Sequence, Tuple
+
+import numpy as np
+
+
+# Added to distances so co-located stations don't divide by zero
+DISTANCE_EPSILON = 0.1
+# LTTB always keeps the first and last point plus at least one in between
+LTTB_MIN_POINTS = 3
+
+
+def station_weights(distances: Sequence[float]) -> np.ndarray:
+    """Normalized inverse-distance weights, 1 / (distance + epsilon), summing to 1"""
+    weights = 1.0 / (np.asarray(distances, dtype=float) + DISTANCE_EPSILON)
+    return weights / weights.sum()
+
+
+def pivot(
+    rows: Iterable[dict],
+    time_key: str,
+    station_key: str,
+    stations: Sequence[Hashable],
+    fields: Sequence[str],
+) -> Tuple[List[Hashable], np.ndarray]:
+    """Pivot per-station rows into (sorted time keys, cube[field, time, station])"""
+    rows = list(rows)
+    times = sorted({row[time_key] for row in rows})
+    time_index = {t: i for i, t in enumerate(times)}
+    station_index = {s: i for i, s in enumerate(stations)}
+
+    rows = [row for row in rows if row[station_key] in station_index]
+    t_idx = np.fromiter((time_index[row[time_key]] for row in rows), dtype=np.intp, count=len(rows))
+    s_idx = np.fromiter((station_index[row[station_key]] for row in rows), dtype=np.intp, count=len(rows))
+
+    cube = np.full((len(fields), len(times), len(stations)), np.nan)
+    for f, field in enumerate(fields):
+        # Scatter one column at a time; missing values stay NaN
+        cube[f, t_idx, s_idx] = column(row[field] for row in rows)
+    return times, cube
+
+
+def weighted_means(cube: np.ndarray, weights: np.ndarray) -> np.ndarray:
+    """Masked weighted mean over the station axis -> [field, time] (NaN if no station reported)"""
+    present = ~np.isnan(cube)
+    weight_sums = (present * weights).sum(axis=-1)
+    totals = np.where(present, cube, 0.0) @ weights
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(weight_sums > 0, totals / weight_sums, np.nan)
+
+
+def column(values: Iterable, dtype=float) -> np.ndarray:
+    """Build a float array from values that may contain None (-> NaN)"""
+    return np.array([np.nan if v is None else v for v in values], dtype=dtype)
+
+
+def half_change(series: np.ndarray) -> float:
+    """Mean of the second half minus mean of the first half, ignoring NaNs"""
+    valid = series[~np.isnan(series)]
+    if len(valid) < 2:
+        return 0.0
+    mid = len(valid) // 2
+    return float(valid[mid:].mean() - valid[:mid].mean())
+
+
+def nan_mean(*series: np.ndarray):
+    """Mean over all non-NaN values in the given arrays (None if there are none)"""
+    values = np.concatenate(series) if series else np.array([])
+    values = values[~np.isnan(values)]
+    return float(values.mean()) if len(values) else None
+
+
+def nan_sum(series: np.ndarray) -> float:
+    """Sum of the non-NaN values (0.0 if there are none)"""
+    return float(np.nansum(series))
+
+
+def last_valid(series: np.ndarray):
+    """Last non-NaN value (None if there is none)"""
+    valid = series[~np.isnan(series)]
+    return float(valid[-1]) if len(valid) else None
+
+
+def to_rounded_lists(means: np.ndarray, decimals: Dict[int, int]) -> List[list]:
+    """Convert a [field, time] array to per-field Python lists rounded per field (NaN -> None)"""
+    result = []
+    for f, row in enumerate(means.tolist()):
+        places = decimals.get(f, 1)
+        result.append([None if v != v else (round(v) if places == 0 else round(v, places)) for v in row])
+    return result
+
+
+def lttb_indices(y: np.ndarray, threshold: int) -> np.ndarray:
+    """Indices of `threshold` points chosen by Largest-Triangle-Three-Buckets
+
+    Points are assumed evenly spaced along x (one per time bucket). The first
+    and last points are always kept; every bucket in between keeps the point
+    forming the largest triangle with the previously kept point and the
+    average of the next bucket. NaNs are treated as the series mean.
+    """
+    if threshold < LTTB_MIN_POINTS:
+        raise ValueError(f"LTTB needs a threshold of at least {LTTB_MIN_POINTS} (got {threshold})")
+    n = len(y)
+    if threshold >= n:
+        return np.arange(n)
+
+    y = np.asarray(y, dtype=float)
+    if np.isnan(y).all():
+        y = np.zeros(n)
+    else:
+        y = np.where(np.isnan(y), np.nanmean(y), y)
+    x = np.arange(n, dtype=float)
+
+    # Bucket edges over the interior points (first and last are fixed); integer
+    # arithmetic, since float edges land one point off for some (n, threshold)
+    edges = 1 + (np.arange(threshold - 1) * (n - 2)) // (threshold - 2)
+    selected = np.empty(threshold, dtype=np.intp)
+    selected[0] = 0
+    selected[-1] = n - 1
+
+    a = 0
+    for i in range(threshold - 2):
+        start, end = edges[i], edges[i + 1]
+        # Average of the next bucket (the last point for the final bucket)
+        next_start, next_end = end, edges[i + 2] if i + 2 < len(edges) else n
+        avg_x = x[next_start:next_end].mean()
+        avg_y = y[next_start:next_end].mean()
+
+        areas = np.abs(
+            (x[a] - avg_x) * (y[start:end] - y[a])
+            - (x[a] - x[start:end]) * (avg_y - y[a])
+        )
+        a = start + int(np.argmax(areas))
+        selected[i + 1] = a
+
+    return selected
@@ -1,12 +1,28 @@
 import { ApolloClient, InMemoryCache, HttpLink } from '@apollo/client/core';
+import { PersistedQueryLink } from '@apollo/client/link/persisted-queries';
 
+// Send queries as GET so nginx and the browser can cache them (the backend
+// answers with ETag / Cache-Control); persisted queries keep the URLs short.
 const httpLink = new HttpLink({
   uri: process.env.NEXT_PUBLIC_GRAPHQL_URL || 'http://localhost:8000/graphql',
+  useGETForQueries: true,
+});
+
+async function sha256(query: string): Promise<string> {
+  const digest = await crypto.subtle.digest('SHA-256', new TextEncoder().encode(query));
+  return Array.from(new Uint8Array(digest))
+    .map((byte) => byte.toString(16).padStart(2, '0'))
+    .join('');
+}
+
+const persistedQueryLink = new PersistedQueryLink({
+  sha256,
+  useGETForHashedQueries: true,
 });
 
 export function makeClient() {
   return new ApolloClient({
-    link: httpLink,
+    link: persistedQueryLink.concat(httpLink),
     cache: new InMemoryCache(),
   });
 }
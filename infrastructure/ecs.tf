@@ -43,6 +43,14 @@ resource "aws_ecs_task_definition" "resort_scraper" {
         {
           name  = "SELENIUM_HOST"
           value = "local"
+        },
+        {
+          name  = "SCRAPER_WORKERS"
+          value = tostring(var.resort_scraper_workers)
+        },
+        {
+          name  = "SCRAPER_TIMEOUT"
+          value = tostring(var.resort_scraper_timeout)
         }
       ]
 
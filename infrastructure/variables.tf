@@ -55,6 +55,18 @@ variable "resort_scraper_memory" {
   default     = 2048
 }
 
+variable "resort_scraper_workers" {
+  description = "Number of resort scrapers run concurrently (each runs its own headless Chromium, ~500-700 MB; keep workers x 700 MB under resort_scraper_memory)"
+  type        = number
+  default     = 2
+}
+
+variable "resort_scraper_timeout" {
+  description = "Seconds before a single resort scraper is marked as timed out"
+  type        = number
+  default     = 300
+}
+
 variable "assign_public_ip" {
   description = "Whether to assign public IP to ECS tasks (needed if using public subnets without NAT)"
   type        = bool
@@ -0,0 +1,27 @@
+"""
+Ingestion
+
+Shared plumbing for the weather Lambdas, ECS runners and backfill scripts:
+a PostgreSQL connection factory, a bulk upsert writer (COPY into a staging
+table + one merge), typed record models and the resort coordinates registry
+loaded from weather/resort_snotel_mapping.json.
+"""
+
+from .db import USE_PSYCOPG3, get_db_connection
+from .models import ForecastRecord, HistoricalWeatherRecord
+from .registry import load_resort_coordinates, load_resort_mapping
+from .writer import CsvRowReader, bulk_upsert, copy_rows, load_records, write_records
+
+__all__ = [
+    "USE_PSYCOPG3",
+    "get_db_connection",
+    "ForecastRecord",
+    "HistoricalWeatherRecord",
+    "load_resort_coordinates",
+    "load_resort_mapping",
+    "CsvRowReader",
+    "bulk_upsert",
+    "copy_rows",
+    "load_records",
+    "write_records",
+]
@@ -0,0 +1,42 @@
+"""PostgreSQL connection factory (psycopg 3, falling back to psycopg2)"""
+
+import os
+from typing import Optional
+from urllib.parse import urlparse, unquote
+
+# Try psycopg3 first (better support), fallback to psycopg2
+try:
+    import psycopg
+    USE_PSYCOPG3 = True
+except ImportError:
+    try:
+        import psycopg2
+        USE_PSYCOPG3 = False
+    except ImportError:
+        raise ImportError("Neither psycopg nor psycopg2 installed. Install with: pip install psycopg or pip install psycopg2-binary")
+
+
+def get_db_connection(database_url: Optional[str] = None):
+    """Open a PostgreSQL connection from a DATABASE_URL (defaults to the environment)"""
+    database_url = database_url or os.environ.get("DATABASE_URL")
+    if not database_url:
+        raise ValueError("DATABASE_URL environment variable not set")
+
+    parsed = urlparse(database_url)
+    db_password = unquote(parsed.password) if parsed.password else None
+    if db_password and '%' in db_password:
+        db_password = unquote(db_password)
+
+    conn_params = {
+        'host': parsed.hostname or 'localhost',
+        'port': parsed.port or 5432,
+        'user': parsed.username,
+        'password': db_password,
+        'sslmode': 'prefer'
+    }
+
+    if USE_PSYCOPG3:
+        conn_params['dbname'] = parsed.path.lstrip('/')
+        return psycopg.connect(**conn_params)
+    conn_params['database'] = parsed.path.lstrip('/')
+    return psycopg2.connect(**conn_params)
@@ -0,0 +1,116 @@
+"""Warm-start cache for the Lambda handlers
+
+Lambda keeps a module's globals alive between invocations of a warm
+container, so the DATABASE_URL secret and the Postgres connection are kept
+here and reused until their TTL runs out (or the connection fails a health
+check) instead of being fetched and opened on every invocation.
+"""
+
+import os
+import time
+from contextlib import contextmanager
+from typing import Optional
+
+from .db import get_db_connection
+
+# Seconds a fetched secret / opened connection is reused by warm invocations
+SECRET_TTL_SECONDS = int(os.environ.get("LAMBDA_SECRET_TTL_SECONDS", "900"))
+CONNECTION_TTL_SECONDS = int(os.environ.get("LAMBDA_CONNECTION_TTL_SECONDS", "900"))
+
+_secrets_client = None
+_secret = {"value": None, "fetched_at": 0.0}
+_connection = {"conn": None, "opened_at": 0.0}
+_cold_start = True
+
+
+def get_database_url() -> str:
+    """DATABASE_URL from Secrets Manager, cached for SECRET_TTL_SECONDS"""
+    global _secrets_client
+
+    if _secret["value"] and time.monotonic() - _secret["fetched_at"] < SECRET_TTL_SECONDS:
+        return _secret["value"]
+
+    database_url_secret_name = os.environ.get("DATABASE_URL_SECRET_NAME")
+    if not database_url_secret_name:
+        raise ValueError("DATABASE_URL_SECRET_NAME environment variable not set")
+
+    try:
+        if _secrets_client is None:
+            # boto3 is slow to import; only pay for it when the secret is (re)fetched
+            import boto3
+            _secrets_client = boto3.client("secretsmanager")
+        secret_response = _secrets_client.get_secret_value(SecretId=database_url_secret_name)
+    except Exception as e:
+        raise ValueError(f"Failed to retrieve DATABASE_URL from Secrets Manager: {e}")
+
+    _secret.update(value=secret_response["SecretString"], fetched_at=time.monotonic())
+    return _secret["value"]
+
+
+def _is_healthy(conn) -> bool:
+    """Cheap round trip to check a cached connection still works"""
+    if conn.closed:
+        return False
+    try:
+        cursor = conn.cursor()
+        cursor.execute("SELECT 1")
+        cursor.fetchone()
+        cursor.close()
+        # End the health check's implicit transaction
+        conn.rollback()
+        return True
+    except Exception:
+        return False
+
+
+def get_connection(database_url: Optional[str] = None):
+    """Cached Postgres connection, reopened when older than CONNECTION_TTL_SECONDS or broken
+
+    Callers must not close it; use discard_connection() after an error.
+    """
+    conn = _connection["conn"]
+    if conn is not None:
+        if time.monotonic() - _connection["opened_at"] < CONNECTION_TTL_SECONDS and _is_healthy(conn):
+            return conn
+        discard_connection()
+
+    conn = get_db_connection(database_url or get_database_url())
+    _connection.update(conn=conn, opened_at=time.monotonic())
+    return conn
+
+
+def discard_connection():
+    """Close and forget the cached connection (e.g. after a failed invocation)"""
+    conn = _connection["conn"]
+    _connection.update(conn=None, opened_at=0.0)
+    if conn is not None:
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+
+def start_invocation(import_ms: Optional[float] = None) -> dict:
+    """Init timing stats for this invocation; module import time is only reported on a cold start"""
+    global _cold_start
+    stats = {"cold_start": _cold_start}
+    if _cold_start and import_ms is not None:
+        stats["import_ms"] = import_ms
+    _cold_start = False
+    return stats
+
+
+@contextmanager
+def timed(stats: dict, phase: str):
+    """Record the duration of a phase as stats[f"{phase}_ms"]"""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        stats[f"{phase}_ms"] = round((time.perf_counter() - start) * 1000, 1)
+
+
+def finish_init(stats: dict) -> dict:
+    """Total the recorded phases into stats["init_ms"]"""
+    stats["init_ms"] = round(sum(v for k, v in stats.items() if k.endswith("_ms") and k != "init_ms"), 1)
+    return stats
@@ -0,0 +1,41 @@
+"""Typed records written by the ingestion jobs
+
+Each model is a NamedTuple whose fields are the target table's columns in
+COPY order, with the table and its conflict key as class attributes, so
+records can go straight to write_records().
+"""
+
+from datetime import datetime
+from typing import NamedTuple, Optional
+
+
+class ForecastRecord(NamedTuple):
+    """One day of a resort forecast (WEATHER_DATA.weather_forecasts)"""
+    resort_name: str
+    source: str
+    forecast_time: datetime
+    valid_time: datetime
+    temp_high_f: Optional[float] = None
+    temp_low_f: Optional[float] = None
+    snow_amount_in: Optional[float] = None
+    precip_amount_in: Optional[float] = None
+    precip_prob_pct: Optional[int] = None
+    conditions_text: Optional[str] = None
+    icon_code: Optional[str] = None
+
+    table = "WEATHER_DATA.weather_forecasts"
+    key_columns = ("resort_name", "source", "valid_time")
+
+
+class HistoricalWeatherRecord(NamedTuple):
+    """One day of observed resort weather (WEATHER_DATA.historical_weather)"""
+    resort_name: str
+    observation_date: str  # YYYY-MM-DD
+    observation_hour: int = 0  # 0 for daily records
+    temperature_f: Optional[float] = None  # Daily high
+    temp_min_f: Optional[float] = None
+    precipitation_in: Optional[float] = None
+    snowfall_in: Optional[float] = None
+
+    table = "WEATHER_DATA.historical_weather"
+    key_columns = ("resort_name", "observation_date", "observation_hour")
@@ -0,0 +1,33 @@
+"""Resort coordinates registry, loaded from weather/resort_snotel_mapping.json"""
+
+import json
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict
+
+DEFAULT_MAPPING_FILE = Path(__file__).resolve().parent.parent / "weather" / "resort_snotel_mapping.json"
+
+
+@lru_cache(maxsize=None)
+def load_resort_mapping(mapping_file: str = str(DEFAULT_MAPPING_FILE)) -> dict:
+    """Resort name -> {resort or station triplet -> details}, as stored in the mapping file
+
+    Cached per file; treat the result as read-only.
+    """
+    with open(mapping_file, "r") as f:
+        return json.load(f)
+
+
+def load_resort_coordinates(mapping_file: str = str(DEFAULT_MAPPING_FILE)) -> Dict[str, Dict[str, float]]:
+    """Resort name -> {"latitude", "longitude"} of the resort itself"""
+    coordinates = {}
+    for resort_name, resort_data in load_resort_mapping(mapping_file).items():
+        # The resort is the entry without ":" in its key; the rest are SNOTEL stations
+        for key, value in resort_data.items():
+            if ":" not in key:
+                coordinates[resort_name] = {
+                    "latitude": value.get("latitude"),
+                    "longitude": value.get("longitude")
+                }
+                break
+    return coordinates
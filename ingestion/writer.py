@@ -0,0 +1,153 @@
+"""Bulk upsert writer: COPY rows into a temporary staging table, then one merge
+
+A whole load is a few round trips and one INSERT ... SELECT ... ON CONFLICT,
+instead of one statement (and commit) per row.
+"""
+
+import csv
+import io
+from typing import Iterable, Optional, Sequence
+
+from .db import USE_PSYCOPG3
+
+# Rows formatted per write when feeding COPY through psycopg2
+COPY_CHUNK_ROWS = 1000
+
+
+class CsvRowReader:
+    """File-like object that renders row tuples as CSV on demand (for psycopg2 copy_expert)"""
+
+    def __init__(self, rows: Iterable[tuple], chunk_rows: int = COPY_CHUNK_ROWS):
+        self.rows = iter(rows)
+        self.chunk_rows = chunk_rows
+        self.count = 0
+        self._buffer = ""
+
+    def _fill(self) -> bool:
+        out = io.StringIO()
+        writer = csv.writer(out, lineterminator="\n")
+        written = 0
+        for row in self.rows:
+            writer.writerow(row)
+            written += 1
+            if written >= self.chunk_rows:
+                break
+        self.count += written
+        self._buffer += out.getvalue()
+        return written > 0
+
+    def read(self, size: int = -1) -> str:
+        while (size < 0 or len(self._buffer) < size) and self._fill():
+            pass
+        if size < 0:
+            size = len(self._buffer)
+        data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
+
+    def readline(self) -> str:
+        while "\n" not in self._buffer and self._fill():
+            pass
+        end = self._buffer.find("\n") + 1 or len(self._buffer)
+        line, self._buffer = self._buffer[:end], self._buffer[end:]
+        return line
+
+
+def staging_table_name(table: str) -> str:
+    """Temp table name for a target table, e.g. WEATHER_DATA.foo -> foo_staging"""
+    return f"{table.split('.')[-1].lower()}_staging"
+
+
+def create_staging_sql(table: str, columns: Sequence[str]) -> str:
+    """Temp table with the target's column types, no defaults/constraints; dropped at commit"""
+    return f"""
+    CREATE TEMP TABLE {staging_table_name(table)} ON COMMIT DROP AS
+    SELECT {", ".join(columns)}
+    FROM {table}
+    WITH NO DATA
+"""
+
+
+def merge_sql(
+    table: str,
+    columns: Sequence[str],
+    key_columns: Sequence[str],
+    update_columns: Optional[Sequence[str]] = None,
+    keep_existing: bool = False,
+    where: Optional[str] = None,
+) -> str:
+    """INSERT ... SELECT DISTINCT ON (key) FROM staging ... ON CONFLICT (key) DO UPDATE
+
+    Args:
+        update_columns: Columns overwritten on conflict (default: every non-key column)
+        keep_existing: NULLs in staging keep the stored value (COALESCE) instead of clearing it
+        where: Filter on staging rows (alias `st`)
+    """
+    if update_columns is None:
+        update_columns = [c for c in columns if c not in key_columns]
+    if keep_existing:
+        assignments = ", ".join(f"{c} = COALESCE(EXCLUDED.{c}, t.{c})" for c in update_columns)
+    else:
+        assignments = ", ".join(f"{c} = EXCLUDED.{c}" for c in update_columns)
+    conflict_action = f"DO UPDATE SET\n        {assignments}" if update_columns else "DO NOTHING"
+    where_clause = f"\n    WHERE {where}" if where else ""
+
+    return f"""
+    INSERT INTO {table} AS t ({", ".join(columns)})
+    SELECT DISTINCT ON ({", ".join(key_columns)}) {", ".join("st." + c for c in columns)}
+    FROM {staging_table_name(table)} st{where_clause}
+    ORDER BY {", ".join(key_columns)}
+    ON CONFLICT ({", ".join(key_columns)}) {conflict_action}
+"""
+
+
+def copy_rows(cursor, table: str, columns: Sequence[str], rows: Iterable[tuple]) -> int:
+    """Create the staging table for `table` and stream row tuples into it; returns rows copied"""
+    cursor.execute(create_staging_sql(table, columns))
+    copy_sql = f"COPY {staging_table_name(table)} ({', '.join(columns)}) FROM STDIN"
+
+    if USE_PSYCOPG3:
+        count = 0
+        with cursor.copy(copy_sql) as copy:
+            for row in rows:
+                copy.write_row(row)
+                count += 1
+        return count
+
+    reader = CsvRowReader(rows)
+    cursor.copy_expert(f"{copy_sql} WITH (FORMAT csv)", reader)
+    return reader.count
+
+
+def bulk_upsert(
+    cursor,
+    table: str,
+    columns: Sequence[str],
+    key_columns: Sequence[str],
+    rows: Iterable[tuple],
+    update_columns: Optional[Sequence[str]] = None,
+    keep_existing: bool = False,
+) -> dict:
+    """COPY rows into staging and merge them into `table` without committing"""
+    copied = copy_rows(cursor, table, columns, rows)
+    cursor.execute(merge_sql(table, columns, key_columns, update_columns, keep_existing))
+    return {"copied": copied, "merged": cursor.rowcount}
+
+
+def write_records(cursor, model, records: Iterable[tuple]) -> dict:
+    """Bulk upsert records of a models.py type into its table without committing"""
+    return bulk_upsert(cursor, model.table, model._fields, model.key_columns, records)
+
+
+def load_records(conn, model, records: Iterable[tuple]) -> dict:
+    """Bulk upsert records of a models.py type in one transaction (rolled back on error)"""
+    cursor = conn.cursor()
+    try:
+        counts = write_records(cursor, model, records)
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        cursor.close()
+
+    return counts
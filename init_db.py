@@ -59,6 +59,18 @@ from urllib.parse import urlparse
 
 SQL_DIR = Path(__file__).parent / "sql"
 
+# Idempotent column-type migrations, run after tables and before indexes/views
+SCHEMA_MIGRATIONS = [
+    "typed_status_columns.sql",
+]
+
+# Idempotent backfills for derived tables (trigger- or loader-maintained), run on every init
+SEED_MIGRATIONS = [
+    "backfill_current_state.sql",
+    "backfill_first_opened.sql",
+    "backfill_snotel_watermarks.sql",
+]
+
 
 def get_db_connection():
     """Create and return a PostgreSQL database connection"""
@@ -68,13 +80,59 @@ def get_db_connection():
         return psycopg2.connect(DATABASE_URL)
 
 
+def split_sql_statements(sql_content):
+    """Split a SQL script on semicolons, ignoring those inside quotes, comments or $$ bodies"""
+    statements = []
+    current = []
+    i = 0
+    in_single_quote = False
+    in_dollar_quote = False
+    while i < len(sql_content):
+        char = sql_content[i]
+        if in_dollar_quote:
+            if sql_content.startswith('$$', i):
+                in_dollar_quote = False
+                current.append('$$')
+                i += 2
+                continue
+        elif in_single_quote:
+            if char == "'":
+                in_single_quote = False
+        elif sql_content.startswith('--', i):
+            # Skip to end of line so semicolons in comments don't split
+            end = sql_content.find('\n', i)
+            end = len(sql_content) if end == -1 else end
+            current.append(sql_content[i:end])
+            i = end
+            continue
+        elif sql_content.startswith('$$', i):
+            in_dollar_quote = True
+            current.append('$$')
+            i += 2
+            continue
+        elif char == "'":
+            in_single_quote = True
+        elif char == ';':
+            statements.append(''.join(current))
+            current = []
+            i += 1
+            continue
+        current.append(char)
+        i += 1
+    statements.append(''.join(current))
+
+    # Filter out empty (or comment-only) statements
+    return [
+        stmt.strip() for stmt in statements
+        if any(line.strip() and not line.strip().startswith('--') for line in stmt.splitlines())
+    ]
+
+
 def execute_sql_file(cursor, sql_file_path):
     """Execute SQL commands from a file"""
     with open(sql_file_path, 'r') as f:
         sql_content = f.read()
-        # Split by semicolon and execute each statement
-        # Filter out empty statements
-        statements = [stmt.strip() for stmt in sql_content.split(';') if stmt.strip()]
+        statements = split_sql_statements(sql_content)
         for statement in statements:
             if statement:
                 try:
@@ -120,11 +178,30 @@ def init_database():
         execute_sql_directory(cursor, tables_dir, "tables")
         conn.commit()
         
+        # Bring existing tables up to the current column types
+        print("  - Migrating column types...")
+        for migration in SCHEMA_MIGRATIONS:
+            print(f"    • {migration}")
+            execute_sql_file(cursor, SQL_DIR / "migrations" / migration)
+        conn.commit()
+        
         # Create indexes from SQL files
         indexes_dir = SQL_DIR / "indexes"
         execute_sql_directory(cursor, indexes_dir, "indexes")
         conn.commit()
         
+        # Create triggers that maintain the current-state tables
+        triggers_dir = SQL_DIR / "triggers"
+        execute_sql_directory(cursor, triggers_dir, "triggers")
+        conn.commit()
+        
+        # Seed trigger-maintained tables from any existing scrape history (idempotent)
+        print("  - Seeding derived tables...")
+        for migration in SEED_MIGRATIONS:
+            print(f"    • {migration}")
+            execute_sql_file(cursor, SQL_DIR / "migrations" / migration)
+        conn.commit()
+        
         # Create views from SQL files
         views_dir = SQL_DIR / "views"
         execute_sql_directory(cursor, views_dir, "views")
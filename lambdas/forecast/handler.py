@@ -4,6 +4,9 @@ Forecast Lambda Handler
 Runs every 6 hours, fetching forecasts from Open-Meteo API.
 """
 
+import time
+_IMPORT_START = time.perf_counter()
+
 import os
 import sys
 import json
@@ -14,26 +17,22 @@ from datetime import datetime
 weather_path = Path(__file__).parent / "weather"
 sys.path.insert(0, str(weather_path))
 
-from forecast_collector import ForecastCollector
-
+from ingestion.lambda_cache import (
+    discard_connection,
+    finish_init,
+    get_connection,
+    get_database_url,
+    start_invocation,
+    timed,
+)
 
-def get_database_url():
-    """Get DATABASE_URL from Secrets Manager"""
-    database_url_secret_name = os.environ.get("DATABASE_URL_SECRET_NAME")
-    if not database_url_secret_name:
-        raise ValueError("DATABASE_URL_SECRET_NAME environment variable not set")
-    
-    try:
-        import boto3
-        secrets_client = boto3.client("secretsmanager")
-        secret_response = secrets_client.get_secret_value(SecretId=database_url_secret_name)
-        return secret_response["SecretString"]
-    except Exception as e:
-        raise ValueError(f"Failed to retrieve DATABASE_URL from Secrets Manager: {e}")
+# Module import time, reported on cold starts
+IMPORT_MS = round((time.perf_counter() - _IMPORT_START) * 1000, 1)
 
 
 def lambda_handler(event: dict, context) -> dict:
     """Main Lambda handler function"""
+    init = start_invocation(IMPORT_MS)
     print("=" * 60)
     print("Starting Weather Forecast Refresh")
     print("=" * 60)
@@ -43,12 +42,18 @@ def lambda_handler(event: dict, context) -> dict:
     print()
     
     try:
-        # Get DATABASE_URL from Secrets Manager
-        database_url = get_database_url()
+        # Secret and connection are cached across warm invocations
+        with timed(init, "secret"):
+            database_url = get_database_url()
         os.environ["DATABASE_URL"] = database_url
+        with timed(init, "connection"):
+            conn = get_connection(database_url)
         
-        # Output SQL file path
-        sql_output_file = "/tmp/forecast_import.sql"
+        # Collector modules (requests, HTTP client) are imported on first use
+        with timed(init, "modules"):
+            from forecast_collector import ForecastCollector
+        finish_init(init)
+        print(f"Init ({'cold' if init['cold_start'] else 'warm'} start): {init['init_ms']} ms")
         
         # Initialize collector
         collector = ForecastCollector()
@@ -63,97 +68,19 @@ def lambda_handler(event: dict, context) -> dict:
                 "statusCode": 200,
                 "body": json.dumps({
                     "message": "No forecasts collected",
-                    "forecast_time": forecast_time.isoformat()
+                    "forecast_time": forecast_time.isoformat(),
+                    "init": init
                 })
             }
         
         print(f"✅ Collected {len(forecasts)} forecast records")
         print()
         
-        # Generate SQL INSERT statements
-        print("Generating SQL INSERT statements...")
-        complete_sql = collector.generate_sql_inserts(forecasts)
-        
-        # Write to file
-        with open(sql_output_file, 'w') as f:
-            f.write(complete_sql)
-        
-        print(f"✅ Generated SQL with {len(forecasts)} forecast records")
-        print()
-        
-        # Execute SQL against database
-        print("Executing SQL against database...")
-        
-        from urllib.parse import urlparse, unquote
-        
-        # Try psycopg3 first (better support), fallback to psycopg2
-        try:
-            import psycopg
-            USE_PSYCOPG3 = True
-        except ImportError:
-            try:
-                import psycopg2
-                USE_PSYCOPG3 = False
-            except ImportError:
-                error_msg = "Neither psycopg nor psycopg2 installed"
-                print(f"❌ Error: {error_msg}")
-                return {
-                    "statusCode": 500,
-                    "body": json.dumps({"error": error_msg})
-                }
-        
-        # Parse DATABASE_URL and connect
-        parsed = urlparse(database_url)
-        db_password = unquote(parsed.password) if parsed.password else None
-        if db_password and '%' in db_password:
-            db_password = unquote(db_password)
-        
-        # Build connection parameters
-        conn_params = {
-            'host': parsed.hostname or 'localhost',
-            'port': parsed.port or 5432,
-            'user': parsed.username,
-            'password': db_password,
-            'sslmode': 'prefer'
-        }
-        
-        if USE_PSYCOPG3:
-            conn_params['dbname'] = parsed.path.lstrip('/')
-            conn = psycopg.connect(**conn_params)
-        else:
-            conn_params['database'] = parsed.path.lstrip('/')
-            conn = psycopg2.connect(**conn_params)
-        
-        cursor = conn.cursor()
-        
-        # Read and execute SQL file
-        with open(sql_output_file, 'r') as f:
-            sql_content = f.read()
-        
-        # Split by semicolon and execute each statement
-        statements = [stmt.strip() for stmt in sql_content.split(';') if stmt.strip()]
-        
-        success_count = 0
-        error_count = 0
-        
-        for i, statement in enumerate(statements):
-            if statement and not statement.startswith('--'):
-                try:
-                    cursor.execute(statement)
-                    conn.commit()
-                    success_count += 1
-                except Exception as e:
-                    error_count += 1
-                    conn.rollback()
-                    if 'INSERT' in statement or 'CREATE' in statement:
-                        print(f"  ⚠️  Warning on statement {i+1}: {str(e)[:100]}")
-        
-        cursor.close()
-        conn.close()
+        # Load all forecasts in one transaction (COPY + single merge)
+        print("Loading forecasts into database...")
+        counts = collector.load_forecasts(conn, forecasts)
         
-        print(f"✅ Executed {success_count} statements successfully")
-        if error_count > 0:
-            print(f"⚠️  {error_count} statements had warnings/errors")
+        print(f"✅ Loaded {counts['copied']} forecast records ({counts['merged']} rows written)")
         
         print()
         print("=" * 60)
@@ -170,13 +97,15 @@ def lambda_handler(event: dict, context) -> dict:
                 "message": "Forecast refresh complete",
                 "forecast_time": forecast_time.isoformat(),
                 "forecast_records": len(forecasts),
-                "statements_executed": success_count,
-                "statements_with_errors": error_count,
-                "source": "Open-Meteo"
+                "rows_written": counts["merged"],
+                "source": "Open-Meteo",
+                "init": init
             })
         }
         
     except Exception as e:
+        # Don't hand a possibly broken connection to the next invocation
+        discard_connection()
         error_msg = f"Error during forecast refresh: {str(e)}"
         print(f"❌ {error_msg}")
         print("Traceback:")
@@ -185,6 +114,6 @@ def lambda_handler(event: dict, context) -> dict:
         
         return {
             "statusCode": 500,
-            "body": json.dumps({"error": error_msg})
+            "body": json.dumps({"error": error_msg, "init": init})
         }
 
@@ -15,7 +15,6 @@ set -e
 # Script is at project root level
 PROJECT_ROOT="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
 WEATHER_DIR="$PROJECT_ROOT/weather"
-SQL_OUTPUT_FILE="$WEATHER_DIR/snotel_import.sql"
 
 # Default parameters
 DURATION="DAILY"
@@ -158,11 +157,13 @@ DATABASE_URL="${DATABASE_URL//host.docker.internal/localhost}"
 export DATABASE_URL
 
 echo ""
-echo "Step 1: Collecting SNOTEL data from USDA API..."
+echo "Collecting SNOTEL data from USDA API and loading into database..."
 echo "------------------------------------------"
 
 # Run the Python collector script from the weather directory
 # Note: API_END_DATE is END_DATE + 1 day because the API treats end date as exclusive
+# --load writes everything in one transaction (COPY into staging + one merge);
+# --stream fetches and parses station by station so long backfills stay small in memory
 cd "$WEATHER_DIR"
 
 # Build the Python command with optional resort filter
@@ -170,126 +171,15 @@ PYTHON_CMD="python3 snotel_data_collector.py \
     --begin-date \"$BEGIN_DATE\" \
     --end-date \"$API_END_DATE\" \
     --duration \"$DURATION\" \
-    --output \"$SQL_OUTPUT_FILE\""
+    --load \
+    --stream"
 
 if [ -n "$RESORT" ]; then
     PYTHON_CMD="$PYTHON_CMD --resort \"$RESORT\""
 fi
 
 eval $PYTHON_CMD
-
-if [ ! -f "$SQL_OUTPUT_FILE" ]; then
-    echo "❌ Error: SQL file was not generated"
-    exit 1
-fi
-
-# Count the number of observation inserts
-OBS_COUNT=$(grep -c "INSERT INTO WEATHER_DATA.snotel_observations" "$SQL_OUTPUT_FILE" || echo "0")
-echo ""
-echo "✅ Generated SQL with $OBS_COUNT observation records"
-
-echo ""
-echo "Step 2: Executing SQL against database..."
-echo "------------------------------------------"
-
-# Execute the SQL file against the database using psql or Python
-# First, try using psql if available
-if command -v psql &> /dev/null; then
-    echo "Using psql to execute SQL..."
-    psql "$DATABASE_URL" -f "$SQL_OUTPUT_FILE"
-    EXEC_STATUS=$?
-else
-    echo "psql not found, using Python to execute SQL..."
-    
-    # Create a temporary Python script to execute the SQL
-    python3 << 'PYTHON_SCRIPT'
-import os
-import sys
-from pathlib import Path
-from urllib.parse import urlparse, unquote
-
-# Add project root to path for imports
-project_root = Path(__file__).parent.parent if '__file__' in dir() else Path.cwd().parent
-sys.path.insert(0, str(project_root))
-
-try:
-    import psycopg2
-except ImportError:
-    try:
-        import psycopg as psycopg2
-    except ImportError:
-        print("❌ Error: Neither psycopg2 nor psycopg installed")
-        sys.exit(1)
-
-def get_db_connection():
-    """Create database connection from DATABASE_URL"""
-    database_url = os.getenv('DATABASE_URL')
-    if not database_url:
-        raise ValueError("DATABASE_URL not set")
-    
-    parsed = urlparse(database_url)
-    db_password = unquote(parsed.password) if parsed.password else None
-    if db_password and '%' in db_password:
-        db_password = unquote(db_password)
-    
-    return psycopg2.connect(
-        host=parsed.hostname or 'localhost',
-        port=parsed.port or 5432,
-        user=parsed.username,
-        password=db_password,
-        dbname=parsed.path.lstrip('/'),
-        sslmode='prefer'
-    )
-
-def execute_sql_file(sql_file_path):
-    """Execute SQL file against the database"""
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    
-    with open(sql_file_path, 'r') as f:
-        sql_content = f.read()
-    
-    # Split by semicolon and execute each statement
-    statements = [stmt.strip() for stmt in sql_content.split(';') if stmt.strip()]
-    
-    success_count = 0
-    error_count = 0
-    
-    for i, statement in enumerate(statements):
-        if statement and not statement.startswith('--'):
-            try:
-                cursor.execute(statement)
-                success_count += 1
-            except Exception as e:
-                error_count += 1
-                # Only print errors for actual failures, not comments
-                if 'INSERT' in statement or 'CREATE' in statement:
-                    print(f"  ⚠️  Warning on statement {i+1}: {str(e)[:100]}")
-    
-    conn.commit()
-    cursor.close()
-    conn.close()
-    
-    print(f"✅ Executed {success_count} statements successfully")
-    if error_count > 0:
-        print(f"⚠️  {error_count} statements had warnings/errors")
-
-# Execute the SQL file
-script_dir = os.path.dirname(os.path.abspath(__file__)) if '__file__' in dir() else os.getcwd()
-sql_file = os.path.join(os.getcwd(), 'snotel_import.sql')
-if os.path.exists(sql_file):
-    execute_sql_file(sql_file)
-else:
-    # Try the weather directory
-    sql_file = os.path.join(os.getcwd(), 'weather', 'snotel_import.sql')
-    if os.path.exists(sql_file):
-        execute_sql_file(sql_file)
-    else:
-        print(f"❌ SQL file not found")
-        sys.exit(1)
-PYTHON_SCRIPT
-    EXEC_STATUS=$?
-fi
+EXEC_STATUS=$?
 
 if [ $EXEC_STATUS -eq 0 ]; then
     echo ""
@@ -300,12 +190,11 @@ if [ $EXEC_STATUS -eq 0 ]; then
     echo "Data imported:"
     echo "  - Date Range: $BEGIN_DATE to $END_DATE"
     echo "  - Duration: $DURATION"
-    echo "  - Observations: $OBS_COUNT records"
     echo ""
     echo "Query the data:"
     echo "  SELECT * FROM WEATHER_DATA.v_resort_weather WHERE resort_name = 'Copper';"
 else
     echo ""
-    echo "❌ Error executing SQL (exit code: $EXEC_STATUS)"
+    echo "❌ Error loading SNOTEL data (exit code: $EXEC_STATUS)"
     exit $EXEC_STATUS
 fi
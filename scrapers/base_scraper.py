@@ -1,14 +1,78 @@
 import common
+import json
 import os
+import re
+import threading
+import time
 import traceback
 from abc import ABC, abstractmethod
-from selenium import webdriver
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.chrome.options import Options as ChromeOptions
+from driver_pool import create_driver, get_chrome_options
+
+
+# Browserless fetch path for scrapers whose data is in the server-rendered HTML
+HTTP_FETCH_ENABLED = os.environ.get("SCRAPER_HTTP_FETCH", "true").lower() in ("1", "true", "yes")
+HTTP_FETCH_TIMEOUT = float(os.environ.get("SCRAPER_HTTP_TIMEOUT", "15"))
+# Polling interval for the wait_for_* helpers
+WAIT_POLL_INTERVAL = 0.1
+HTTP_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36"
+    ),
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.9",
+}
+
+_http_session = None
+_http_session_lock = threading.Lock()
+
+
+def get_http_session() -> requests.Session:
+    """Shared keep-alive HTTP session (connection pool + retries) for all scrapers"""
+    global _http_session
+    with _http_session_lock:
+        if _http_session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=16,
+                pool_maxsize=16,
+                max_retries=Retry(total=2, backoff_factor=0.5, status_forcelist=(429, 502, 503, 504)),
+            )
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            session.headers.update(HTTP_HEADERS)
+            _http_session = session
+        return _http_session
+
+
+def extract_js_object(page_source: str, variable: str):
+    """Parse a `variable = {...};` JSON object embedded in a page's scripts (None if absent)"""
+    pattern = re.escape(variable) + r'\s*=\s*(\{.*?\});'
+    match = re.search(pattern, page_source, re.DOTALL)
+    if not match:
+        return None
+    return json.loads(match.group(1))
 
 
 class BaseScraper(ABC):
     """Base scraper class with shared functionality for all resort scrapers"""
     
+    # Subclasses whose data is a JS object in the server-rendered HTML (e.g.
+    # 'FR.TerrainStatusFeed') name it here; the page is then fetched with a
+    # plain HTTP GET and the object kept as page_data, before any browser starts
+    page_data_variable = None
+    
+    @property
+    def use_http_fetch(self) -> bool:
+        """Try the HTTP path first (subclasses with their own parse_http_response may override)"""
+        return self.page_data_variable is not None
+    
     def __init__(self, resort_name: str, website_url: str):
         self.resort_name = resort_name
         self.website_url = website_url
@@ -22,68 +86,67 @@ class BaseScraper(ABC):
         self.use_local_driver = os.environ.get("SELENIUM_HOST", "").lower() in ("", "local", "localhost")
         
         self.driver = None
+        # Optional DriverPool shared across scrapers (see run_all_scrapers.py)
+        self.driver_pool = None
+        self.driver_broken = False
+        # Set by abort() when the orchestrator gives up on this scrape
+        self.aborted = threading.Event()
+        self._driver_lock = threading.Lock()
+        # Data pulled from the page, kept for both parse_lifts() and parse_runs()
+        self.page_data = None
     
     def get_chrome_options(self) -> ChromeOptions:
         """Configure Chrome options for Selenium Grid"""
-        chrome_options = ChromeOptions()
-        
-        # Essential flags for containerized Chrome
-        chrome_options.add_argument("--headless")
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        chrome_options.add_argument("--disable-gpu")
-        chrome_options.add_argument("--disable-extensions")
-        chrome_options.add_argument("--disable-background-timer-throttling")
-        chrome_options.add_argument("--disable-backgrounding-occluded-windows")
-        chrome_options.add_argument("--disable-renderer-backgrounding")
-        chrome_options.add_argument("--disable-web-security")
-        chrome_options.add_argument("--disable-features=VizDisplayCompositor")
-        chrome_options.add_argument("--window-size=1920,1080")
-        
-        return chrome_options
+        return get_chrome_options()
     
     def connect_to_selenium(self) -> bool:
-        """Initialize connection to Selenium Grid or local Chrome driver"""
+        """Lease a browser from the driver pool, or start a local Chrome / Grid session"""
         try:
-            if self.use_local_driver:
-                print("Using local Chrome/Chromium driver")
-                from selenium.webdriver.chrome.service import Service as ChromeService
-                
-                chrome_options = self.get_chrome_options()
-                
-                # Check for Chromium binary path (for Docker/ECS)
-                chrome_bin = os.environ.get("CHROME_BIN")
-                if chrome_bin:
-                    chrome_options.binary_location = chrome_bin
-                    print(f"Using Chrome binary: {chrome_bin}")
-                
-                # Check for ChromeDriver path (for Docker/ECS)
-                chromedriver_path = os.environ.get("CHROMEDRIVER_PATH")
-                if chromedriver_path:
-                    service = ChromeService(executable_path=chromedriver_path)
-                    print(f"Using ChromeDriver: {chromedriver_path}")
-                    self.driver = webdriver.Chrome(service=service, options=chrome_options)
-                else:
-                    # Use chromedriver from PATH
-                    self.driver = webdriver.Chrome(options=chrome_options)
-                
-                print("Local Chrome driver initialized successfully")
+            if self.driver_pool is not None:
+                driver = self.driver_pool.acquire()
+                print("Using pooled browser session")
             else:
-                print(f"Connecting to Selenium Grid at {self.selenium_url}")
-                
-                chrome_options = self.get_chrome_options()
-                self.driver = webdriver.Remote(
-                    command_executor=self.selenium_url,
-                    options=chrome_options
-                )
-                print("Connected to Selenium Grid successfully")
-            return True
+                driver = create_driver()
+            with self._driver_lock:
+                if not self.aborted.is_set():
+                    self.driver = driver
+                    return True
+            # Timed out while the browser was starting: don't keep it
+            self._close_driver(driver, broken=True)
+            print("Scrape was aborted, not using the new browser")
+            return False
         except Exception as e:
             print(f"Failed to connect to Selenium: {e}")
             import traceback
             traceback.print_exc()
             return False
     
+    def parse_http_response(self, html: str) -> bool:
+        """Keep what parse_lifts/parse_runs need from fetched HTML; False falls back to Selenium"""
+        if self.page_data_variable is None:
+            return False
+        try:
+            self.page_data = extract_js_object(html, self.page_data_variable)
+        except ValueError as e:
+            print(f"⚠️ Could not parse {self.page_data_variable}: {e}")
+            return False
+        return self.page_data is not None
+    
+    def fetch_with_http(self) -> bool:
+        """Fetch the page without a browser; returns False if Selenium is still needed"""
+        try:
+            print(f"Fetching {self.resort_name} page over HTTP...")
+            response = get_http_session().get(self.website_url, timeout=HTTP_FETCH_TIMEOUT)
+            response.raise_for_status()
+            if self.parse_http_response(response.text):
+                print(f"✓ Page data found over HTTP ({len(response.content)} bytes), skipping browser")
+                return True
+            print("⚠️  Page data not found in HTTP response, falling back to Selenium")
+        except Exception as e:
+            print(f"⚠️  HTTP fetch failed, falling back to Selenium: {e}")
+        self.page_data = None
+        return False
+    
     def navigate_to_website(self) -> bool:
         """Navigate to the resort website"""
         try:
@@ -95,8 +158,97 @@ class BaseScraper(ABC):
             print(f"Failed to navigate to website: {e}")
             return False
     
+    # ------------------------------------------------------------------
+    # Wait helpers: return as soon as the page is ready instead of sleeping
+    # for the worst case. Each returns True when the condition was met and
+    # False on timeout (never raises), so callers can warn and carry on.
+    # ------------------------------------------------------------------
+    
+    def wait_until(self, condition, timeout: float = 10, description: str = "condition") -> bool:
+        """Poll `condition(driver)` until it returns something truthy"""
+        try:
+            WebDriverWait(self.driver, timeout, poll_frequency=WAIT_POLL_INTERVAL).until(condition)
+            return True
+        except TimeoutException:
+            print(f"⚠️ Timed out after {timeout}s waiting for {description}")
+            return False
+    
+    def wait_for_document_ready(self, timeout: float = 10) -> bool:
+        """Wait for document.readyState == 'complete'"""
+        return self.wait_until(
+            lambda driver: driver.execute_script("return document.readyState") == "complete",
+            timeout, "document ready",
+        )
+    
+    def wait_for_js_variable(self, expression: str, timeout: float = 10) -> bool:
+        """Wait until a JavaScript expression (e.g. 'FR.TerrainStatusFeed') is defined"""
+        script = f"try {{ return typeof ({expression}) !== 'undefined'; }} catch (e) {{ return false; }}"
+        return self.wait_until(lambda driver: driver.execute_script(script), timeout, expression)
+    
+    def wait_for_stable_count(
+        self,
+        by: str,
+        selector: str,
+        min_count: int = 1,
+        stable_for: float = 0.5,
+        timeout: float = 10,
+        root=None,
+    ) -> int:
+        """Wait until at least `min_count` elements match and the count stops changing
+        
+        Useful for lists that render in batches. Searches within `root` (an
+        element) when given. Returns the final count (0 if nothing appeared).
+        """
+        search = root if root is not None else self.driver
+        deadline = time.monotonic() + timeout
+        last_count = -1
+        stable_since = time.monotonic()
+        
+        while True:
+            try:
+                count = len(search.find_elements(by, selector))
+            except WebDriverException:
+                count = 0
+            now = time.monotonic()
+            if count != last_count:
+                last_count, stable_since = count, now
+            elif count >= min_count and now - stable_since >= stable_for:
+                return count
+            if now >= deadline:
+                print(f"⚠️ Timed out after {timeout}s waiting for '{selector}' to settle ({count} found)")
+                return count
+            time.sleep(WAIT_POLL_INTERVAL)
+    
+    def wait_for_network_idle(self, idle_for: float = 0.5, timeout: float = 10) -> bool:
+        """Wait until the page is loaded and no new resources have been fetched for `idle_for` seconds"""
+        script = (
+            "return document.readyState === 'complete' ? "
+            "performance.getEntriesByType('resource').length : -1;"
+        )
+        deadline = time.monotonic() + timeout
+        last_count = None
+        idle_since = time.monotonic()
+        
+        while True:
+            try:
+                count = self.driver.execute_script(script)
+            except WebDriverException:
+                count = -1
+            now = time.monotonic()
+            if count != last_count or count < 0:
+                last_count, idle_since = count, now
+            elif now - idle_since >= idle_for:
+                return True
+            if now >= deadline:
+                print(f"⚠️ Timed out after {timeout}s waiting for network idle")
+                return False
+            time.sleep(WAIT_POLL_INTERVAL)
+    
     def save_data(self, lifts: list, runs: list) -> str:
         """Save scraped data to database"""
+        if self.aborted.is_set():
+            # Already reported as failed; a late result must not be written
+            raise RuntimeError(f"{self.resort_name} scrape was aborted, not saving data")
         try:
             json_string = common.prepareAndSaveData(lifts, runs, self.resort_name.lower())
             print("Data successfully saved to database")
@@ -106,13 +258,29 @@ class BaseScraper(ABC):
             raise
     
     def cleanup(self):
-        """Clean up WebDriver resources"""
-        if self.driver:
-            try:
-                self.driver.quit()
-                print("Driver closed successfully")
-            except:
-                print("Error closing driver (may have already been closed)")
+        """Clean up WebDriver resources (pooled drivers go back to the pool)"""
+        with self._driver_lock:
+            driver, self.driver = self.driver, None
+        if driver:
+            self._close_driver(driver, broken=self.driver_broken)
+    
+    def abort(self):
+        """Give up on a running scrape: quit its browser so it errors out, and block saving"""
+        with self._driver_lock:
+            self.aborted.set()
+            driver, self.driver = self.driver, None
+        if driver:
+            self._close_driver(driver, broken=True)
+    
+    def _close_driver(self, driver, broken: bool = False):
+        if self.driver_pool is not None:
+            self.driver_pool.release(driver, broken=broken)
+            return
+        try:
+            driver.quit()
+            print("Driver closed successfully")
+        except:
+            print("Error closing driver (may have already been closed)")
     
     @abstractmethod
     def parse_lifts(self) -> list:
@@ -124,22 +292,30 @@ class BaseScraper(ABC):
         """Parse runs data from website - must be implemented by subclasses"""
         pass
     
-    def scrape(self) -> dict:
+    def scrape(self, driver_pool=None) -> dict:
         """Main scraping method that orchestrates the entire process"""
+        self.driver_pool = driver_pool
+        self.driver_broken = False
+        self.aborted.clear()
+        self.page_data = None
         try:
-            # Connect to Selenium Grid
-            if not self.connect_to_selenium():
-                return {
-                    "statusCode": 500,
-                    "body": "Failed to connect to Selenium Grid"
-                }
+            # Server-rendered resorts can skip the browser entirely
+            fetched_over_http = self.use_http_fetch and HTTP_FETCH_ENABLED and self.fetch_with_http()
             
-            # Navigate to website
-            if not self.navigate_to_website():
-                return {
-                    "statusCode": 500,
-                    "body": "Failed to navigate to website"
-                }
+            if not fetched_over_http:
+                # Connect to Selenium Grid
+                if not self.connect_to_selenium():
+                    return {
+                        "statusCode": 500,
+                        "body": "Failed to connect to Selenium Grid"
+                    }
+                
+                # Navigate to website
+                if not self.navigate_to_website():
+                    return {
+                        "statusCode": 500,
+                        "body": "Failed to navigate to website"
+                    }
             
             # Parse data using subclass implementations
             lifts = self.parse_lifts()
@@ -158,6 +334,9 @@ class BaseScraper(ABC):
             }
             
         except Exception as e:
+            # A WebDriver error may mean the browser crashed; don't hand it to the next site
+            if isinstance(e, WebDriverException):
+                self.driver_broken = True
             print("Exception occurred during scraping:")
             print(f"Error type: {type(e).__name__}")
             print(f"Error message: {str(e)}")
@@ -84,63 +84,192 @@ def get_db_connection():
         conn_params['database'] = db_name
         return psycopg2.connect(**conn_params)
 
-def prepareAndSaveData(lifts: list[dict], runs: list[dict], location: str):
+def values_list(rows: list[tuple]) -> tuple[str, list]:
+    """Placeholders and flattened params for a multi-row VALUES list"""
+    row_placeholder = "(" + ", ".join(["%s"] * len(rows[0])) + ")"
+    return ", ".join([row_placeholder] * len(rows)), [value for row in rows for value in row]
+
+def insert_rows(cursor, table: str, columns: list[str], rows: list[tuple]):
+    """Insert many rows with a single multi-row INSERT ... VALUES statement
+
+    One round trip per table instead of one per row; works with both
+    psycopg 3 and psycopg2 (execute_values is psycopg2-only).
+    """
+    if not rows:
+        return
+    values, params = values_list(rows)
+    cursor.execute(f"INSERT INTO {table} ({', '.join(columns)}) VALUES {values}", params)
+
+# How scrapes are persisted (env SCRAPER_WRITE_MODE):
+#   append - a full snapshot row per lift/run per scrape in SKI_DATA.lifts / runs
+#   diff   - only status changes, as intervals in SKI_DATA.lift_status_intervals /
+#            run_status_intervals (SKI_DATA.v_lifts_daily / v_runs_daily rebuild
+#            the per-day rows)
+WRITE_MODES = ("append", "diff")
+
+LIFT_HISTORY = {
+    "snapshots": "SKI_DATA.lifts",
+    "intervals": "SKI_DATA.lift_status_intervals",
+    "current": "SKI_DATA.lifts_current",
+    "name": "lift_name",
+    "state": ["lift_status", "lift_type"],
+}
+RUN_HISTORY = {
+    "snapshots": "SKI_DATA.runs",
+    "intervals": "SKI_DATA.run_status_intervals",
+    "current": "SKI_DATA.runs_current",
+    "name": "run_name",
+    "state": ["run_difficulty", "run_status", "run_area", "run_groomed"],
+}
+
+def get_write_mode():
+    """Get SCRAPER_WRITE_MODE from environment (default: append)"""
+    load_dotenv(dotenv_path=env_path)
+    return os.getenv('SCRAPER_WRITE_MODE', 'append').strip().lower()
+
+# Status values scrapers report for an open lift/run, besides True itself
+OPEN_STATUS_VALUES = ("true", "open", "1")
+
+def is_open_status(status) -> bool:
+    """Normalize a scraped lift/run status to the BOOLEAN stored in the database"""
+    if isinstance(status, bool):
+        return status
+    return str(status).strip().lower() in OPEN_STATUS_VALUES
+
+def history_columns(history: dict) -> list[str]:
+    """Column order of the row tuples built by prepareAndSaveData"""
+    return ["location", history["name"], *history["state"], "updated_date", "updated_at"]
+
+def save_status_intervals(cursor, history: dict, rows: list[tuple], location: str, saved_at: str) -> int:
+    """Record one scrape as change-only intervals; returns how many intervals were opened
+
+    Incoming rows are compared with each item's open interval (its current
+    state). Unchanged items only extend last_seen_*; changed items get their
+    interval closed and a new one opened; unseen items get a new interval.
+    The current-state table is then refreshed from the intervals this scrape
+    touched, since no snapshot rows are inserted for its trigger to pick up.
+    """
+    if not rows:
+        return 0
+    intervals, current, name, state = history["intervals"], history["current"], history["name"], history["state"]
+    values, params = values_list(rows)
+    incoming = f"(VALUES {values}) AS v({', '.join(history_columns(history))})"
+    state_columns = ", ".join(state)
+
+    # 1. Extend unchanged open intervals, close the ones whose state changed
+    cursor.execute(f"""
+        UPDATE {intervals} AS i SET
+            last_seen_date = CASE WHEN n.changed THEN i.last_seen_date ELSE n.updated_date END,
+            last_seen_at = CASE WHEN n.changed THEN i.last_seen_at ELSE n.seen_at END,
+            closed_at = CASE WHEN n.changed THEN n.seen_at END
+        FROM (
+            SELECT
+                cur.id,
+                ({", ".join("cur." + c for c in state)}) IS DISTINCT FROM ({", ".join("v." + c for c in state)}) AS changed,
+                v.updated_date,
+                v.updated_at::timestamp AS seen_at
+            FROM {incoming}
+            JOIN {intervals} cur
+              ON cur.closed_at IS NULL AND cur.location = v.location AND cur.{name} = v.{name}
+        ) AS n
+        WHERE i.id = n.id AND n.seen_at >= i.last_seen_at
+    """, params)
+
+    # 2. Open an interval for every item that no longer has one
+    cursor.execute(f"""
+        INSERT INTO {intervals}
+            (location, {name}, {state_columns}, start_date, last_seen_date, opened_at, last_seen_at)
+        SELECT
+            v.location, v.{name}, {", ".join("v." + c for c in state)},
+            v.updated_date, v.updated_date, v.updated_at::timestamp, v.updated_at::timestamp
+        FROM {incoming}
+        WHERE NOT EXISTS (
+            SELECT 1 FROM {intervals} cur
+            WHERE cur.closed_at IS NULL AND cur.location = v.location AND cur.{name} = v.{name}
+        )
+    """, params)
+    opened = cursor.rowcount
+
+    # 3. Refresh the current-state table from the intervals seen by this scrape
+    cursor.execute(f"""
+        INSERT INTO {current} AS cur
+            (id, location, {name}, {state_columns}, updated_date, created_at, updated_at)
+        SELECT id, location, {name}, {state_columns}, last_seen_date, opened_at, last_seen_at
+        FROM {intervals}
+        WHERE closed_at IS NULL AND location = %s AND last_seen_at = %s::timestamp
+        ON CONFLICT (location, {name}) DO UPDATE SET
+            id = EXCLUDED.id,
+            {", ".join(f"{c} = EXCLUDED.{c}" for c in state)},
+            updated_date = EXCLUDED.updated_date,
+            created_at = EXCLUDED.created_at,
+            updated_at = EXCLUDED.updated_at
+        WHERE (EXCLUDED.updated_date, EXCLUDED.updated_at)
+           >= (cur.updated_date, COALESCE(cur.updated_at, '-infinity'))
+    """, [location, saved_at])
+    return opened
+
+def prepareAndSaveData(lifts: list[dict], runs: list[dict], location: str, write_mode: str = None):
     """Prepare data and save to PostgreSQL database
     
     Note: Assumes SSH tunnel is already running separately.
     Connect to localhost:5432 (or port specified in DATABASE_URL).
+    write_mode overrides SCRAPER_WRITE_MODE ("append" or "diff").
     """
+    write_mode = (write_mode or get_write_mode()).lower()
+    if write_mode not in WRITE_MODES:
+        raise ValueError(f"Unknown write mode '{write_mode}' (expected one of: {', '.join(WRITE_MODES)})")
+    
     # Deduplicate lifts and runs
-    lifts_set = {each['liftName']: each for each in lifts}.values()
-    runs_set = {each['runName']: each for each in runs}.values()
+    lifts_set = list({each['liftName']: each for each in lifts}.values())
+    runs_set = list({each['runName']: each for each in runs}.values())
     
-    # Get current date
+    # Get current date; every row from this scrape shares one timestamp
     now = dt.now(tz=timezone("America/Denver"))
     formatted_date = now.strftime("%Y-%m-%d")
+    scraped_date = now.date()
+    saved_at = dt.now().isoformat()
+    
+    lift_rows = [
+        (
+            location,
+            lift['liftName'],
+            is_open_status(lift['liftStatus']),
+            lift.get('liftType', 'Unknown'),
+            scraped_date,
+            saved_at,
+        )
+        for lift in lifts_set
+    ]
+    run_rows = [
+        (
+            location,
+            run['runName'],
+            run.get('runDifficulty', 'Unknown'),
+            is_open_status(run['runStatus']),
+            run.get('runArea', ''),
+            bool(run.get('runGroomed', False)),
+            scraped_date,
+            saved_at,
+        )
+        for run in runs_set
+    ]
     
     # Save to database (assumes tunnel is already running)
     conn = get_db_connection()
     cursor = conn.cursor()
     
     try:
-        # Save lifts
-        for lift in list(lifts_set):
-            lift_status = str(lift['liftStatus']).lower()
-            cursor.execute('''
-            INSERT INTO SKI_DATA.lifts 
-            (location, lift_name, lift_status, lift_type, updated_date, updated_at) 
-            VALUES (%s, %s, %s, %s, %s, %s)
-            ''', (
-                location,
-                lift['liftName'],
-                lift_status,
-                lift.get('liftType', 'Unknown'),
-                formatted_date,
-                dt.now().isoformat()
-            ))
-        
-        # Save runs
-        for run in list(runs_set):
-            run_status = str(run['runStatus']).lower()
-            run_groomed = run.get('runGroomed', False)
-            cursor.execute('''
-            INSERT INTO SKI_DATA.runs 
-            (location, run_name, run_difficulty, run_status, 
-             updated_date, run_area, run_groomed, updated_at) 
-            VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-            ''', (
-                location,
-                run['runName'],
-                run.get('runDifficulty', 'Unknown'),
-                run_status,
-                formatted_date,
-                run.get('runArea', ''),
-                run_groomed,
-                dt.now().isoformat()
-            ))
-        
-        conn.commit()
-        print(f"Saved {len(list(lifts_set))} lifts and {len(list(runs_set))} runs to database")
+        if write_mode == "diff":
+            opened_lifts = save_status_intervals(cursor, LIFT_HISTORY, lift_rows, location, saved_at)
+            opened_runs = save_status_intervals(cursor, RUN_HISTORY, run_rows, location, saved_at)
+            conn.commit()
+            print(f"Saved {len(lift_rows)} lifts and {len(run_rows)} runs to database "
+                  f"({opened_lifts} lift and {opened_runs} run intervals opened)")
+        else:
+            for history, rows in ((LIFT_HISTORY, lift_rows), (RUN_HISTORY, run_rows)):
+                insert_rows(cursor, history["snapshots"], history_columns(history), rows)
+            conn.commit()
+            print(f"Saved {len(lift_rows)} lifts and {len(run_rows)} runs to database")
     except Exception as e:
         conn.rollback()
         print(f"Error saving data: {e}")
@@ -153,8 +282,8 @@ def prepareAndSaveData(lifts: list[dict], runs: list[dict], location: str):
     message = {
         "updatedDate": formatted_date,
         "location": location,
-        "lifts": list(lifts_set),
-        "runs": list(runs_set)
+        "lifts": lifts_set,
+        "runs": runs_set
     }
     print(f"Data saved to database for {location}: {len(lifts_set)} lifts, {len(runs_set)} runs")
     return json.dumps(message)
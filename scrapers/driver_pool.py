@@ -0,0 +1,242 @@
+import os
+import threading
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options as ChromeOptions
+
+
+# Recycle a browser after this many scrapes to bound memory growth and leaks
+DRIVER_MAX_USES = int(os.environ.get("SCRAPER_DRIVER_MAX_USES", "4"))
+
+
+def get_chrome_options() -> ChromeOptions:
+    """Configure Chrome options for Selenium Grid"""
+    chrome_options = ChromeOptions()
+
+    # Essential flags for containerized Chrome
+    chrome_options.add_argument("--headless")
+    chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+    chrome_options.add_argument("--disable-gpu")
+    chrome_options.add_argument("--disable-extensions")
+    chrome_options.add_argument("--disable-background-timer-throttling")
+    chrome_options.add_argument("--disable-backgrounding-occluded-windows")
+    chrome_options.add_argument("--disable-renderer-backgrounding")
+    chrome_options.add_argument("--disable-web-security")
+    chrome_options.add_argument("--disable-features=VizDisplayCompositor")
+    chrome_options.add_argument("--window-size=1920,1080")
+
+    return chrome_options
+
+
+def create_driver():
+    """Start a local Chrome/Chromium driver or a Selenium Grid session, based on SELENIUM_HOST"""
+    selenium_host = os.environ.get("SELENIUM_HOST", "selenium-hub")
+    selenium_port = os.environ.get("SELENIUM_PORT", "4444")
+    selenium_url = f"http://{selenium_host}:{selenium_port}/wd/hub"
+
+    # Use local Chrome driver if SELENIUM_HOST is not set or set to "local"
+    use_local_driver = os.environ.get("SELENIUM_HOST", "").lower() in ("", "local", "localhost")
+    chrome_options = get_chrome_options()
+
+    if use_local_driver:
+        print("Using local Chrome/Chromium driver")
+        from selenium.webdriver.chrome.service import Service as ChromeService
+
+        # Check for Chromium binary path (for Docker/ECS)
+        chrome_bin = os.environ.get("CHROME_BIN")
+        if chrome_bin:
+            chrome_options.binary_location = chrome_bin
+            print(f"Using Chrome binary: {chrome_bin}")
+
+        # Check for ChromeDriver path (for Docker/ECS)
+        chromedriver_path = os.environ.get("CHROMEDRIVER_PATH")
+        if chromedriver_path:
+            service = ChromeService(executable_path=chromedriver_path)
+            print(f"Using ChromeDriver: {chromedriver_path}")
+            driver = webdriver.Chrome(service=service, options=chrome_options)
+        else:
+            # Use chromedriver from PATH
+            driver = webdriver.Chrome(options=chrome_options)
+
+        print("Local Chrome driver initialized successfully")
+        return driver
+
+    print(f"Connecting to Selenium Grid at {selenium_url}")
+    driver = webdriver.Remote(
+        command_executor=selenium_url,
+        options=chrome_options
+    )
+    print("Connected to Selenium Grid successfully")
+    return driver
+
+
+def reset_driver(driver):
+    """Return a browser to a blank state between sites (extra tabs, cookies, storage)"""
+    # Close any tabs/windows a scraper opened, keeping the first one
+    handles = driver.window_handles
+    for handle in handles[1:]:
+        driver.switch_to.window(handle)
+        driver.close()
+    driver.switch_to.window(handles[0])
+
+    # Web storage can only be cleared while still on the site's origin
+    try:
+        driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+    except Exception:
+        pass
+
+    # CDP clears cookies for every domain; Grid sessions only expose the current one
+    try:
+        driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+    except Exception:
+        driver.delete_all_cookies()
+
+    driver.get("about:blank")
+
+
+class DriverPool:
+    """Thread-safe pool of reusable WebDriver sessions shared by scrapers
+
+    acquire() hands out an idle browser (or starts one); release() resets it
+    for the next site. A browser is quit instead of reused once it has served
+    `max_uses` scrapes, or when it crashed or can't be reset.
+
+    At most `max_size` browsers (leased + idle) are alive at once; acquire()
+    waits for a free slot when the limit is reached.
+    """
+
+    def __init__(self, max_uses: int = DRIVER_MAX_USES, factory=create_driver, max_size: int = 1):
+        self.max_uses = max(1, max_uses)
+        self.max_size = max(1, max_size)
+        self.factory = factory
+        self._idle = []
+        self._uses = {}
+        self._leased = set()
+        self._starting = 0
+        self._lock = threading.Lock()
+        self._available = threading.Condition(self._lock)
+        self._closed = False
+        self.created = 0
+        self.recycled = 0
+
+    def acquire(self):
+        """Lease a healthy driver, starting a new browser if none is idle"""
+        while True:
+            with self._available:
+                while not self._closed and not self._idle and self._live() >= self.max_size:
+                    self._available.wait()
+                if self._closed:
+                    raise RuntimeError("Driver pool is closed")
+                if self._idle:
+                    driver = self._idle.pop()
+                    self._leased.add(driver)
+                else:
+                    driver = None
+                    self._starting += 1
+
+            if driver is None:
+                try:
+                    driver = self.factory()
+                except Exception:
+                    with self._available:
+                        self._starting -= 1
+                        self._available.notify()
+                    raise
+                with self._available:
+                    self._starting -= 1
+                    closed = self._closed
+                    if not closed:
+                        self._uses[driver] = 0
+                        self._leased.add(driver)
+                        self.created += 1
+                    self._available.notify()
+                if closed:
+                    # close() ran while this browser was starting
+                    driver.quit()
+                    raise RuntimeError("Driver pool is closed")
+            elif not self._is_alive(driver):
+                print("⚠️  Pooled browser is no longer responding, starting a new one")
+                self._discard(driver)
+                continue
+
+            with self._lock:
+                self._uses[driver] += 1
+            return driver
+
+    def release(self, driver, broken: bool = False):
+        """Return a leased driver; it is reset for reuse or quit if worn out/broken
+
+        Releasing a driver that was already discarded (e.g. quit by a timeout
+        and then released again by its scraper) is a no-op.
+        """
+        with self._lock:
+            if driver not in self._uses:
+                return
+            worn_out = self._uses.get(driver, self.max_uses) >= self.max_uses
+            closed = self._closed
+
+        if broken or worn_out or closed:
+            self._discard(driver)
+            return
+
+        try:
+            reset_driver(driver)
+        except Exception as e:
+            print(f"⚠️  Could not reset browser, recycling it: {e}")
+            self._discard(driver)
+            return
+
+        with self._available:
+            if self._closed or driver not in self._uses:
+                discard = True
+            else:
+                discard = False
+                self._leased.discard(driver)
+                self._idle.append(driver)
+                self._available.notify()
+        if discard:
+            self._discard(driver)
+
+    def close(self):
+        """Quit every browser, including any still leased by a stuck scraper"""
+        with self._available:
+            self._closed = True
+            drivers = self._idle + list(self._leased)
+            self._idle = []
+            self._leased = set()
+            self._available.notify_all()
+        for driver in drivers:
+            self._discard(driver, recycled=False)
+        print(f"Driver pool closed ({self.created} browsers started, {self.recycled} recycled)")
+
+    def _live(self) -> int:
+        """Browsers alive or starting (call with the lock held)"""
+        return len(self._idle) + len(self._leased) + self._starting
+
+    def _discard(self, driver, recycled: bool = True):
+        with self._available:
+            if self._uses.pop(driver, None) is None:
+                # Already quit (e.g. by close() while its scraper was still running)
+                return
+            self._leased.discard(driver)
+            if recycled:
+                self.recycled += 1
+            self._available.notify()
+        try:
+            driver.quit()
+        except Exception as e:
+            print(f"Error closing driver (may have already been closed): {e}")
+
+    @staticmethod
+    def _is_alive(driver) -> bool:
+        try:
+            driver.current_url
+            return True
+        except Exception:
+            return False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
@@ -1,93 +1,260 @@
 #!/usr/bin/env python3
 """
-Orchestrator script to run all resort scrapers sequentially.
+Orchestrator script to run all resort scrapers.
 Designed for ECS Fargate tasks - runs all scrapers in a single container.
+
+Scrapers run sequentially by default. Set SCRAPER_WORKERS (or pass
+--workers N) to run up to N scrapers at once, each with its own browser.
+Every scraper gets SCRAPER_TIMEOUT seconds; one that hangs is reported as
+failed, its browser is quit (so the stuck scrape errors out and never
+saves) and its slot is handed to the next scraper, so a single slow site
+can't hold up the rest of the batch.
+
+Browsers come from a shared DriverPool (driver_pool.py), so the batch pays
+a handful of Chrome start-ups instead of one per resort. Set
+SCRAPER_REUSE_DRIVERS=false (or --no-reuse-drivers) to start a fresh
+browser for every scraper.
 """
 
+import argparse
+import io
 import os
 import sys
+import threading
+import time
 import traceback
+from functools import partial
 from pathlib import Path
 
 # Add scrapers directory to path
 sys.path.insert(0, str(Path(__file__).parent))
 
+from driver_pool import DriverPool
+
 # Import all scrapers
-from scraper_abasin import handler as scrape_abasin
-from scraper_copper import handler as scrape_copper
-from scraper_loveland import handler as scrape_loveland
-from scraper_winterpark import handler as scrape_winterpark
-from scraper_keystone import handler as scrape_keystone
-from scraper_breckenridge import handler as scrape_breckenridge
-from scraper_vail import handler as scrape_vail
-from scraper_steamboat import handler as scrape_steamboat
-from scraper_crestedbutte import handler as scrape_crestedbutte
-from scraper_purgatory import handler as scrape_purgatory
-from scraper_telluride import handler as scrape_telluride
-from scraper_monarch import handler as scrape_monarch
-
-# Mapping of scraper names to handler functions
+from scraper_abasin import arapahoebasin_scraper
+from scraper_copper import copper_scraper
+from scraper_loveland import loveland_scraper
+from scraper_winterpark import winterpark_scraper
+from scraper_keystone import keystone_scraper
+from scraper_breckenridge import breckenridge_scraper
+from scraper_vail import vail_scraper
+from scraper_steamboat import steamboat_scraper
+from scraper_crestedbutte import crestedbutte_scraper
+from scraper_purgatory import purgatory_scraper
+from scraper_telluride import telluride_scraper
+from scraper_monarch import monarch_scraper
+
+# Mapping of scraper names to scraper instances
 SCRAPERS = [
-    ("Arapahoe Basin", scrape_abasin),
-    ("Copper Mountain", scrape_copper),
-    ("Loveland", scrape_loveland),
-    ("Winter Park", scrape_winterpark),
-    ("Keystone", scrape_keystone),
-    ("Breckenridge", scrape_breckenridge),
-    ("Vail", scrape_vail),
-    ("Steamboat", scrape_steamboat),
-    ("Crested Butte", scrape_crestedbutte),
-    ("Purgatory", scrape_purgatory),
-    ("Telluride", scrape_telluride),
-    ("Monarch", scrape_monarch),
+    ("Arapahoe Basin", arapahoebasin_scraper),
+    ("Copper Mountain", copper_scraper),
+    ("Loveland", loveland_scraper),
+    ("Winter Park", winterpark_scraper),
+    ("Keystone", keystone_scraper),
+    ("Breckenridge", breckenridge_scraper),
+    ("Vail", vail_scraper),
+    ("Steamboat", steamboat_scraper),
+    ("Crested Butte", crestedbutte_scraper),
+    ("Purgatory", purgatory_scraper),
+    ("Telluride", telluride_scraper),
+    ("Monarch", monarch_scraper),
 ]
 
 
-def run_all_scrapers():
-    """Run all scrapers sequentially"""
+# Parallel mode settings (1 worker = the original sequential behaviour)
+SCRAPER_WORKERS = int(os.environ.get("SCRAPER_WORKERS", "1"))
+SCRAPER_TIMEOUT = float(os.environ.get("SCRAPER_TIMEOUT", "300"))
+# Share browsers between scrapers instead of starting one per resort
+SCRAPER_REUSE_DRIVERS = os.environ.get("SCRAPER_REUSE_DRIVERS", "true").lower() in ("1", "true", "yes")
+
+
+class ThreadOutputRouter(io.TextIOBase):
+    """Stdout/stderr replacement that buffers output per worker thread
+
+    Scrapers print a lot; when several run at once their lines would
+    interleave. Threads registered with capture() write into their own
+    buffer, which the orchestrator prints as one block when the scraper
+    finishes. Everything else goes straight to the real stream.
+    """
+
+    def __init__(self, stream):
+        self.stream = stream
+        self._buffers = {}
+        self._lock = threading.Lock()
+
+    def capture(self, buffer: io.StringIO):
+        with self._lock:
+            self._buffers[threading.get_ident()] = buffer
+
+    def release(self):
+        with self._lock:
+            self._buffers.pop(threading.get_ident(), None)
+
+    def write(self, text):
+        with self._lock:
+            buffer = self._buffers.get(threading.get_ident())
+            if buffer is not None:
+                return buffer.write(text)
+        return self.stream.write(text)
+
+    def flush(self):
+        self.stream.flush()
+
+
+def run_scraper(resort_name: str, scraper_func) -> bool:
+    """Run one scraper and report whether it succeeded"""
+    try:
+        result = scraper_func()
+
+        # Check if result indicates success
+        if isinstance(result, dict):
+            status_code = result.get("statusCode", 200)
+            if status_code == 200:
+                print(f"✅ {resort_name} completed successfully")
+                return True
+            print(f"⚠️  {resort_name} completed with status code {status_code}")
+            return False
+
+        print(f"✅ {resort_name} completed")
+        return True
+
+    except Exception as e:
+        print(f"❌ {resort_name} failed: {str(e)}")
+        print("Traceback:")
+        traceback.print_exc()
+        return False
+
+
+def run_sequential(scrapers) -> dict:
+    """Run scrapers one after another; returns {resort_name: succeeded}"""
+    results = {}
+    for resort_name, scraper_func in scrapers:
+        print("-" * 60)
+        print(f"Scraping {resort_name}...")
+        print("-" * 60)
+        results[resort_name] = run_scraper(resort_name, scraper_func)
+        print()
+    return results
+
+
+def run_parallel(scrapers, workers: int, timeout: float, on_timeout=None) -> dict:
+    """Run scrapers on up to `workers` threads, giving each `timeout` seconds
+
+    Workers are daemon threads gated by a semaphore. When a scraper exceeds
+    its timeout it is marked failed, `on_timeout(resort_name)` is called to
+    stop it (quit its browser) and its slot is released for the next one.
+    """
+    router = ThreadOutputRouter(sys.stdout)
+    error_router = ThreadOutputRouter(sys.stderr)
+    sys.stdout, sys.stderr = router, error_router
+    slots = threading.Semaphore(workers)
+    report_lock = threading.Lock()
+    results = {}
+    started_at = {}
+    done = {}
+    output = {}
+
+    def report(resort_name: str, succeeded: bool, note: str = ""):
+        # First report wins: a scraper finishing after its timeout is ignored
+        with report_lock:
+            if resort_name in results:
+                return
+            results[resort_name] = succeeded
+            elapsed = time.monotonic() - started_at[resort_name]
+            lines = [
+                "-" * 60,
+                f"{resort_name} ({elapsed:.1f}s){note}",
+                "-" * 60,
+                output[resort_name].getvalue().rstrip(),
+                "",
+            ]
+            router.stream.write("\n".join(lines) + "\n")
+            router.stream.flush()
+        slots.release()
+
+    def worker(resort_name: str, scraper_func):
+        router.capture(output[resort_name])
+        error_router.capture(output[resort_name])
+        try:
+            succeeded = run_scraper(resort_name, scraper_func)
+        finally:
+            router.release()
+            error_router.release()
+        report(resort_name, succeeded)
+        done[resort_name].set()
+
+    def watchdog(resort_name: str):
+        if not done[resort_name].wait(timeout):
+            print(f"⏱️  {resort_name} timed out after {timeout:.0f}s", file=output[resort_name])
+            if on_timeout is not None:
+                try:
+                    on_timeout(resort_name)
+                except Exception as e:
+                    print(f"⚠️  Could not stop {resort_name}: {e}", file=output[resort_name])
+            report(resort_name, False, " - TIMED OUT")
+
+    try:
+        threads = []
+        for resort_name, scraper_func in scrapers:
+            slots.acquire()
+            started_at[resort_name] = time.monotonic()
+            done[resort_name] = threading.Event()
+            output[resort_name] = io.StringIO()
+            threading.Thread(target=worker, args=(resort_name, scraper_func), daemon=True).start()
+            watcher = threading.Thread(target=watchdog, args=(resort_name,), daemon=True)
+            watcher.start()
+            threads.append(watcher)
+
+        for watcher in threads:
+            watcher.join()
+    finally:
+        sys.stdout, sys.stderr = router.stream, error_router.stream
+
+    return {resort_name: results[resort_name] for resort_name, _ in scrapers}
+
+
+def run_all_scrapers(
+    workers: int = SCRAPER_WORKERS,
+    timeout: float = SCRAPER_TIMEOUT,
+    reuse_drivers: bool = SCRAPER_REUSE_DRIVERS,
+):
+    """Run all scrapers, sequentially or on a bounded pool of workers"""
+    workers = max(1, min(workers, len(SCRAPERS)))
+
     print("=" * 60)
     print("Starting Resort Scraper Job")
     print("=" * 60)
     print(f"Total scrapers: {len(SCRAPERS)}")
+    if workers > 1:
+        print(f"Parallel mode: {workers} workers, {timeout:.0f}s timeout per scraper")
     print()
     
     # Set environment variable to use local Chrome driver
     os.environ["SELENIUM_HOST"] = "local"
-    
-    success_count = 0
-    failure_count = 0
-    failed_scrapers = []
-    
-    for resort_name, scraper_func in SCRAPERS:
-        print("-" * 60)
-        print(f"Scraping {resort_name}...")
-        print("-" * 60)
-        
-        try:
-            result = scraper_func()
-            
-            # Check if result indicates success
-            if isinstance(result, dict):
-                status_code = result.get("statusCode", 200)
-                if status_code == 200:
-                    print(f"✅ {resort_name} completed successfully")
-                    success_count += 1
-                else:
-                    print(f"⚠️  {resort_name} completed with status code {status_code}")
-                    failure_count += 1
-                    failed_scrapers.append(resort_name)
-            else:
-                print(f"✅ {resort_name} completed")
-                success_count += 1
-                
-        except Exception as e:
-            print(f"❌ {resort_name} failed: {str(e)}")
-            print("Traceback:")
-            traceback.print_exc()
-            failure_count += 1
-            failed_scrapers.append(resort_name)
-        
-        print()
+
+    # One pool for the whole batch, holding at most `workers` browsers
+    driver_pool = DriverPool(max_size=workers) if reuse_drivers else None
+    scrapers = [
+        (resort_name, partial(scraper.scrape, driver_pool=driver_pool))
+        for resort_name, scraper in SCRAPERS
+    ]
+    # Timed-out scrapers have their browser quit so they can't hold it or save late results
+    aborts = {resort_name: scraper.abort for resort_name, scraper in SCRAPERS}
+
+    job_started = time.monotonic()
+    try:
+        if workers > 1:
+            results = run_parallel(scrapers, workers, timeout, on_timeout=lambda name: aborts[name]())
+        else:
+            results = run_sequential(scrapers)
+    finally:
+        if driver_pool is not None:
+            driver_pool.close()
+
+    failed_scrapers = [name for name, succeeded in results.items() if not succeeded]
+    success_count = len(results) - len(failed_scrapers)
+    failure_count = len(failed_scrapers)
     
     # Summary
     print("=" * 60)
@@ -95,6 +262,7 @@ def run_all_scrapers():
     print("=" * 60)
     print(f"Successful: {success_count}")
     print(f"Failed: {failure_count}")
+    print(f"Total time: {time.monotonic() - job_started:.1f}s")
     
     if failed_scrapers:
         print(f"Failed scrapers: {', '.join(failed_scrapers)}")
@@ -108,5 +276,13 @@ def run_all_scrapers():
 
 
 if __name__ == "__main__":
-    run_all_scrapers()
-
+    parser = argparse.ArgumentParser(description="Run all resort scrapers")
+    parser.add_argument("--workers", type=int, default=SCRAPER_WORKERS,
+                        help="Number of scrapers to run at once (default: SCRAPER_WORKERS or 1)")
+    parser.add_argument("--timeout", type=float, default=SCRAPER_TIMEOUT,
+                        help="Seconds before a scraper is marked as timed out in parallel mode")
+    parser.add_argument("--no-reuse-drivers", dest="reuse_drivers", action="store_false",
+                        default=SCRAPER_REUSE_DRIVERS,
+                        help="Start a fresh browser for every scraper")
+    args = parser.parse_args()
+    run_all_scrapers(args.workers, args.timeout, args.reuse_drivers)
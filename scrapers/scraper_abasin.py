@@ -1,12 +1,9 @@
 import common
 import os
-import time
 import html
 import re
 from base_scraper import BaseScraper
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 
 
@@ -21,7 +18,7 @@ class ArapahoeBasinScraper(BaseScraper):
         """Click on all clickable terrain sections to expand trail lists"""
         try:
             print("Expanding terrain sections...")
-            time.sleep(3)  # Wait for initial page load
+            self.wait_for_stable_count(By.CSS_SELECTOR, ".clickable-row.second-level")
             
             # Find all clickable terrain section elements
             clickable_sections = self.driver.find_elements(By.CSS_SELECTOR, ".clickable-row.second-level")
@@ -34,14 +31,13 @@ class ArapahoeBasinScraper(BaseScraper):
                     
                     # Use JavaScript click to avoid interception issues
                     self.driver.execute_script("arguments[0].click();", section)
-                    time.sleep(0.5)  # Small delay between clicks
                     
                 except Exception as e:
                     print(f"  Error expanding section {i+1}: {e}")
                     continue
             
-            # Wait for all sections to fully expand
-            time.sleep(2)
+            # Wait for the revealed trail lists to finish rendering
+            self.wait_for_stable_count(By.CSS_SELECTOR, "li.secondary-option:not(.clickable-row)")
             print("✓ All terrain sections expanded")
             
         except Exception as e:
@@ -52,11 +48,8 @@ class ArapahoeBasinScraper(BaseScraper):
         print("Starting to parse lifts...")
         
         try:
-            # Wait for page to load
-            WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.TAG_NAME, "body"))
-            )
-            time.sleep(3)
+            # Wait for the lift list to render
+            self.wait_for_stable_count(By.CSS_SELECTOR, "li.primary-option.lift-opt")
             
             lifts = []
             
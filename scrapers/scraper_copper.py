@@ -1,10 +1,7 @@
 import common
 import os
-import time
 from base_scraper import BaseScraper
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 
 
 class CopperScraper(BaseScraper):
@@ -18,8 +15,8 @@ class CopperScraper(BaseScraper):
         """Parse lifts data from Copper Mountain website"""
         print("Starting to parse lifts...")
         
-        # Wait for page to fully load
-        time.sleep(5)
+        # Wait for page to fully load (and its XHR-loaded report data)
+        self.wait_for_network_idle()
         
         # DEBUG: Save the page source for comparison
         try:
@@ -30,13 +27,8 @@ class CopperScraper(BaseScraper):
             print(f"⚠️ Could not save HTML: {e}")
         
         # Wait for accordion panels to be present
-        try:
-            WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "div[id*='accordion']"))
-            )
+        if self.wait_for_stable_count(By.CSS_SELECTOR, "div[id*='accordion']"):
             print("✓ Accordion panels detected")
-        except Exception as e:
-            print(f"⚠️ Warning: Timeout waiting for accordions: {e}")
         
         # Try to find and click the "All Lifts" accordion button
         try:
@@ -61,7 +53,7 @@ class CopperScraper(BaseScraper):
                 )
                 print("Clicking 'All Lifts' button to expand")
                 all_lifts_button.click()
-                time.sleep(2)
+                self.wait_for_stable_count(By.CSS_SELECTOR, "#sector-all-lifts-accordion tbody tr")
             except Exception as e:
                 print(f"⚠️ Could not click 'All Lifts' button: {e}")
         
@@ -188,7 +180,8 @@ class CopperScraper(BaseScraper):
                             expand_button = panel.find_element(By.CSS_SELECTOR, "button.panel-header")
                             print(f"  Expanding panel {panel_idx+1}")
                             expand_button.click()
-                            time.sleep(1)  # Wait for panel to expand and content to load
+                            # Wait for the panel's trail rows to finish loading
+                            self.wait_for_stable_count(By.CSS_SELECTOR, "tbody tr", timeout=5, root=panel)
                         except Exception as e:
                             print(f"  Could not expand panel {panel_idx+1}: {e}")
                     else:
@@ -1,44 +1,34 @@
 import common
 import os
-import time
-import json
-import re
-from base_scraper import BaseScraper
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
+from base_scraper import BaseScraper, extract_js_object
 
 
 class KeystoneScraper(BaseScraper):
     """Keystone Resort scraper"""
     
+    page_data_variable = 'FR.TerrainStatusFeed'
+    
     def __init__(self):
         website_url = os.environ.get("WEBSITE_URL", "https://www.keystoneresort.com/the-mountain/mountain-conditions/terrain-and-lift-status.aspx")
         super().__init__("Keystone", website_url)
     
     def extract_json_data(self):
-        """Extract the terrain status JSON data from the page"""
+        """Extract the terrain status JSON data from the page (once per scrape)"""
+        if self.page_data is not None:
+            return self.page_data
+        
         try:
-            # Wait for page to load
-            WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.TAG_NAME, "body"))
-            )
-            time.sleep(3)
+            # Wait for the inline script that defines the feed
+            self.wait_for_js_variable('FR.TerrainStatusFeed')
             
             # Get page source and extract the FR.TerrainStatusFeed JSON object
-            page_source = self.driver.page_source
+            data = extract_js_object(self.driver.page_source, 'FR.TerrainStatusFeed')
             
-            # Find the JavaScript variable with the data
-            pattern = r'FR\.TerrainStatusFeed\s*=\s*(\{.*?\});'
-            match = re.search(pattern, page_source, re.DOTALL)
-            
-            if not match:
+            if data is None:
                 print("❌ Could not find FR.TerrainStatusFeed in page source")
                 return None
             
-            json_str = match.group(1)
-            data = json.loads(json_str)
-            
+            self.page_data = data
             print(f"✓ Successfully extracted terrain data")
             return data
             
@@ -1,6 +1,5 @@
 import common
 import os
-import time
 from base_scraper import BaseScraper
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
@@ -24,7 +23,7 @@ class MonarchScraper(BaseScraper):
             WebDriverWait(self.driver, 10).until(
                 EC.presence_of_element_located((By.CSS_SELECTOR, "table.lifts-table"))
             )
-            time.sleep(2)  # Additional wait for dynamic content
+            self.wait_for_stable_count(By.CSS_SELECTOR, "table.lifts-table tr")  # Dynamic rows
             
             # Find the lifts table
             lifts_table = self.driver.find_element(By.CSS_SELECTOR, "table.lifts-table")
@@ -110,7 +109,7 @@ class MonarchScraper(BaseScraper):
             WebDriverWait(self.driver, 10).until(
                 EC.presence_of_element_located((By.CSS_SELECTOR, "table.trails-table"))
             )
-            time.sleep(1)  # Small wait for page to fully load
+            self.wait_for_stable_count(By.CSS_SELECTOR, "table.trails-table")  # All tables rendered
             
             # Find ALL trails-table elements on the page
             # The data is already in the static HTML - no clicking needed
@@ -1,10 +1,7 @@
 import common
 import os
-import time
 from base_scraper import BaseScraper
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 from bs4 import BeautifulSoup
 
 
@@ -16,16 +13,17 @@ class TellurideScraper(BaseScraper):
         super().__init__("Telluride", website_url)
     
     def get_page_soup(self):
-        """Get BeautifulSoup object from page source"""
+        """Get BeautifulSoup object from page source (parsed once per scrape)"""
+        if self.page_data is not None:
+            return self.page_data
+        
         try:
-            # Wait for page to load
-            WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.TAG_NAME, "body"))
-            )
-            time.sleep(3)
+            # Wait for the lift and trail lists to finish rendering
+            self.wait_for_stable_count(By.CSS_SELECTOR, "#tsr-report-app-lift-table tbody tr, .tsr-report-app-trail-list-trail")
             
             page_source = self.driver.page_source
             soup = BeautifulSoup(page_source, 'html.parser')
+            self.page_data = soup
             return soup
             
         except Exception as e:
@@ -1,6 +1,5 @@
 import common
 import os
-import time
 from base_scraper import BaseScraper
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
@@ -24,17 +23,12 @@ class WinterParkScraper(BaseScraper):
             )
             print("✓ React app loaded")
             
-            # Additional wait for lift/trail data to render
-            time.sleep(5)
-            
-            # Try to wait for lift or trail elements
-            try:
-                WebDriverWait(self.driver, 10).until(
-                    lambda driver: len(driver.find_elements(By.XPATH, '//li[contains(@class, "Lift") or contains(@class, "Trail")]')) > 0
-                )
-                print("✓ Lift/trail data rendered")
-            except:
-                print("⚠️ Timeout waiting for lift/trail elements")
+            # Wait for lift/trail data to finish rendering
+            count = self.wait_for_stable_count(
+                By.XPATH, '//li[contains(@class, "Lift") or contains(@class, "Trail")]', stable_for=1.0, timeout=15
+            )
+            if count:
+                print(f"✓ Lift/trail data rendered ({count} elements)")
                 
         except Exception as e:
             print(f"⚠️ Error waiting for React app: {e}")
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Benchmark the NumPy weather aggregation engine against the per-value loop it replaced.
+
+Builds synthetic per-station SNOTEL rows (3 stations, a few missing values)
+for several window sizes and times the inverse-distance weighted average of
+every field, both with the legacy pure-Python loop and with
+backend/weather_aggregation.py. No database is needed.
+
+Usage:
+    python scripts/benchmark_weather_aggregation.py
+"""
+
+import os
+import random
+import sys
+import timeit
+from datetime import date, timedelta
+
+# Add project root to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.weather_aggregation import pivot, station_weights, weighted_means
+
+FIELDS = (
+    'snow_depth_avg_in',
+    'snow_depth_max_in',
+    'temp_min_f',
+    'temp_max_f',
+    'precip_total_in',
+    'wind_speed_avg_mph',
+    'wind_direction_avg_deg',
+)
+STATIONS = [('1:CO:SNTL', 2.5), ('2:CO:SNTL', 6.1), ('3:CO:SNTL', 11.8)]
+REPEATS = 20
+
+
+def make_rows(points: int, missing_rate: float = 0.05) -> list:
+    """Synthetic per-station rows, one per station per time step"""
+    rng = random.Random(42)
+    start = date(2025, 1, 1)
+    rows = []
+    for i in range(points):
+        for triplet, _ in STATIONS:
+            row = {'date': start + timedelta(days=i), 'station_triplet': triplet}
+            for field in FIELDS:
+                row[field] = None if rng.random() < missing_rate else rng.uniform(0, 80)
+            rows.append(row)
+    return rows
+
+
+def legacy_weighted(rows: list) -> dict:
+    """The original per-date, per-field loop with per-value weight renormalization"""
+    weights = {t: 1.0 / (d + 0.1) for t, d in STATIONS}
+    total_weight = sum(weights.values())
+    weights = {t: w / total_weight for t, w in weights.items()}
+
+    by_date = {}
+    for row in rows:
+        by_date.setdefault(row['date'], []).append(row)
+
+    result = {}
+    for day, day_rows in sorted(by_date.items()):
+        values = {}
+        for field in FIELDS:
+            pairs = [(row[field], weights[row['station_triplet']]) for row in day_rows if row[field] is not None]
+            weight_sum = sum(w for _, w in pairs)
+            values[field] = sum(v * w for v, w in pairs) / weight_sum if weight_sum else None
+        result[day] = values
+    return result
+
+
+def vectorized_weighted(rows: list):
+    """The NumPy engine: pivot into a cube and reduce over stations in one pass"""
+    weights = station_weights([d for _, d in STATIONS])
+    _, cube = pivot(rows, 'date', 'station_triplet', [t for t, _ in STATIONS], FIELDS)
+    return weighted_means(cube, weights)
+
+
+def main():
+    print("📊 Weather aggregation benchmark (3 stations, 7 fields)")
+    print(f"{'window':>16} {'rows':>7} {'legacy ms':>10} {'numpy ms':>10} {'speedup':>8}")
+
+    # Daily windows plus hourly-sized matrices (24 points per day)
+    for label, points in [
+        ('7 days', 7), ('30 days', 30), ('90 days', 90),
+        ('7 days hourly', 7 * 24), ('30 days hourly', 30 * 24),
+    ]:
+        rows = make_rows(points)
+        legacy = timeit.timeit(lambda: legacy_weighted(rows), number=REPEATS) / REPEATS * 1000
+        vectorized = timeit.timeit(lambda: vectorized_weighted(rows), number=REPEATS) / REPEATS * 1000
+        print(f"{label:>16} {len(rows):>7} {legacy:>10.3f} {vectorized:>10.3f} {legacy / vectorized:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
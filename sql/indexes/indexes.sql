@@ -2,13 +2,19 @@
 CREATE INDEX IF NOT EXISTS idx_runs_location_date ON SKI_DATA.runs(location, updated_date);
 CREATE INDEX IF NOT EXISTS idx_runs_name ON SKI_DATA.runs(run_name);
 CREATE INDEX IF NOT EXISTS idx_runs_difficulty ON SKI_DATA.runs(run_difficulty);
-CREATE INDEX IF NOT EXISTS idx_runs_status ON SKI_DATA.runs(run_status);
+-- Open rows only: what v_runs_history and the first-opened backfill scan
+DROP INDEX IF EXISTS SKI_DATA.idx_runs_status;
+CREATE INDEX IF NOT EXISTS idx_runs_open_location_date
+    ON SKI_DATA.runs(location, updated_date) WHERE run_status;
 CREATE INDEX IF NOT EXISTS idx_runs_run_id_date ON SKI_DATA.runs(run_id, updated_date);
 
 -- Indexes for lifts table
 CREATE INDEX IF NOT EXISTS idx_lifts_location_date ON SKI_DATA.lifts(location, updated_date);
 CREATE INDEX IF NOT EXISTS idx_lifts_name ON SKI_DATA.lifts(lift_name);
-CREATE INDEX IF NOT EXISTS idx_lifts_status ON SKI_DATA.lifts(lift_status);
+-- Open rows only: what v_lifts_history and the first-opened backfill scan
+DROP INDEX IF EXISTS SKI_DATA.idx_lifts_status;
+CREATE INDEX IF NOT EXISTS idx_lifts_open_location_date
+    ON SKI_DATA.lifts(location, updated_date) WHERE lift_status;
 CREATE INDEX IF NOT EXISTS idx_lifts_lift_id_date ON SKI_DATA.lifts(lift_id, updated_date);
 
 -- Indexes for SNOTEL observations table
@@ -25,3 +31,24 @@ CREATE INDEX IF NOT EXISTS idx_forecasts_forecast_time
 CREATE INDEX IF NOT EXISTS idx_forecasts_source 
     ON WEATHER_DATA.weather_forecasts(source);
 
+
+-- Indexes for first-opened table (recently opened lookups)
+CREATE INDEX IF NOT EXISTS idx_first_opened_location_season
+    ON SKI_DATA.first_opened(location, season);
+CREATE INDEX IF NOT EXISTS idx_first_opened_type_date
+    ON SKI_DATA.first_opened(item_type, first_opened_date DESC);
+
+-- Indexes for status interval tables (change-only history)
+-- At most one open interval per lift/run; the diff writer matches on these
+CREATE UNIQUE INDEX IF NOT EXISTS idx_lift_intervals_open
+    ON SKI_DATA.lift_status_intervals(location, lift_name) WHERE closed_at IS NULL;
+CREATE INDEX IF NOT EXISTS idx_lift_intervals_location_dates
+    ON SKI_DATA.lift_status_intervals(location, start_date, last_seen_date);
+CREATE INDEX IF NOT EXISTS idx_lift_intervals_open_location_dates
+    ON SKI_DATA.lift_status_intervals(location, start_date, last_seen_date) WHERE lift_status;
+CREATE UNIQUE INDEX IF NOT EXISTS idx_run_intervals_open
+    ON SKI_DATA.run_status_intervals(location, run_name) WHERE closed_at IS NULL;
+CREATE INDEX IF NOT EXISTS idx_run_intervals_location_dates
+    ON SKI_DATA.run_status_intervals(location, start_date, last_seen_date);
+CREATE INDEX IF NOT EXISTS idx_run_intervals_open_location_dates
+    ON SKI_DATA.run_status_intervals(location, start_date, last_seen_date) WHERE run_status;
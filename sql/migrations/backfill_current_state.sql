@@ -0,0 +1,45 @@
+-- Migration: Seed SKI_DATA.lifts_current / SKI_DATA.runs_current from history
+-- Run once after deploying the current-state tables and triggers to a database
+-- that already has scrape history (init_db.py creates them empty). Safe to
+-- re-run: rows only move forward to a newer scrape.
+
+INSERT INTO SKI_DATA.lifts_current AS cur
+    (id, location, lift_name, lift_status, lift_type, updated_date, created_at, updated_at)
+SELECT DISTINCT ON (location, lift_name)
+    id, location, lift_name, lift_status, lift_type, updated_date, created_at, updated_at
+FROM SKI_DATA.lifts
+ORDER BY location, lift_name, updated_date DESC, updated_at DESC NULLS LAST, id DESC
+ON CONFLICT (location, lift_name) DO UPDATE SET
+    id = EXCLUDED.id,
+    lift_status = EXCLUDED.lift_status,
+    lift_type = EXCLUDED.lift_type,
+    updated_date = EXCLUDED.updated_date,
+    created_at = EXCLUDED.created_at,
+    updated_at = EXCLUDED.updated_at
+WHERE (EXCLUDED.updated_date, COALESCE(EXCLUDED.updated_at, '-infinity'))
+   >= (cur.updated_date, COALESCE(cur.updated_at, '-infinity'));
+
+INSERT INTO SKI_DATA.runs_current AS cur
+    (id, location, run_name, run_difficulty, run_status, updated_date,
+     run_area, run_groomed, created_at, updated_at)
+SELECT DISTINCT ON (location, run_name)
+    id, location, run_name, run_difficulty, run_status, updated_date,
+    run_area, run_groomed, created_at, updated_at
+FROM SKI_DATA.runs
+ORDER BY location, run_name, updated_date DESC, updated_at DESC NULLS LAST, id DESC
+ON CONFLICT (location, run_name) DO UPDATE SET
+    id = EXCLUDED.id,
+    run_difficulty = EXCLUDED.run_difficulty,
+    run_status = EXCLUDED.run_status,
+    updated_date = EXCLUDED.updated_date,
+    run_area = EXCLUDED.run_area,
+    run_groomed = EXCLUDED.run_groomed,
+    created_at = EXCLUDED.created_at,
+    updated_at = EXCLUDED.updated_at
+WHERE (EXCLUDED.updated_date, COALESCE(EXCLUDED.updated_at, '-infinity'))
+   >= (cur.updated_date, COALESCE(cur.updated_at, '-infinity'));
+
+-- Verify counts line up with the number of distinct lifts/runs
+SELECT 'lifts_current' as table_name, COUNT(*) as row_count FROM SKI_DATA.lifts_current
+UNION ALL
+SELECT 'runs_current' as table_name, COUNT(*) as row_count FROM SKI_DATA.runs_current;
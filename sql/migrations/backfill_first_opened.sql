@@ -0,0 +1,26 @@
+-- Migration: Seed SKI_DATA.first_opened from existing lifts/runs history
+-- Safe to re-run: existing rows only move to an earlier date.
+
+INSERT INTO SKI_DATA.first_opened AS fo (item_type, location, item_name, season, first_opened_date)
+SELECT 'lift', location, lift_name, SKI_DATA.ski_season(updated_date), MIN(updated_date)
+FROM SKI_DATA.lifts
+WHERE lift_status
+GROUP BY location, lift_name, SKI_DATA.ski_season(updated_date)
+ON CONFLICT (item_type, location, item_name, season) DO UPDATE SET
+    first_opened_date = EXCLUDED.first_opened_date
+WHERE EXCLUDED.first_opened_date < fo.first_opened_date;
+
+INSERT INTO SKI_DATA.first_opened AS fo (item_type, location, item_name, season, first_opened_date)
+SELECT 'run', location, run_name, SKI_DATA.ski_season(updated_date), MIN(updated_date)
+FROM SKI_DATA.runs
+WHERE run_status
+GROUP BY location, run_name, SKI_DATA.ski_season(updated_date)
+ON CONFLICT (item_type, location, item_name, season) DO UPDATE SET
+    first_opened_date = EXCLUDED.first_opened_date
+WHERE EXCLUDED.first_opened_date < fo.first_opened_date;
+
+-- Verify
+SELECT item_type, season, COUNT(*) as row_count
+FROM SKI_DATA.first_opened
+GROUP BY item_type, season
+ORDER BY season, item_type;
@@ -0,0 +1,17 @@
+-- Migration: Seed WEATHER_DATA.snotel_watermarks from stored observations
+-- Run once after deploying the watermark table to a database that already
+-- has SNOTEL data, so the first incremental refresh doesn't refetch its
+-- default window. Safe to re-run: watermarks only move forward.
+
+INSERT INTO WEATHER_DATA.snotel_watermarks AS wm
+    (station_triplet, duration, last_observation_date, last_observation_hour)
+SELECT DISTINCT ON (station_triplet, duration)
+    station_triplet, duration, observation_date, observation_hour
+FROM WEATHER_DATA.snotel_observations
+ORDER BY station_triplet, duration, observation_date DESC, observation_hour DESC NULLS LAST
+ON CONFLICT (station_triplet, duration) DO UPDATE SET
+    last_observation_date = EXCLUDED.last_observation_date,
+    last_observation_hour = EXCLUDED.last_observation_hour,
+    updated_at = CURRENT_TIMESTAMP
+WHERE (EXCLUDED.last_observation_date, COALESCE(EXCLUDED.last_observation_hour, -1))
+    > (wm.last_observation_date, COALESCE(wm.last_observation_hour, -1));
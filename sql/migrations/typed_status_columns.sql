@@ -0,0 +1,57 @@
+-- Migration: Native DATE / BOOLEAN columns for lift and run history
+-- updated_date (and the interval / first-opened dates) move from YYYY-MM-DD
+-- TEXT to DATE, and lift_status / run_status from 'true'/'Open'/'1'-style
+-- TEXT to BOOLEAN (true = open). Run by init_db.py before indexes and views;
+-- only columns still typed TEXT are converted, so re-running is a no-op.
+
+DO $$
+DECLARE
+    col RECORD;
+    vw RECORD;
+BEGIN
+    FOR col IN
+        SELECT c.table_name, c.column_name,
+               CASE WHEN c.column_name IN ('lift_status', 'run_status') THEN 'BOOLEAN' ELSE 'DATE' END AS new_type
+        FROM information_schema.columns c
+        WHERE c.table_schema = 'ski_data'
+          AND c.data_type = 'text'
+          AND (c.table_name, c.column_name) IN (
+              ('lifts', 'updated_date'), ('lifts', 'lift_status'),
+              ('runs', 'updated_date'), ('runs', 'run_status'),
+              ('lifts_current', 'updated_date'), ('lifts_current', 'lift_status'),
+              ('runs_current', 'updated_date'), ('runs_current', 'run_status'),
+              ('lift_status_intervals', 'start_date'), ('lift_status_intervals', 'last_seen_date'),
+              ('lift_status_intervals', 'lift_status'),
+              ('run_status_intervals', 'start_date'), ('run_status_intervals', 'last_seen_date'),
+              ('run_status_intervals', 'run_status'),
+              ('first_opened', 'first_opened_date')
+          )
+    LOOP
+        -- Views pin their column types; init_db.py recreates them afterwards
+        FOR vw IN SELECT viewname FROM pg_views WHERE schemaname = 'ski_data' LOOP
+            EXECUTE format('DROP VIEW IF EXISTS ski_data.%I CASCADE', vw.viewname);
+        END LOOP;
+
+        RAISE NOTICE 'Converting SKI_DATA.%.% to %', col.table_name, col.column_name, col.new_type;
+        IF col.new_type = 'BOOLEAN' THEN
+            EXECUTE format(
+                'ALTER TABLE ski_data.%I ALTER COLUMN %I TYPE BOOLEAN '
+                'USING lower(trim(%I)) IN (''true'', ''open'', ''1'')',
+                col.table_name, col.column_name, col.column_name
+            );
+        ELSE
+            EXECUTE format(
+                'ALTER TABLE ski_data.%I ALTER COLUMN %I TYPE DATE USING %I::date',
+                col.table_name, col.column_name, col.column_name
+            );
+        END IF;
+    END LOOP;
+END;
+$$;
+
+-- Verify
+SELECT table_name, column_name, data_type
+FROM information_schema.columns
+WHERE table_schema = 'ski_data'
+  AND column_name IN ('updated_date', 'lift_status', 'run_status', 'start_date', 'last_seen_date', 'first_opened_date')
+ORDER BY table_name, column_name;
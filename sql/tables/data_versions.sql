@@ -0,0 +1,11 @@
+-- Monotonic per-schema change counters, bumped by the statement-level
+-- triggers in sql/triggers/data_versions.sql. The backend keys its in-process
+-- resolver cache on these so a scrape or weather ingest invalidates it.
+CREATE TABLE IF NOT EXISTS SKI_DATA.data_versions (
+    schema_name TEXT PRIMARY KEY,
+    version BIGINT NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+INSERT INTO SKI_DATA.data_versions (schema_name) VALUES ('SKI_DATA'), ('WEATHER_DATA')
+ON CONFLICT (schema_name) DO NOTHING;
@@ -0,0 +1,12 @@
+-- First date each lift/run was recorded open, per ski season.
+-- Maintained incrementally by the trigger in sql/triggers/first_opened.sql so
+-- "recently opened" lookups never aggregate the full lifts/runs history.
+CREATE TABLE IF NOT EXISTS SKI_DATA.first_opened (
+    item_type TEXT NOT NULL CHECK (item_type IN ('lift', 'run')),
+    location TEXT NOT NULL,
+    item_name TEXT NOT NULL,
+    season TEXT NOT NULL,              -- e.g. '2025-26' (seasons roll over on Aug 1)
+    first_opened_date DATE NOT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (item_type, location, item_name, season)
+);
@@ -0,0 +1,18 @@
+-- Change-only lift history, written when scrapers run with SCRAPER_WRITE_MODE=diff.
+-- Each row is a stretch of time during which a lift kept the same status and
+-- type: opened_at is the scrape that first saw this state, closed_at the scrape
+-- that saw it change (NULL while it is still the current state). Scrapes that
+-- see no change only move last_seen_date / last_seen_at forward.
+-- SKI_DATA.v_lifts_daily expands these back into one row per lift per day.
+CREATE TABLE IF NOT EXISTS SKI_DATA.lift_status_intervals (
+    id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+    location TEXT NOT NULL,
+    lift_name TEXT NOT NULL,
+    lift_status BOOLEAN NOT NULL,         -- true = open
+    lift_type TEXT,
+    start_date DATE NOT NULL,
+    last_seen_date DATE NOT NULL,
+    opened_at TIMESTAMP NOT NULL,
+    last_seen_at TIMESTAMP NOT NULL,
+    closed_at TIMESTAMP
+);
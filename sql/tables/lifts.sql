@@ -4,9 +4,9 @@ CREATE TABLE IF NOT EXISTS SKI_DATA.lifts (
     location TEXT NOT NULL,
     location_id TEXT GENERATED ALWAYS AS (md5(location)) STORED,
     lift_name TEXT NOT NULL,
-    lift_status TEXT NOT NULL,
+    lift_status BOOLEAN NOT NULL,         -- true = open
     lift_type TEXT,
-    updated_date TEXT NOT NULL,
+    updated_date DATE NOT NULL,
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
\ No newline at end of file
@@ -0,0 +1,16 @@
+-- Latest known state of every lift (one row per location + lift_name).
+-- Maintained by the trigger in sql/triggers/current_state.sql; same columns
+-- as SKI_DATA.lifts so SKI_DATA.v_lifts_current can select from it directly.
+CREATE TABLE IF NOT EXISTS SKI_DATA.lifts_current (
+    id UUID PRIMARY KEY,
+    lift_id TEXT GENERATED ALWAYS AS (md5(location || lift_name)) STORED,
+    location TEXT NOT NULL,
+    location_id TEXT GENERATED ALWAYS AS (md5(location)) STORED,
+    lift_name TEXT NOT NULL,
+    lift_status BOOLEAN NOT NULL,         -- true = open
+    lift_type TEXT,
+    updated_date DATE NOT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE (location, lift_name)
+);
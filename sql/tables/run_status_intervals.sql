@@ -0,0 +1,18 @@
+-- Change-only run history, written when scrapers run with SCRAPER_WRITE_MODE=diff.
+-- Same layout as SKI_DATA.lift_status_intervals: a new interval starts whenever
+-- a run's status, difficulty, area or grooming changes.
+-- SKI_DATA.v_runs_daily expands these back into one row per run per day.
+CREATE TABLE IF NOT EXISTS SKI_DATA.run_status_intervals (
+    id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+    location TEXT NOT NULL,
+    run_name TEXT NOT NULL,
+    run_difficulty TEXT,
+    run_status BOOLEAN NOT NULL,          -- true = open
+    run_area TEXT,
+    run_groomed BOOLEAN DEFAULT FALSE,
+    start_date DATE NOT NULL,
+    last_seen_date DATE NOT NULL,
+    opened_at TIMESTAMP NOT NULL,
+    last_seen_at TIMESTAMP NOT NULL,
+    closed_at TIMESTAMP
+);
@@ -5,8 +5,8 @@ CREATE TABLE IF NOT EXISTS SKI_DATA.runs (
     location_id TEXT GENERATED ALWAYS AS (md5(location)) STORED,
     run_name TEXT NOT NULL,
     run_difficulty TEXT,
-    run_status TEXT NOT NULL,
-    updated_date TEXT NOT NULL,
+    run_status BOOLEAN NOT NULL,          -- true = open
+    updated_date DATE NOT NULL,
     run_area TEXT,
     run_groomed BOOLEAN DEFAULT FALSE,
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
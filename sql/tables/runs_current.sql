@@ -0,0 +1,18 @@
+-- Latest known state of every run (one row per location + run_name).
+-- Maintained by the trigger in sql/triggers/current_state.sql; same columns
+-- as SKI_DATA.runs so SKI_DATA.v_runs_current can select from it directly.
+CREATE TABLE IF NOT EXISTS SKI_DATA.runs_current (
+    id UUID PRIMARY KEY,
+    run_id TEXT GENERATED ALWAYS AS (md5(location || run_name)) STORED,
+    location TEXT NOT NULL,
+    location_id TEXT GENERATED ALWAYS AS (md5(location)) STORED,
+    run_name TEXT NOT NULL,
+    run_difficulty TEXT,
+    run_status BOOLEAN NOT NULL,          -- true = open
+    updated_date DATE NOT NULL,
+    run_area TEXT,
+    run_groomed BOOLEAN DEFAULT FALSE,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE (location, run_name)
+);
@@ -0,0 +1,13 @@
+-- Completed SNOTEL backfill chunks (see weather/snotel_backfill.py).
+-- One row per station per window; written in the same transaction as the
+-- chunk's observations, so a row here means its data is committed. Reruns
+-- skip any station/window already covered by a checkpoint.
+CREATE TABLE IF NOT EXISTS WEATHER_DATA.snotel_backfill_checkpoints (
+    duration VARCHAR(10) NOT NULL,     -- 'DAILY' or 'HOURLY'
+    station_triplet VARCHAR(50) NOT NULL,
+    window_begin DATE NOT NULL,
+    window_end DATE NOT NULL,          -- exclusive (next window starts here)
+    observations INTEGER NOT NULL DEFAULT 0,
+    completed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (duration, station_triplet, window_begin, window_end)
+);
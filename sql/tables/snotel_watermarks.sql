@@ -0,0 +1,12 @@
+-- Per-station high-water mark of stored SNOTEL observations
+-- Maintained by weather/snotel_loader.py in the same transaction as each
+-- observation merge; incremental refreshes request only data after it
+-- (minus a short lookback for late corrections).
+CREATE TABLE IF NOT EXISTS WEATHER_DATA.snotel_watermarks (
+    station_triplet VARCHAR(50) NOT NULL REFERENCES WEATHER_DATA.snotel_stations(station_triplet),
+    duration VARCHAR(10) NOT NULL,     -- 'DAILY' or 'HOURLY'
+    last_observation_date DATE NOT NULL,
+    last_observation_hour INTEGER,     -- NULL for daily data, 0-23 for hourly
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (station_triplet, duration)
+);
@@ -0,0 +1,64 @@
+-- Keep SKI_DATA.lifts_current / SKI_DATA.runs_current in sync with the
+-- append-only history tables. Statement-level triggers with transition tables
+-- apply one upsert per scrape batch instead of one per inserted row.
+--
+-- "Latest" matches the old correlated-subquery views: highest updated_date,
+-- then the most recently written row (updated_at) for same-day re-scrapes.
+
+CREATE OR REPLACE FUNCTION SKI_DATA.sync_lifts_current() RETURNS TRIGGER AS $$
+BEGIN
+    INSERT INTO SKI_DATA.lifts_current AS cur
+        (id, location, lift_name, lift_status, lift_type, updated_date, created_at, updated_at)
+    SELECT DISTINCT ON (location, lift_name)
+        id, location, lift_name, lift_status, lift_type, updated_date, created_at, updated_at
+    FROM new_rows
+    ORDER BY location, lift_name, updated_date DESC, updated_at DESC NULLS LAST, id DESC
+    ON CONFLICT (location, lift_name) DO UPDATE SET
+        id = EXCLUDED.id,
+        lift_status = EXCLUDED.lift_status,
+        lift_type = EXCLUDED.lift_type,
+        updated_date = EXCLUDED.updated_date,
+        created_at = EXCLUDED.created_at,
+        updated_at = EXCLUDED.updated_at
+    WHERE (EXCLUDED.updated_date, COALESCE(EXCLUDED.updated_at, '-infinity'))
+       >= (cur.updated_date, COALESCE(cur.updated_at, '-infinity'));
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_lifts_current ON SKI_DATA.lifts;
+CREATE TRIGGER trg_lifts_current
+    AFTER INSERT ON SKI_DATA.lifts
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION SKI_DATA.sync_lifts_current();
+
+CREATE OR REPLACE FUNCTION SKI_DATA.sync_runs_current() RETURNS TRIGGER AS $$
+BEGIN
+    INSERT INTO SKI_DATA.runs_current AS cur
+        (id, location, run_name, run_difficulty, run_status, updated_date,
+         run_area, run_groomed, created_at, updated_at)
+    SELECT DISTINCT ON (location, run_name)
+        id, location, run_name, run_difficulty, run_status, updated_date,
+        run_area, run_groomed, created_at, updated_at
+    FROM new_rows
+    ORDER BY location, run_name, updated_date DESC, updated_at DESC NULLS LAST, id DESC
+    ON CONFLICT (location, run_name) DO UPDATE SET
+        id = EXCLUDED.id,
+        run_difficulty = EXCLUDED.run_difficulty,
+        run_status = EXCLUDED.run_status,
+        updated_date = EXCLUDED.updated_date,
+        run_area = EXCLUDED.run_area,
+        run_groomed = EXCLUDED.run_groomed,
+        created_at = EXCLUDED.created_at,
+        updated_at = EXCLUDED.updated_at
+    WHERE (EXCLUDED.updated_date, COALESCE(EXCLUDED.updated_at, '-infinity'))
+       >= (cur.updated_date, COALESCE(cur.updated_at, '-infinity'));
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_runs_current ON SKI_DATA.runs;
+CREATE TRIGGER trg_runs_current
+    AFTER INSERT ON SKI_DATA.runs
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION SKI_DATA.sync_runs_current();
@@ -0,0 +1,39 @@
+-- Bump SKI_DATA.data_versions whenever a table the API reads is written.
+-- Statement-level, so a scrape batch costs one bump rather than one per row.
+
+CREATE OR REPLACE FUNCTION SKI_DATA.bump_data_version() RETURNS TRIGGER AS $$
+BEGIN
+    INSERT INTO SKI_DATA.data_versions (schema_name, version, updated_at)
+    VALUES (upper(TG_TABLE_SCHEMA), 1, CURRENT_TIMESTAMP)
+    ON CONFLICT (schema_name) DO UPDATE SET
+        version = SKI_DATA.data_versions.version + 1,
+        updated_at = CURRENT_TIMESTAMP;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DO $$
+DECLARE
+    tbl TEXT;
+BEGIN
+    FOREACH tbl IN ARRAY ARRAY[
+        'SKI_DATA.lifts',
+        'SKI_DATA.runs',
+        'SKI_DATA.lift_status_intervals',
+        'SKI_DATA.run_status_intervals',
+        'SKI_DATA.ref__lift_mapping',
+        'WEATHER_DATA.snotel_stations',
+        'WEATHER_DATA.snotel_observations',
+        'WEATHER_DATA.resort_station_mapping',
+        'WEATHER_DATA.weather_forecasts',
+        'WEATHER_DATA.historical_weather'
+    ] LOOP
+        EXECUTE format('DROP TRIGGER IF EXISTS trg_data_version ON %s', tbl);
+        EXECUTE format(
+            'CREATE TRIGGER trg_data_version AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON %s '
+            'FOR EACH STATEMENT EXECUTE FUNCTION SKI_DATA.bump_data_version()',
+            tbl
+        );
+    END LOOP;
+END;
+$$;
@@ -0,0 +1,98 @@
+-- Record the first day each lift/run is seen open in a season.
+-- Seasons run Aug 1 - Jul 31 and are labelled by their start/end years.
+
+CREATE OR REPLACE FUNCTION SKI_DATA.ski_season(day DATE) RETURNS TEXT AS $$
+    SELECT CASE
+        WHEN EXTRACT(MONTH FROM day) >= 8
+            THEN to_char(day, 'YYYY') || '-' || to_char(day + INTERVAL '1 year', 'YY')
+        ELSE to_char(day - INTERVAL '1 year', 'YYYY') || '-' || to_char(day, 'YY')
+    END
+$$ LANGUAGE sql IMMUTABLE;
+
+-- YYYY-MM-DD text form, kept for ad-hoc queries written before dates were DATE
+CREATE OR REPLACE FUNCTION SKI_DATA.ski_season(day TEXT) RETURNS TEXT AS $$
+    SELECT SKI_DATA.ski_season(day::date)
+$$ LANGUAGE sql IMMUTABLE;
+
+CREATE OR REPLACE FUNCTION SKI_DATA.sync_lifts_first_opened() RETURNS TRIGGER AS $$
+BEGIN
+    INSERT INTO SKI_DATA.first_opened AS fo (item_type, location, item_name, season, first_opened_date)
+    SELECT 'lift', location, lift_name, SKI_DATA.ski_season(updated_date), MIN(updated_date)
+    FROM new_rows
+    WHERE lift_status
+    GROUP BY location, lift_name, SKI_DATA.ski_season(updated_date)
+    ON CONFLICT (item_type, location, item_name, season) DO UPDATE SET
+        first_opened_date = EXCLUDED.first_opened_date
+    -- Only backfilled (older) data can move the date; normal scrapes are no-ops
+    WHERE EXCLUDED.first_opened_date < fo.first_opened_date;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_lifts_first_opened ON SKI_DATA.lifts;
+CREATE TRIGGER trg_lifts_first_opened
+    AFTER INSERT ON SKI_DATA.lifts
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION SKI_DATA.sync_lifts_first_opened();
+
+CREATE OR REPLACE FUNCTION SKI_DATA.sync_runs_first_opened() RETURNS TRIGGER AS $$
+BEGIN
+    INSERT INTO SKI_DATA.first_opened AS fo (item_type, location, item_name, season, first_opened_date)
+    SELECT 'run', location, run_name, SKI_DATA.ski_season(updated_date), MIN(updated_date)
+    FROM new_rows
+    WHERE run_status
+    GROUP BY location, run_name, SKI_DATA.ski_season(updated_date)
+    ON CONFLICT (item_type, location, item_name, season) DO UPDATE SET
+        first_opened_date = EXCLUDED.first_opened_date
+    WHERE EXCLUDED.first_opened_date < fo.first_opened_date;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_runs_first_opened ON SKI_DATA.runs;
+CREATE TRIGGER trg_runs_first_opened
+    AFTER INSERT ON SKI_DATA.runs
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION SKI_DATA.sync_runs_first_opened();
+
+-- Change-only history (SCRAPER_WRITE_MODE=diff): a lift/run opening starts a
+-- new interval, so the interval's start_date is the day it was first seen open.
+CREATE OR REPLACE FUNCTION SKI_DATA.sync_lift_intervals_first_opened() RETURNS TRIGGER AS $$
+BEGIN
+    INSERT INTO SKI_DATA.first_opened AS fo (item_type, location, item_name, season, first_opened_date)
+    SELECT 'lift', location, lift_name, SKI_DATA.ski_season(start_date), MIN(start_date)
+    FROM new_rows
+    WHERE lift_status
+    GROUP BY location, lift_name, SKI_DATA.ski_season(start_date)
+    ON CONFLICT (item_type, location, item_name, season) DO UPDATE SET
+        first_opened_date = EXCLUDED.first_opened_date
+    WHERE EXCLUDED.first_opened_date < fo.first_opened_date;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_lift_intervals_first_opened ON SKI_DATA.lift_status_intervals;
+CREATE TRIGGER trg_lift_intervals_first_opened
+    AFTER INSERT ON SKI_DATA.lift_status_intervals
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION SKI_DATA.sync_lift_intervals_first_opened();
+
+CREATE OR REPLACE FUNCTION SKI_DATA.sync_run_intervals_first_opened() RETURNS TRIGGER AS $$
+BEGIN
+    INSERT INTO SKI_DATA.first_opened AS fo (item_type, location, item_name, season, first_opened_date)
+    SELECT 'run', location, run_name, SKI_DATA.ski_season(start_date), MIN(start_date)
+    FROM new_rows
+    WHERE run_status
+    GROUP BY location, run_name, SKI_DATA.ski_season(start_date)
+    ON CONFLICT (item_type, location, item_name, season) DO UPDATE SET
+        first_opened_date = EXCLUDED.first_opened_date
+    WHERE EXCLUDED.first_opened_date < fo.first_opened_date;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_run_intervals_first_opened ON SKI_DATA.run_status_intervals;
+CREATE TRIGGER trg_run_intervals_first_opened
+    AFTER INSERT ON SKI_DATA.run_status_intervals
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION SKI_DATA.sync_run_intervals_first_opened();
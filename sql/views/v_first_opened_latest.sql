@@ -0,0 +1,16 @@
+-- First-opened dates for each resort's most recent season with any openings.
+-- Falling back to the latest season (rather than the calendar one) keeps the
+-- "recently opened" lists populated through the summer off-season.
+CREATE OR REPLACE VIEW SKI_DATA.v_first_opened_latest AS
+SELECT
+    fo.item_type,
+    fo.location,
+    fo.item_name,
+    fo.season,
+    fo.first_opened_date
+FROM SKI_DATA.first_opened fo
+JOIN (
+    SELECT location, MAX(season) as season
+    FROM SKI_DATA.first_opened
+    GROUP BY location
+) latest ON latest.location = fo.location AND latest.season = fo.season;
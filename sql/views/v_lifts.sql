@@ -5,5 +5,9 @@ SELECT DISTINCT
     lift_type,
     md5(location) || '-' || md5(lift_name) AS lift_id,
     MAX(updated_date) AS updated_date
-FROM SKI_DATA.lifts
-GROUP BY location, lift_name, lift_type;
\ No newline at end of file
+FROM (
+    SELECT location, lift_name, lift_type, updated_date FROM SKI_DATA.lifts
+    UNION ALL
+    SELECT location, lift_name, lift_type, last_seen_date FROM SKI_DATA.lift_status_intervals
+) lifts
+GROUP BY location, lift_name, lift_type;
@@ -0,0 +1,23 @@
+-- One row per lift per scraped day, with the same columns as SKI_DATA.lifts.
+-- Combines the append-only table with change-only intervals (expanded to one
+-- row per day they cover), so queries written against the per-day snapshots
+-- keep working whichever SCRAPER_WRITE_MODE the scrapers use.
+CREATE OR REPLACE VIEW SKI_DATA.v_lifts_daily AS
+SELECT
+    id, lift_id, location, location_id, lift_name, lift_status, lift_type,
+    updated_date, created_at, updated_at
+FROM SKI_DATA.lifts
+UNION ALL
+SELECT
+    i.id,
+    md5(i.location || i.lift_name) AS lift_id,
+    i.location,
+    md5(i.location) AS location_id,
+    i.lift_name,
+    i.lift_status,
+    i.lift_type,
+    d::date AS updated_date,
+    i.opened_at AS created_at,
+    CASE WHEN d = i.last_seen_date THEN i.last_seen_at ELSE GREATEST(d, i.opened_at) END AS updated_at
+FROM SKI_DATA.lift_status_intervals i
+CROSS JOIN LATERAL generate_series(i.start_date, i.last_seen_date, INTERVAL '1 day') AS d;
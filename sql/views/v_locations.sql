@@ -1,14 +1,16 @@
+-- Read from the current-state tables, which both write modes keep up to date
+-- (and which are far smaller than the history tables)
 CREATE OR REPLACE VIEW SKI_DATA.v_locations AS
 SELECT DISTINCT
     location,
     md5(location) AS location_id,
     MAX(updated_date) AS updated_date
-FROM SKI_DATA.runs
+FROM SKI_DATA.runs_current
 GROUP BY location
 UNION
 SELECT DISTINCT
     location,
     md5(location) AS location_id,
     MAX(updated_date) AS updated_date
-FROM SKI_DATA.lifts
-GROUP BY location;
\ No newline at end of file
+FROM SKI_DATA.lifts_current
+GROUP BY location;
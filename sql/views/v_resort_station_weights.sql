@@ -0,0 +1,22 @@
+-- The (up to) 3 closest SNOTEL stations for each resort with normalized
+-- inverse-distance weights: 1 / (distance + 0.1), scaled to sum to 1.
+-- The 0.1 mile epsilon avoids division by zero for co-located stations.
+CREATE OR REPLACE VIEW WEATHER_DATA.v_resort_station_weights AS
+SELECT
+    resort_name,
+    station_triplet,
+    station_name,
+    distance_miles,
+    (1.0 / (distance_miles + 0.1))
+        / SUM(1.0 / (distance_miles + 0.1)) OVER (PARTITION BY resort_name) as weight
+FROM (
+    SELECT
+        rsm.resort_name,
+        rsm.station_triplet,
+        ss.station_name,
+        rsm.distance_miles,
+        ROW_NUMBER() OVER (PARTITION BY rsm.resort_name ORDER BY rsm.distance_miles ASC) as rn
+    FROM WEATHER_DATA.resort_station_mapping rsm
+    JOIN WEATHER_DATA.snotel_stations ss ON rsm.station_triplet = ss.station_triplet
+) ranked
+WHERE rn <= 3;
@@ -6,7 +6,7 @@ WITH lift_counts AS (
     SELECT 
         location,
         COUNT(*) as total_lifts,
-        COUNT(*) FILTER (WHERE lift_status IN ('Open', 'open', 'true', 'True', '1')) as open_lifts,
+        COUNT(*) FILTER (WHERE lift_status) as open_lifts,
         MAX(updated_date) as last_updated
     FROM SKI_DATA.v_lifts_current
     GROUP BY location
@@ -15,7 +15,7 @@ run_counts AS (
     SELECT 
         location,
         COUNT(*) as total_runs,
-        COUNT(*) FILTER (WHERE run_status IN ('Open', 'open', 'true', 'True', '1')) as open_runs,
+        COUNT(*) FILTER (WHERE run_status) as open_runs,
         MAX(updated_date) as last_updated
     FROM SKI_DATA.v_runs_current
     GROUP BY location
@@ -24,24 +24,24 @@ runs_by_difficulty AS (
     SELECT 
         location,
         COUNT(*) FILTER (WHERE 
-            run_status IN ('Open', 'open', 'true', 'True', '1') AND
+            run_status AND
             (LOWER(run_difficulty) LIKE '%green%' OR LOWER(run_difficulty) LIKE '%easiest%' OR LOWER(run_difficulty) LIKE '%beginner%')
         ) as green_count,
         COUNT(*) FILTER (WHERE 
-            run_status IN ('Open', 'open', 'true', 'True', '1') AND
+            run_status AND
             (LOWER(run_difficulty) LIKE '%blue%' OR LOWER(run_difficulty) LIKE '%intermediate%' OR LOWER(run_difficulty) LIKE '%more difficult%')
         ) as blue_count,
         COUNT(*) FILTER (WHERE 
-            run_status IN ('Open', 'open', 'true', 'True', '1') AND
+            run_status AND
             (LOWER(run_difficulty) LIKE '%double%' OR LOWER(run_difficulty) LIKE '%expert%' OR LOWER(run_difficulty) LIKE '%most difficult%')
         ) as double_black_count,
         COUNT(*) FILTER (WHERE 
-            run_status IN ('Open', 'open', 'true', 'True', '1') AND
+            run_status AND
             (LOWER(run_difficulty) LIKE '%black%' OR LOWER(run_difficulty) LIKE '%advanced%' OR LOWER(run_difficulty) LIKE '%difficult%') AND
             NOT (LOWER(run_difficulty) LIKE '%double%' OR LOWER(run_difficulty) LIKE '%expert%' OR LOWER(run_difficulty) LIKE '%most difficult%')
         ) as black_count,
         COUNT(*) FILTER (WHERE 
-            run_status IN ('Open', 'open', 'true', 'True', '1') AND
+            run_status AND
             (LOWER(run_difficulty) LIKE '%park%' OR LOWER(run_difficulty) LIKE '%terrain%')
         ) as terrain_park_count
     FROM SKI_DATA.v_runs_current
@@ -57,7 +57,7 @@ lifts_history AS (
     FROM (
         SELECT location, updated_date, open_count
         FROM SKI_DATA.v_lifts_history
-        WHERE updated_date::date >= (CURRENT_TIMESTAMP AT TIME ZONE 'America/Denver')::date - INTERVAL '7 days'
+        WHERE updated_date >= (CURRENT_TIMESTAMP AT TIME ZONE 'America/Denver')::date - INTERVAL '7 days'
     ) sub
     GROUP BY location
 ),
@@ -71,7 +71,7 @@ runs_history AS (
     FROM (
         SELECT location, updated_date, open_count
         FROM SKI_DATA.v_runs_history
-        WHERE updated_date::date >= (CURRENT_TIMESTAMP AT TIME ZONE 'America/Denver')::date - INTERVAL '7 days'
+        WHERE updated_date >= (CURRENT_TIMESTAMP AT TIME ZONE 'America/Denver')::date - INTERVAL '7 days'
     ) sub
     GROUP BY location
 ),
@@ -82,10 +82,9 @@ recently_opened_lifts_ranked AS (
         date_opened,
         ROW_NUMBER() OVER (PARTITION BY location ORDER BY date_opened DESC) as rn
     FROM (
-        SELECT location, lift_name, MIN(updated_date) as date_opened
-        FROM SKI_DATA.lifts
-        WHERE lift_status = 'true'
-        GROUP BY location, lift_name
+        SELECT location, item_name as lift_name, first_opened_date as date_opened
+        FROM SKI_DATA.v_first_opened_latest
+        WHERE item_type = 'lift'
     ) sub
 ),
 recently_opened_lifts AS (
@@ -106,10 +105,9 @@ recently_opened_runs_ranked AS (
         date_opened,
         ROW_NUMBER() OVER (PARTITION BY location ORDER BY date_opened DESC) as rn
     FROM (
-        SELECT location, run_name, MIN(updated_date) as date_opened
-        FROM SKI_DATA.runs
-        WHERE run_status = 'true'
-        GROUP BY location, run_name
+        SELECT location, item_name as run_name, first_opened_date as date_opened
+        FROM SKI_DATA.v_first_opened_latest
+        WHERE item_type = 'run'
     ) sub
 ),
 recently_opened_runs AS (
@@ -0,0 +1,24 @@
+-- One inverse-distance weighted row per resort and hour, so the API never
+-- pulls per-station hourly rows. Each field is averaged over the stations
+-- that reported it (weights renormalized over non-NULL values).
+-- Filter on resort_name / observation_date; both push down to the base tables.
+CREATE OR REPLACE VIEW WEATHER_DATA.v_resort_weather_hourly AS
+SELECT
+    w.resort_name,
+    o.observation_date,
+    o.observation_hour,
+    ROUND(SUM(o.snow_depth_in * w.weight)
+        / NULLIF(SUM(w.weight) FILTER (WHERE o.snow_depth_in IS NOT NULL), 0), 1) as snow_depth_in,
+    ROUND(SUM(o.snow_water_equivalent_in * w.weight)
+        / NULLIF(SUM(w.weight) FILTER (WHERE o.snow_water_equivalent_in IS NOT NULL), 0), 1) as snow_water_equivalent_in,
+    ROUND(SUM(o.temp_observed_f * w.weight)
+        / NULLIF(SUM(w.weight) FILTER (WHERE o.temp_observed_f IS NOT NULL), 0), 1) as temp_observed_f,
+    ROUND(SUM(o.precip_accum_in * w.weight)
+        / NULLIF(SUM(w.weight) FILTER (WHERE o.precip_accum_in IS NOT NULL), 0), 1) as precip_accum_in,
+    ROUND(SUM(o.wind_speed_avg_mph * w.weight)
+        / NULLIF(SUM(w.weight) FILTER (WHERE o.wind_speed_avg_mph IS NOT NULL), 0), 1) as wind_speed_avg_mph,
+    ROUND(SUM(o.wind_speed_max_mph * w.weight)
+        / NULLIF(SUM(w.weight) FILTER (WHERE o.wind_speed_max_mph IS NOT NULL), 0), 1) as wind_speed_max_mph
+FROM WEATHER_DATA.v_resort_station_weights w
+JOIN WEATHER_DATA.snotel_observations o ON o.station_triplet = w.station_triplet
+GROUP BY w.resort_name, o.observation_date, o.observation_hour;
@@ -5,5 +5,9 @@ SELECT DISTINCT
     run_difficulty,
     md5(location) || '-' || md5(run_name) AS run_id,
     MAX(updated_date) AS updated_date
-FROM SKI_DATA.runs
-GROUP BY location, run_name, run_difficulty;
\ No newline at end of file
+FROM (
+    SELECT location, run_name, run_difficulty, updated_date FROM SKI_DATA.runs
+    UNION ALL
+    SELECT location, run_name, run_difficulty, last_seen_date FROM SKI_DATA.run_status_intervals
+) runs
+GROUP BY location, run_name, run_difficulty;
@@ -1,9 +1,3 @@
 CREATE OR REPLACE VIEW SKI_DATA.v_runs_current AS
-SELECT * FROM SKI_DATA.runs r1
-WHERE r1.id = (
-    SELECT r2.id 
-    FROM SKI_DATA.runs r2 
-    WHERE r2.run_id = r1.run_id
-    ORDER BY r2.updated_date DESC, r2.id DESC
-    LIMIT 1
-);
\ No newline at end of file
+-- Backed by the trigger-maintained current-state table (see sql/triggers/current_state.sql)
+SELECT * FROM SKI_DATA.runs_current;
\ No newline at end of file
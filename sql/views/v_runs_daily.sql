@@ -0,0 +1,23 @@
+-- One row per run per scraped day, with the same columns as SKI_DATA.runs.
+-- See v_lifts_daily: append-only rows plus change-only intervals expanded per day.
+CREATE OR REPLACE VIEW SKI_DATA.v_runs_daily AS
+SELECT
+    id, run_id, location, location_id, run_name, run_difficulty, run_status,
+    updated_date, run_area, run_groomed, created_at, updated_at
+FROM SKI_DATA.runs
+UNION ALL
+SELECT
+    i.id,
+    md5(i.location || i.run_name) AS run_id,
+    i.location,
+    md5(i.location) AS location_id,
+    i.run_name,
+    i.run_difficulty,
+    i.run_status,
+    d::date AS updated_date,
+    i.run_area,
+    i.run_groomed,
+    i.opened_at AS created_at,
+    CASE WHEN d = i.last_seen_date THEN i.last_seen_at ELSE GREATEST(d, i.opened_at) END AS updated_at
+FROM SKI_DATA.run_status_intervals i
+CROSS JOIN LATERAL generate_series(i.start_date, i.last_seen_date, INTERVAL '1 day') AS d;
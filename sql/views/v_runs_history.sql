@@ -1,5 +1,49 @@
+-- Open runs per location per day.
+-- Append-only rows are counted directly. Change-only intervals are never
+-- expanded: each open interval adds +1 on its start_date and -1 the day after
+-- it was last seen, and a running sum over the location's days gives the count.
 CREATE OR REPLACE VIEW SKI_DATA.v_runs_history AS
-SELECT location, updated_date, count(*) as open_count
-FROM SKI_DATA.runs
-WHERE run_status = 'true'
-GROUP BY location, updated_date;
\ No newline at end of file
+WITH snapshot_counts AS (
+    SELECT location, updated_date, count(*) AS open_count
+    FROM SKI_DATA.runs
+    WHERE run_status
+    GROUP BY location, updated_date
+),
+deltas AS (
+    SELECT location, day, SUM(delta) AS delta
+    FROM (
+        SELECT location, start_date AS day, 1 AS delta
+        FROM SKI_DATA.run_status_intervals
+        WHERE run_status
+        UNION ALL
+        SELECT location, last_seen_date + 1 AS day, -1 AS delta
+        FROM SKI_DATA.run_status_intervals
+        WHERE run_status
+    ) events
+    GROUP BY location, day
+),
+interval_days AS (
+    SELECT location, d::date AS day
+    FROM (
+        SELECT location, MIN(start_date) AS first_day, MAX(last_seen_date) AS last_day
+        FROM SKI_DATA.run_status_intervals
+        GROUP BY location
+    ) bounds
+    CROSS JOIN LATERAL generate_series(first_day, last_day, INTERVAL '1 day') AS d
+),
+interval_counts AS (
+    SELECT
+        days.location,
+        days.day AS updated_date,
+        SUM(COALESCE(deltas.delta, 0)) OVER (PARTITION BY days.location ORDER BY days.day) AS open_count
+    FROM interval_days days
+    LEFT JOIN deltas ON deltas.location = days.location AND deltas.day = days.day
+)
+-- A day covered by both sources (e.g. while switching write modes) keeps the larger count
+SELECT location, updated_date, MAX(open_count)::bigint AS open_count
+FROM (
+    SELECT location, updated_date, open_count FROM snapshot_counts
+    UNION ALL
+    SELECT location, updated_date, open_count FROM interval_counts WHERE open_count > 0
+) counts
+GROUP BY location, updated_date;
@@ -0,0 +1,165 @@
+"""
+Tests for backend/weather_aggregation.py
+
+The NumPy engine is checked against the pure-Python code it replaced: the
+per-date weighted-average loop from build_resort_weather and a plain
+Largest-Triangle-Three-Buckets implementation.
+
+Usage:
+    python -m pytest tests
+"""
+
+import math
+import os
+import sys
+from datetime import date, timedelta
+
+import numpy as np
+import pytest
+
+# Add project root to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.weather_aggregation import (
+    LTTB_MIN_POINTS,
+    lttb_indices,
+    pivot,
+    station_weights,
+    weighted_means,
+)
+
+FIELDS = ('snow_depth_avg_in', 'temp_min_f', 'precip_total_in')
+# The third station never reports; its weight must not dilute the others
+STATIONS = [('1:CO:SNTL', 2.5), ('2:CO:SNTL', 6.1), ('3:CO:SNTL', 11.8)]
+START = date(2025, 1, 1)
+
+ROWS = [
+    # Both reporting stations, every field present
+    {'date': START, 'station_triplet': '1:CO:SNTL', 'snow_depth_avg_in': 40.0, 'temp_min_f': 10.0, 'precip_total_in': 0.2},
+    {'date': START, 'station_triplet': '2:CO:SNTL', 'snow_depth_avg_in': 52.0, 'temp_min_f': 4.0, 'precip_total_in': 0.0},
+    # Station 2 missing a value, station 1 missing another
+    {'date': START + timedelta(days=1), 'station_triplet': '1:CO:SNTL', 'snow_depth_avg_in': None, 'temp_min_f': 12.0, 'precip_total_in': 0.1},
+    {'date': START + timedelta(days=1), 'station_triplet': '2:CO:SNTL', 'snow_depth_avg_in': 50.0, 'temp_min_f': None, 'precip_total_in': 0.3},
+    # Only station 1 reported that day
+    {'date': START + timedelta(days=2), 'station_triplet': '1:CO:SNTL', 'snow_depth_avg_in': 41.0, 'temp_min_f': 8.0, 'precip_total_in': None},
+]
+
+
+def legacy_weighted(rows: list) -> dict:
+    """The per-date, per-field loop build_resort_weather used before the NumPy engine"""
+    weights = {t: 1.0 / (d + 0.1) for t, d in STATIONS}
+    total_weight = sum(weights.values())
+    weights = {t: w / total_weight for t, w in weights.items()}
+
+    by_date = {}
+    for row in rows:
+        by_date.setdefault(row['date'], []).append(row)
+
+    result = {}
+    for day, day_rows in sorted(by_date.items()):
+        values = {}
+        for field in FIELDS:
+            pairs = [(row[field], weights[row['station_triplet']]) for row in day_rows if row[field] is not None]
+            weight_sum = sum(w for _, w in pairs)
+            values[field] = sum(v * w for v, w in pairs) / weight_sum if weight_sum else None
+        result[day] = values
+    return result
+
+
+def legacy_lttb(y: list, threshold: int) -> list:
+    """Textbook Largest-Triangle-Three-Buckets on evenly spaced points"""
+    n = len(y)
+    if threshold >= n:
+        return list(range(n))
+
+    # Bucket i covers [1 + floor(i * every), 1 + floor((i + 1) * every)), every = (n - 2) / (threshold - 2)
+    def edge(i):
+        return 1 + i * (n - 2) // (threshold - 2)
+
+    selected = [0]
+    a = 0
+    for i in range(threshold - 2):
+        next_start = edge(i + 1)
+        next_end = min(edge(i + 2), n)
+        avg_x = sum(range(next_start, next_end)) / (next_end - next_start)
+        avg_y = sum(y[next_start:next_end]) / (next_end - next_start)
+
+        start, end = edge(i), edge(i + 1)
+        best, best_area = start, -1.0
+        for j in range(start, end):
+            area = abs((a - avg_x) * (y[j] - y[a]) - (a - j) * (avg_y - y[a]))
+            if area > best_area:
+                best, best_area = j, area
+        selected.append(best)
+        a = best
+    selected.append(n - 1)
+    return selected
+
+
+SERIES = [math.sin(i / 3.0) * 10 + (i % 7) for i in range(50)]
+
+
+def test_weighted_means_match_legacy_loop():
+    times, cube = pivot(ROWS, 'date', 'station_triplet', [t for t, _ in STATIONS], FIELDS)
+    means = weighted_means(cube, station_weights([d for _, d in STATIONS]))
+    expected = legacy_weighted(ROWS)
+
+    assert times == sorted(expected)
+    for t, day in enumerate(times):
+        for f, field in enumerate(FIELDS):
+            if expected[day][field] is None:
+                assert np.isnan(means[f, t])
+            else:
+                assert means[f, t] == pytest.approx(expected[day][field])
+
+
+def test_weighted_means_nan_when_no_station_reported():
+    rows = [{'date': START, 'station_triplet': '1:CO:SNTL', 'snow_depth_avg_in': None, 'temp_min_f': None, 'precip_total_in': None}]
+    _, cube = pivot(rows, 'date', 'station_triplet', [t for t, _ in STATIONS], FIELDS)
+    means = weighted_means(cube, station_weights([d for _, d in STATIONS]))
+
+    assert np.isnan(means).all()
+
+
+@pytest.mark.parametrize('threshold', [3, 4, 10, 25, 47, 48, 49])
+def test_lttb_matches_legacy(threshold):
+    assert lttb_indices(np.array(SERIES), threshold).tolist() == legacy_lttb(SERIES, threshold)
+
+
+def test_lttb_threshold_three_keeps_endpoints():
+    indices = lttb_indices(np.array(SERIES), 3).tolist()
+
+    assert len(indices) == 3
+    assert indices[0] == 0 and indices[-1] == len(SERIES) - 1
+
+
+@pytest.mark.parametrize('threshold', [len(SERIES), len(SERIES) + 1])
+def test_lttb_threshold_at_or_above_length_keeps_everything(threshold):
+    assert lttb_indices(np.array(SERIES), threshold).tolist() == list(range(len(SERIES)))
+
+
+def test_lttb_nans_treated_as_mean():
+    y = np.array(SERIES)
+    y[[5, 17, 30]] = np.nan
+    filled = np.where(np.isnan(y), np.nanmean(y), y)
+
+    assert lttb_indices(y, 10).tolist() == legacy_lttb(filled.tolist(), 10)
+
+
+@pytest.mark.parametrize('threshold', [LTTB_MIN_POINTS - 1, 0, -5])
+def test_lttb_rejects_threshold_below_minimum(threshold):
+    with pytest.raises(ValueError):
+        lttb_indices(np.array(SERIES), threshold)
+
+
+@pytest.mark.parametrize('max_points', [None, LTTB_MIN_POINTS, 500])
+def test_validate_max_points_accepts(max_points):
+    from backend.schema import validate_max_points
+    validate_max_points(max_points)
+
+
+@pytest.mark.parametrize('max_points', [2, 1, 0, -1])
+def test_validate_max_points_rejects(max_points):
+    from backend.schema import validate_max_points
+    with pytest.raises(ValueError, match="maxPoints must be at least 3"):
+        validate_max_points(max_points)
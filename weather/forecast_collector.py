@@ -3,15 +3,21 @@
 Weather Forecast Collector
 
 Fetches weather forecasts from Open-Meteo API for Colorado ski resorts.
-Normalizes the data into a common schema and generates SQL INSERT statements.
+Normalizes the data into ForecastRecords and either loads them directly
+(ingestion bulk upsert) or generates SQL INSERT statements.
 """
 
-import json
-import requests
-from datetime import datetime, timedelta
+import sys
+from datetime import datetime
+from pathlib import Path
 from typing import Optional, List, Dict, Any
 import os
-import time
+
+# Repo root, for the shared ingestion package
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from http_client import OPEN_METEO_BATCH_SIZE, HttpClient, fetch_open_meteo_batches
+from ingestion import ForecastRecord, load_records, load_resort_coordinates
 
 
 class ForecastCollector:
@@ -19,6 +25,16 @@ class ForecastCollector:
     
     OPEN_METEO_BASE_URL = "https://api.open-meteo.com/v1/forecast"
     
+    # Daily data only - properly aggregated in America/Denver timezone
+    # This ensures snowfall_sum is the true daily total, not hourly values
+    OPEN_METEO_PARAMS = {
+        "daily": "temperature_2m_max,temperature_2m_min,precipitation_sum,snowfall_sum,precipitation_probability_max,weather_code",
+        "temperature_unit": "fahrenheit",
+        "precipitation_unit": "inch",
+        "timezone": "America/Denver",
+        "forecast_days": 7
+    }
+    
     def __init__(self, mapping_file: str = "resort_snotel_mapping.json"):
         """
         Initialize the collector with resort coordinates.
@@ -28,52 +44,29 @@ class ForecastCollector:
         """
         self.mapping_file = mapping_file
         self.resort_coordinates = self._load_resort_coordinates()
+        self.http = HttpClient()
     
     def _load_resort_coordinates(self) -> Dict[str, Dict[str, float]]:
         """Load resort coordinates from mapping file."""
         script_dir = os.path.dirname(os.path.abspath(__file__))
-        mapping_path = os.path.join(script_dir, self.mapping_file)
-        
-        with open(mapping_path, "r") as f:
-            mapping = json.load(f)
-        
-        # Extract resort coordinates (the entry without ":" in key)
-        coordinates = {}
-        for resort_name, resort_data in mapping.items():
-            for key, value in resort_data.items():
-                if ":" not in key:  # This is the resort itself, not a SNOTEL station
-                    coordinates[resort_name] = {
-                        "latitude": value.get("latitude"),
-                        "longitude": value.get("longitude")
-                    }
-                    break
-        
-        return coordinates
+        return load_resort_coordinates(os.path.join(script_dir, self.mapping_file))
     
     def _fetch_open_meteo_forecast(self, latitude: float, longitude: float) -> Optional[Dict[str, Any]]:
         """Fetch forecast from Open-Meteo API with daily aggregates in Denver timezone."""
-        try:
-            # Request daily data only - properly aggregated in America/Denver timezone
-            # This ensures snowfall_sum is the true daily total, not hourly values
-            params = {
-                "latitude": latitude,
-                "longitude": longitude,
-                "daily": "temperature_2m_max,temperature_2m_min,precipitation_sum,snowfall_sum,precipitation_probability_max,weather_code",
-                "temperature_unit": "fahrenheit",
-                "precipitation_unit": "inch",
-                "timezone": "America/Denver",
-                "forecast_days": 7
-            }
-            
-            response = requests.get(self.OPEN_METEO_BASE_URL, params=params, timeout=10)
-            response.raise_for_status()
-            return response.json()
-            
-        except requests.exceptions.RequestException as e:
-            print(f"  ❌ Error fetching Open-Meteo data: {str(e)}")
-            return None
+        return self._fetch_open_meteo_forecasts([{"latitude": latitude, "longitude": longitude}])[0]
     
-    def _parse_open_meteo_forecast(self, forecast_data: Dict[str, Any], resort_name: str, forecast_time: datetime) -> List[Dict[str, Any]]:
+    def _fetch_open_meteo_forecasts(
+        self,
+        coordinates: List[Dict[str, float]],
+        batch_size: int = OPEN_METEO_BATCH_SIZE
+    ) -> List[Optional[Dict[str, Any]]]:
+        """Fetch forecasts for many locations, in the order given (None where a request failed)."""
+        return fetch_open_meteo_batches(
+            self.OPEN_METEO_BASE_URL, coordinates, self.OPEN_METEO_PARAMS,
+            client=self.http, batch_size=batch_size
+        )
+    
+    def _parse_open_meteo_forecast(self, forecast_data: Dict[str, Any], resort_name: str, forecast_time: datetime) -> List[ForecastRecord]:
         """Parse Open-Meteo daily forecast data into normalized format."""
         forecasts = []
         
@@ -94,19 +87,19 @@ class ForecastCollector:
             code = weather_code[i] if i < len(weather_code) else None
             conditions_text = self._map_weathercode(code)
             
-            forecast = {
-                "resort_name": resort_name,
-                "source": "OPEN_METEO",
-                "forecast_time": forecast_time,
-                "valid_time": valid_date,
-                "temp_high_f": temp_max[i] if i < len(temp_max) else None,
-                "temp_low_f": temp_min[i] if i < len(temp_min) else None,
-                "snow_amount_in": snowfall_sum[i] if i < len(snowfall_sum) else None,
-                "precip_amount_in": precip_sum[i] if i < len(precip_sum) else None,
-                "precip_prob_pct": int(precip_prob_max[i]) if i < len(precip_prob_max) and precip_prob_max[i] is not None else None,
-                "conditions_text": conditions_text,
-                "icon_code": str(code) if code is not None else None,
-            }
+            forecast = ForecastRecord(
+                resort_name=resort_name,
+                source="OPEN_METEO",
+                forecast_time=forecast_time,
+                valid_time=valid_date,
+                temp_high_f=temp_max[i] if i < len(temp_max) else None,
+                temp_low_f=temp_min[i] if i < len(temp_min) else None,
+                snow_amount_in=snowfall_sum[i] if i < len(snowfall_sum) else None,
+                precip_amount_in=precip_sum[i] if i < len(precip_sum) else None,
+                precip_prob_pct=int(precip_prob_max[i]) if i < len(precip_prob_max) and precip_prob_max[i] is not None else None,
+                conditions_text=conditions_text,
+                icon_code=str(code) if code is not None else None,
+            )
             
             forecasts.append(forecast)
         
@@ -151,8 +144,15 @@ class ForecastCollector:
         
         return code_map.get(code, f"Unknown ({code})")
     
-    def fetch_all_forecasts(self) -> List[Dict[str, Any]]:
-        """Fetch forecasts from Open-Meteo for all resorts."""
+    def fetch_all_forecasts(self, batched: bool = True) -> List[ForecastRecord]:
+        """
+        Fetch forecasts from Open-Meteo for all resorts.
+        
+        Args:
+            batched: Request up to OPEN_METEO_BATCH_SIZE resorts per call and
+                split the response back per resort; otherwise one call per
+                resort. Either way the calls run concurrently, rate limited.
+        """
         all_forecasts = []
         forecast_time = datetime.now()
         
@@ -160,32 +160,34 @@ class ForecastCollector:
         print(f"Forecast time: {forecast_time.isoformat()}")
         print()
         
-        for resort_name, coords in self.resort_coordinates.items():
-            lat = coords["latitude"]
-            lon = coords["longitude"]
-            
-            print(f"📍 {resort_name} ({lat}, {lon})")
-            
-            # Fetch Open-Meteo forecast
-            print("  Fetching Open-Meteo forecast...")
-            om_data = self._fetch_open_meteo_forecast(lat, lon)
+        resort_names = list(self.resort_coordinates)
+        batch_size = OPEN_METEO_BATCH_SIZE if batched else 1
+        print(f"Fetching Open-Meteo forecasts ({batch_size} resort(s) per request, concurrent)...")
+        results = self._fetch_open_meteo_forecasts(
+            [self.resort_coordinates[name] for name in resort_names], batch_size
+        )
+        
+        for resort_name, om_data in zip(resort_names, results):
             if om_data:
                 om_forecasts = self._parse_open_meteo_forecast(om_data, resort_name, forecast_time)
                 all_forecasts.extend(om_forecasts)
-                print(f"  ✅ Open-Meteo: {len(om_forecasts)} days")
+                print(f"  ✅ {resort_name}: {len(om_forecasts)} days")
             else:
-                print(f"  ⚠️  Open-Meteo: No data")
-            
-            print()
-            time.sleep(0.3)  # Rate limiting
+                print(f"  ⚠️  {resort_name}: No data")
         
+        print()
         return all_forecasts
     
-    def generate_sql_inserts(self, forecasts: List[Dict[str, Any]]) -> str:
+    def load_forecasts(self, conn, forecasts: List[ForecastRecord]) -> dict:
+        """Upsert forecasts in one transaction (COPY into staging + one merge)."""
+        return load_records(conn, ForecastRecord, forecasts)
+    
+    def generate_sql_inserts(self, forecasts: List[ForecastRecord]) -> str:
         """Generate SQL INSERT statements for forecasts."""
         inserts = []
         
         for forecast in forecasts:
+            forecast = forecast._asdict()
             # Format timestamps
             forecast_time_str = forecast["forecast_time"].strftime("%Y-%m-%d %H:%M:%S")
             valid_time_str = forecast["valid_time"].strftime("%Y-%m-%d %H:%M:%S")
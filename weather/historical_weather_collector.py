@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Historical Weather Collector
+
+Fetches observed daily weather (high/low temperature, precipitation,
+snowfall) for every resort from the Open-Meteo Archive API and loads it into
+WEATHER_DATA.historical_weather with the ingestion bulk upsert. Shared by the
+historical_weather Lambda and scripts/backfill_historical_data.py.
+"""
+
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+# Repo root, for the shared ingestion package
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from http_client import HttpClient, fetch_open_meteo_batches
+from ingestion import HistoricalWeatherRecord, load_records, load_resort_coordinates
+
+
+OPEN_METEO_ARCHIVE_URL = "https://archive-api.open-meteo.com/v1/archive"
+
+
+def fetch_historical_weather_batch(
+    locations: Dict[str, Dict[str, float]],
+    start_date: str,
+    end_date: str,
+    client: Optional[HttpClient] = None
+) -> Dict[str, Optional[Dict[str, Any]]]:
+    """
+    Fetch historical daily weather data for several locations from Open-Meteo Archive API.
+
+    Coordinates are sent as comma-separated lists, up to OPEN_METEO_BATCH_SIZE
+    per request; the requests run concurrently through the rate-limited,
+    retrying client and each response array is split back per location.
+    Uses daily aggregates to get proper high/low temperatures for each day.
+
+    Args:
+        locations: Resort name -> {"latitude", "longitude"}
+        start_date: Start date in YYYY-MM-DD format
+        end_date: End date in YYYY-MM-DD format (inclusive)
+        client: Shared HTTP client (a temporary one is created and closed if omitted)
+
+    Returns:
+        Resort name -> API response data, or None if its request failed
+    """
+    names = list(locations)
+    params = {
+        "start_date": start_date,
+        "end_date": end_date,
+        "daily": "temperature_2m_max,temperature_2m_min,precipitation_sum,snowfall_sum",
+        "temperature_unit": "fahrenheit",
+        "precipitation_unit": "inch",
+        "timezone": "America/Denver",
+    }
+    # A client created here is closed here; a shared one is left to its owner
+    own_client = client is None
+    client = client or HttpClient()
+    try:
+        responses = fetch_open_meteo_batches(
+            OPEN_METEO_ARCHIVE_URL, [locations[name] for name in names], params, client, timeout=60
+        )
+    finally:
+        if own_client:
+            client.close()
+    return dict(zip(names, responses))
+
+
+def parse_historical_weather(resort_name: str, data: Dict[str, Any]) -> List[HistoricalWeatherRecord]:
+    """
+    Turn an Open-Meteo daily archive response into records.
+
+    Stored with observation_hour=0 to represent the full day's data.
+    """
+    daily = data.get("daily", {})
+    times = daily.get("time", [])
+    temp_max = daily.get("temperature_2m_max", [])
+    temp_min = daily.get("temperature_2m_min", [])
+    precipitations = daily.get("precipitation_sum", [])
+    snowfalls = daily.get("snowfall_sum", [])
+
+    return [
+        HistoricalWeatherRecord(
+            resort_name=resort_name,
+            observation_date=time_str,  # Already in YYYY-MM-DD format
+            observation_hour=0,
+            temperature_f=temp_max[i] if i < len(temp_max) else None,
+            temp_min_f=temp_min[i] if i < len(temp_min) else None,
+            precipitation_in=precipitations[i] if i < len(precipitations) else None,
+            snowfall_in=snowfalls[i] if i < len(snowfalls) else None,
+        )
+        for i, time_str in enumerate(times)
+    ]
+
+
+def collect_historical_weather(
+    begin_date: str,
+    end_date: str,
+    locations: Optional[Dict[str, Dict[str, float]]] = None
+) -> List[HistoricalWeatherRecord]:
+    """Fetch and parse daily records for every resort (end_date inclusive)."""
+    locations = locations or load_resort_coordinates()
+
+    records = []
+    for resort_name, data in fetch_historical_weather_batch(locations, begin_date, end_date).items():
+        if data:
+            resort_records = parse_historical_weather(resort_name, data)
+            records.extend(resort_records)
+            print(f"  ✅ {resort_name}: {len(resort_records)} daily records")
+        else:
+            print(f"  ⚠️  {resort_name}: No data received")
+
+    return records
+
+
+def load_historical_weather(conn, records: List[HistoricalWeatherRecord]) -> dict:
+    """Upsert records in one transaction (COPY into staging + one merge)."""
+    return load_records(conn, HistoricalWeatherRecord, records)
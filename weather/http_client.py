@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+HTTP Client
+
+Shared keep-alive session for the weather API collectors, with a token-bucket
+rate limiter, retries with jittered exponential backoff (honouring 429 /
+Retry-After) and a small thread pool for issuing independent requests
+concurrently.
+"""
+
+import os
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+# Sustained requests per second and burst size across all threads
+HTTP_RATE_LIMIT = float(os.environ.get("HTTP_RATE_LIMIT", "5"))
+HTTP_BURST = int(os.environ.get("HTTP_BURST", "5"))
+# Retries after the first attempt for 429, 5xx and connection errors
+HTTP_MAX_RETRIES = int(os.environ.get("HTTP_MAX_RETRIES", "3"))
+# Base delay (seconds) for exponential backoff
+HTTP_BACKOFF = float(os.environ.get("HTTP_BACKOFF", "0.5"))
+# Concurrent requests in get_json_many (also the connection pool size)
+HTTP_MAX_WORKERS = int(os.environ.get("HTTP_MAX_WORKERS", "8"))
+# Locations per Open-Meteo request (comma-separated coordinates)
+OPEN_METEO_BATCH_SIZE = int(os.environ.get("OPEN_METEO_BATCH_SIZE", "50"))
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+class TokenBucket:
+    """Thread-safe token bucket; pause() holds every caller back (e.g. after a 429)"""
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = max(1, capacity)
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a token is available"""
+        if self.rate <= 0:
+            return
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                if now < self._paused_until:
+                    wait = self._paused_until - now
+                else:
+                    self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                    self._updated = now
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        return
+                    wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+    def pause(self, seconds: float):
+        """Hand out no tokens for `seconds`, and restart from an empty bucket"""
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+            self._tokens = 0.0
+            self._updated = self._paused_until
+
+
+def retry_after_seconds(response: requests.Response) -> Optional[float]:
+    """Seconds from a Retry-After header (delta-seconds or HTTP date), if present"""
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class HttpClient:
+    """Rate-limited, retrying HTTP client over one keep-alive session"""
+
+    def __init__(
+        self,
+        rate: float = HTTP_RATE_LIMIT,
+        burst: int = HTTP_BURST,
+        max_retries: int = HTTP_MAX_RETRIES,
+        backoff: float = HTTP_BACKOFF,
+        max_workers: int = HTTP_MAX_WORKERS,
+    ):
+        self.bucket = TokenBucket(rate, burst)
+        self.max_retries = max(0, max_retries)
+        self.backoff = backoff
+        self.max_workers = max(1, max_workers)
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=self.max_workers, pool_maxsize=self.max_workers)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def get(self, url: str, params: Optional[dict] = None, timeout: float = 30) -> requests.Response:
+        """GET with rate limiting and retries; raises requests exceptions once retries run out"""
+        for attempt in range(self.max_retries + 1):
+            self.bucket.acquire()
+            retries_left = attempt < self.max_retries
+            try:
+                response = self.session.get(url, params=params, timeout=timeout)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                if not retries_left:
+                    raise
+                delay = self._backoff_delay(attempt)
+                print(f"  ⚠️  {type(e).__name__}, retrying in {delay:.1f}s")
+                time.sleep(delay)
+                continue
+
+            if response.status_code not in RETRY_STATUSES or not retries_left:
+                response.raise_for_status()
+                return response
+
+            delay = retry_after_seconds(response)
+            if delay is None:
+                delay = self._backoff_delay(attempt)
+            if response.status_code == 429:
+                # The limit is shared, so every thread backs off, not just this one
+                self.bucket.pause(delay)
+            print(f"  ⚠️  HTTP {response.status_code}, retrying in {delay:.1f}s")
+            response.close()
+            time.sleep(delay)
+
+    def get_json(self, url: str, params: Optional[dict] = None, timeout: float = 30) -> Any:
+        """GET and decode a JSON body"""
+        return self.get(url, params=params, timeout=timeout).json()
+
+    def get_json_many(self, calls: List[Tuple[str, dict]], timeout: float = 30) -> List[Any]:
+        """Run independent (url, params) GETs concurrently
+
+        Results keep the order of `calls`; a failed call yields its exception
+        instead of raising, so one bad request doesn't sink the rest.
+        """
+        def fetch(call):
+            url, params = call
+            try:
+                return self.get_json(url, params=params, timeout=timeout)
+            except (requests.exceptions.RequestException, ValueError) as e:
+                return e
+
+        if len(calls) <= 1:
+            return [fetch(call) for call in calls]
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(calls))) as executor:
+            return list(executor.map(fetch, calls))
+
+    def _backoff_delay(self, attempt: int) -> float:
+        """Full-jitter exponential backoff"""
+        return random.uniform(0, self.backoff * (2 ** attempt))
+
+    def close(self):
+        self.session.close()
+
+
+def fetch_open_meteo_batches(
+    url: str,
+    coordinates: List[Dict[str, float]],
+    params: Dict[str, Any],
+    client: HttpClient,
+    batch_size: int = OPEN_METEO_BATCH_SIZE,
+    timeout: float = 30,
+) -> List[Optional[Dict[str, Any]]]:
+    """Fetch an Open-Meteo endpoint for many locations, in the order given
+
+    Locations are sent `batch_size` per request as comma-separated
+    coordinates, the requests run concurrently through the client, and each
+    response is split back per location. A failed request yields None for
+    each of its locations.
+    """
+    batch_size = max(1, batch_size)
+    batches = [coordinates[i:i + batch_size] for i in range(0, len(coordinates), batch_size)]
+    calls = [
+        (url, {
+            "latitude": ",".join(str(coords["latitude"]) for coords in batch),
+            "longitude": ",".join(str(coords["longitude"]) for coords in batch),
+            **params,
+        })
+        for batch in batches
+    ]
+
+    results = []
+    for batch, data in zip(batches, client.get_json_many(calls, timeout=timeout)):
+        if isinstance(data, Exception):
+            print(f"  ❌ Error fetching Open-Meteo data for {len(batch)} location(s): {str(data)}")
+            data = []
+        # One location comes back as an object, several as an array
+        if isinstance(data, dict):
+            data = [data]
+        results.extend(data[i] if i < len(data) else None for i in range(len(batch)))
+    return results
@@ -1,39 +1,36 @@
 #!/usr/bin/env python3
 """
 ECS-compatible entrypoint for SNOTEL data collection.
-Runs every 3 hours, fetching hourly data for a 4-hour window.
+Runs every 3 hours, fetching hourly data since each station's watermark
+(last stored observation, minus a short lookback).
 """
 
 import os
 import sys
 from pathlib import Path
-from datetime import datetime, timedelta
+from datetime import datetime
 
-# Add weather directory to path
+# Add weather directory (and the repo root, for the shared ingestion package) to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 sys.path.insert(0, str(Path(__file__).parent))
 
 from snotel_data_collector import SNOTELDataCollector
+from ingestion import get_db_connection
 
 
 def run_snotel_refresh():
-    """Run SNOTEL data collection for hourly data from the past 4 hours"""
+    """Run an incremental SNOTEL collection of hourly data since the last stored observations"""
     print("=" * 60)
     print("Starting SNOTEL Weather Data Refresh")
     print("=" * 60)
     
-    # Calculate 4-hour window
-    # The SNOTEL API works with dates, so we need to include both today and potentially yesterday
-    # to cover the 4-hour window (e.g., if it's 2 AM, we need yesterday's data too)
+    # The SNOTEL API works with dates; the begin date comes from the per-station
+    # watermarks, so a run only requests what is missing since the last one
     now = datetime.now()
-    four_hours_ago = now - timedelta(hours=4)
-    
-    # Use the dates that cover our 4-hour window
-    begin_date_str = four_hours_ago.strftime("%Y-%m-%d")
     end_date_str = now.strftime("%Y-%m-%d")
     
     print(f"Duration: HOURLY")
-    print(f"Time Window: {four_hours_ago.strftime('%Y-%m-%d %H:%M')} to {now.strftime('%Y-%m-%d %H:%M')}")
-    print(f"Date Range: {begin_date_str} to {end_date_str}")
+    print(f"End Date: {end_date_str}")
     print()
     
     # Get DATABASE_URL from environment (will be injected by ECS from Secrets Manager)
@@ -49,105 +46,25 @@ def run_snotel_refresh():
     # Set environment variable for the collector
     os.environ["DATABASE_URL"] = database_url
     
-    # Output SQL file path
-    sql_output_file = "/tmp/snotel_import.sql"
-    
     try:
         # Initialize collector
         collector = SNOTELDataCollector()
         
-        # Collect data and generate SQL
-        print("Collecting SNOTEL data from USDA API...")
-        sql = collector.collect_and_generate_sql(
-            begin_date=begin_date_str,
-            end_date=end_date_str,
-            duration="HOURLY",
-            output_file=sql_output_file
-        )
-        
-        # Count observations
-        obs_count = 0
-        if os.path.exists(sql_output_file):
-            with open(sql_output_file, 'r') as f:
-                content = f.read()
-                obs_count = content.count("INSERT INTO WEATHER_DATA.snotel_observations")
-        
-        print(f"✅ Generated SQL with {obs_count} observation records")
-        print()
-        
-        # Execute SQL against database
-        print("Executing SQL against database...")
-        
-        # Import database execution logic
-        from urllib.parse import urlparse, unquote
-        
-        # Try psycopg3 first (better support), fallback to psycopg2
+        # Collect only data past each station's watermark and load it in one transaction
+        print("Collecting new SNOTEL data from USDA API and loading into database...")
+        conn = get_db_connection(database_url)
         try:
-            import psycopg
-            USE_PSYCOPG3 = True
-        except ImportError:
-            try:
-                import psycopg2
-                USE_PSYCOPG3 = False
-            except ImportError:
-                print("❌ Error: Neither psycopg nor psycopg2 installed")
-                sys.exit(1)
-        
-        # Parse DATABASE_URL and connect
-        parsed = urlparse(database_url)
-        db_password = unquote(parsed.password) if parsed.password else None
-        if db_password and '%' in db_password:
-            db_password = unquote(db_password)
-        
-        # Build connection parameters
-        conn_params = {
-            'host': parsed.hostname or 'localhost',
-            'port': parsed.port or 5432,
-            'user': parsed.username,
-            'password': db_password,
-            'sslmode': 'prefer'
-        }
-        
-        if USE_PSYCOPG3:
-            conn_params['dbname'] = parsed.path.lstrip('/')
-            conn = psycopg.connect(**conn_params)
-        else:
-            conn_params['database'] = parsed.path.lstrip('/')
-            conn = psycopg2.connect(**conn_params)
-        
-        cursor = conn.cursor()
-        
-        # Read and execute SQL file
-        with open(sql_output_file, 'r') as f:
-            sql_content = f.read()
-        
-        # Split by semicolon and execute each statement
-        statements = [stmt.strip() for stmt in sql_content.split(';') if stmt.strip()]
-        
-        success_count = 0
-        error_count = 0
-        
-        for i, statement in enumerate(statements):
-            if statement and not statement.startswith('--'):
-                try:
-                    cursor.execute(statement)
-                    # Commit after each successful statement to allow partial success
-                    conn.commit()
-                    success_count += 1
-                except Exception as e:
-                    error_count += 1
-                    # Rollback the failed transaction so we can continue with next statement
-                    conn.rollback()
-                    if 'INSERT' in statement or 'CREATE' in statement:
-                        print(f"  ⚠️  Warning on statement {i+1}: {str(e)[:100]}")
-        
-        cursor.close()
-        conn.close()
-        
-        print(f"✅ Executed {success_count} statements successfully")
-        if error_count > 0:
-            print(f"⚠️  {error_count} statements had warnings/errors")
-        
+            counts = collector.collect_incremental(
+                conn,
+                end_date=end_date_str,
+                duration="HOURLY"
+            )
+        finally:
+            conn.close()
+        
+        begin_date_str = counts["begin_date"]
+        obs_count = counts["observations_merged"]
+        print(f"✅ Loaded {counts['observations_copied']} observations ({obs_count} rows written)")
         print()
         print("=" * 60)
         print("✅ SNOTEL data refresh complete!")
@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+"""
+SNOTEL Backfill
+
+Backfills long SNOTEL date ranges in (station group x date window) chunks.
+Chunks are fetched concurrently by a bounded worker pool that shares a rate
+limiter, and each chunk is loaded in its own transaction together with its
+checkpoint rows (WEATHER_DATA.snotel_backfill_checkpoints). A failed or
+interrupted backfill can simply be re-run: completed chunks are skipped.
+"""
+
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta
+from typing import Optional
+
+from snotel_data_collector import SNOTELDataCollector, STREAM_WINDOW_DAYS
+from snotel_loader import load_observations, write_observations
+from ingestion import get_db_connection
+
+
+# Concurrent chunk requests (and database connections)
+BACKFILL_WORKERS = int(os.environ.get("SNOTEL_BACKFILL_WORKERS", "4"))
+# Maximum AWDB requests started per second across all workers
+BACKFILL_RATE = float(os.environ.get("SNOTEL_BACKFILL_RATE", "2"))
+# Stations per request
+BACKFILL_GROUP_SIZE = int(os.environ.get("SNOTEL_BACKFILL_GROUP_SIZE", "10"))
+
+COMPLETED_CHUNKS_SQL = """
+    SELECT station_triplet, window_begin, window_end
+    FROM WEATHER_DATA.snotel_backfill_checkpoints
+    WHERE duration = %s AND window_end > %s AND window_begin < %s
+"""
+
+CHECKPOINT_SQL = """
+    INSERT INTO WEATHER_DATA.snotel_backfill_checkpoints
+        (duration, station_triplet, window_begin, window_end, observations)
+    VALUES (%s, %s, %s, %s, %s)
+    ON CONFLICT (duration, station_triplet, window_begin, window_end) DO UPDATE SET
+        observations = EXCLUDED.observations,
+        completed_at = CURRENT_TIMESTAMP
+"""
+
+
+class RateLimiter:
+    """Thread-safe limiter that spaces calls at least 1/rate seconds apart"""
+
+    def __init__(self, rate: float):
+        self.interval = 1.0 / rate if rate > 0 else 0.0
+        self._next = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self):
+        """Block until the caller may start its next request"""
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next)
+            self._next = start + self.interval
+        if start > now:
+            time.sleep(start - now)
+
+
+def plan_chunks(
+    stations: list[str],
+    begin_date: str,
+    end_date: str,
+    group_size: int,
+    window_days: int,
+) -> list[tuple[list[str], str, str]]:
+    """Split a backfill into (station group, window begin, window end) chunks; end is exclusive"""
+    groups = [stations[i:i + group_size] for i in range(0, len(stations), group_size)]
+
+    windows = []
+    begin = datetime.strptime(begin_date, "%Y-%m-%d")
+    end = datetime.strptime(end_date, "%Y-%m-%d")
+    while begin < end:
+        window_end = min(begin + timedelta(days=window_days), end)
+        windows.append((begin.strftime("%Y-%m-%d"), window_end.strftime("%Y-%m-%d")))
+        begin = window_end
+
+    return [(group, window_begin, window_end) for window_begin, window_end in windows for group in groups]
+
+
+class SNOTELBackfill:
+    """Chunked, concurrent, resumable SNOTEL backfill"""
+
+    def __init__(
+        self,
+        database_url: str,
+        collector: Optional[SNOTELDataCollector] = None,
+        workers: int = BACKFILL_WORKERS,
+        rate: float = BACKFILL_RATE,
+        group_size: int = BACKFILL_GROUP_SIZE,
+        window_days: Optional[int] = None,
+    ):
+        self.database_url = database_url
+        self.collector = collector or SNOTELDataCollector()
+        self.workers = max(1, workers)
+        self.rate_limiter = RateLimiter(rate)
+        self.group_size = max(1, group_size)
+        self.window_days = window_days
+        self._local = threading.local()
+        self._connections = []
+        self._connections_lock = threading.Lock()
+
+    def run(self, begin_date: str, end_date: str, duration: str = "HOURLY") -> dict:
+        """Backfill [begin_date, end_date) and return chunk/observation totals"""
+        window_days = self.window_days or STREAM_WINDOW_DAYS.get(duration, 7)
+        chunks = plan_chunks(self.collector.unique_stations, begin_date, end_date, self.group_size, window_days)
+
+        conn = get_db_connection(self.database_url)
+        try:
+            # Stations/mappings first: observations reference snotel_stations
+            load_observations(
+                conn, [],
+                stations=self.collector.station_rows(),
+                mappings=self.collector.resort_mapping_rows(),
+            )
+            completed = self._completed_windows(conn, duration, begin_date, end_date)
+        finally:
+            conn.close()
+
+        pending = [chunk for chunk in chunks if not self._is_done(chunk, completed)]
+
+        print(f"SNOTEL backfill {begin_date} to {end_date} ({duration})")
+        print(f"  Chunks: {len(chunks)} ({len(chunks) - len(pending)} already done, {len(pending)} to fetch)")
+        print(f"  Workers: {self.workers}, rate: {1 / self.rate_limiter.interval if self.rate_limiter.interval else 'unlimited'} req/s")
+
+        totals = {"chunks": len(chunks), "skipped": len(chunks) - len(pending), "loaded": 0, "failed": 0, "observations": 0}
+        try:
+            with ThreadPoolExecutor(max_workers=self.workers) as executor:
+                futures = {executor.submit(self._run_chunk, chunk, duration): chunk for chunk in pending}
+                for done, future in enumerate(as_completed(futures), start=1):
+                    stations, window_begin, window_end = futures[future]
+                    label = f"[{done}/{len(pending)}] {window_begin} → {window_end}, {len(stations)} stations"
+                    try:
+                        merged = future.result()
+                        totals["loaded"] += 1
+                        totals["observations"] += merged
+                        print(f"  ✅ {label}: {merged} observations")
+                    except Exception as e:
+                        totals["failed"] += 1
+                        print(f"  ❌ {label}: {str(e)[:200]}")
+        finally:
+            self._close_connections()
+
+        return totals
+
+    def _run_chunk(self, chunk: tuple[list[str], str, str], duration: str) -> int:
+        """Fetch one chunk and commit its observations together with its checkpoints"""
+        stations, window_begin, window_end = chunk
+
+        # Windows are [window_begin, window_end): AWDB treats a date-only endDate
+        # as exclusive (see lambdas/snotel/handler.py), so the next window starts
+        # exactly where this one stops and the checkpoint covers what was fetched
+        self.rate_limiter.wait()
+        api_data = self.collector.fetch_snotel_data(
+            window_begin, window_end, duration, stations=stations, verbose=False
+        )
+
+        conn = self._connection()
+        cursor = conn.cursor()
+        try:
+            counts = write_observations(cursor, self.collector.observation_rows(api_data, duration))
+            per_station = {}
+            for station_data in api_data:
+                triplet = station_data.get("stationTriplet")
+                if triplet:
+                    per_station[triplet] = sum(len(item.get("values", [])) for item in station_data.get("data", []))
+            cursor.executemany(CHECKPOINT_SQL, [
+                (duration, triplet, window_begin, window_end, per_station.get(triplet, 0))
+                for triplet in stations
+            ])
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            cursor.close()
+
+        return counts["observations_merged"]
+
+    def _connection(self):
+        """One database connection per worker thread"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = get_db_connection(self.database_url)
+            self._local.conn = conn
+            with self._connections_lock:
+                self._connections.append(conn)
+        return conn
+
+    def _close_connections(self):
+        with self._connections_lock:
+            connections, self._connections = self._connections, []
+        for conn in connections:
+            try:
+                conn.close()
+            except Exception:
+                pass
+
+    @staticmethod
+    def _completed_windows(conn, duration: str, begin_date: str, end_date: str) -> dict:
+        """station_triplet -> [(window_begin, window_end)] checkpoints overlapping the range"""
+        cursor = conn.cursor()
+        try:
+            cursor.execute(COMPLETED_CHUNKS_SQL, (duration, begin_date, end_date))
+            completed = {}
+            for triplet, window_begin, window_end in cursor.fetchall():
+                completed.setdefault(triplet, []).append((str(window_begin), str(window_end)))
+            return completed
+        finally:
+            cursor.close()
+
+    @staticmethod
+    def _is_done(chunk: tuple[list[str], str, str], completed: dict) -> bool:
+        """A chunk is done when every station has a checkpoint covering its whole window"""
+        stations, window_begin, window_end = chunk
+        return all(
+            any(done_begin <= window_begin and done_end >= window_end for done_begin, done_end in completed.get(triplet, []))
+            for triplet in stations
+        )
+
+
+def main():
+    """Command-line entry point for a resumable SNOTEL backfill."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Chunked, resumable SNOTEL backfill")
+    parser.add_argument("--begin-date", required=True, help="Start date (YYYY-MM-DD)")
+    parser.add_argument("--end-date", required=True, help="End date (YYYY-MM-DD), exclusive")
+    parser.add_argument("--duration", choices=["DAILY", "HOURLY"], default="HOURLY", help="Data duration. Default: HOURLY")
+    parser.add_argument("--workers", type=int, default=BACKFILL_WORKERS, help=f"Concurrent requests. Default: {BACKFILL_WORKERS}")
+    parser.add_argument("--rate", type=float, default=BACKFILL_RATE, help=f"Max requests per second. Default: {BACKFILL_RATE}")
+    parser.add_argument("--group-size", type=int, default=BACKFILL_GROUP_SIZE, help=f"Stations per request. Default: {BACKFILL_GROUP_SIZE}")
+    parser.add_argument("--window-days", type=int, default=None, help="Days per request. Default: 7 hourly, 90 daily")
+    parser.add_argument("--resort", type=str, default=None, help="Only backfill stations for this resort")
+    args = parser.parse_args()
+
+    database_url = os.getenv("DATABASE_URL")
+    if not database_url:
+        parser.error("DATABASE_URL environment variable is required")
+
+    backfill = SNOTELBackfill(
+        database_url,
+        collector=SNOTELDataCollector(resort_filter=args.resort),
+        workers=args.workers,
+        rate=args.rate,
+        group_size=args.group_size,
+        window_days=args.window_days,
+    )
+    totals = backfill.run(args.begin_date, args.end_date, args.duration)
+    print(f"Done: {totals['loaded']} chunks loaded, {totals['skipped']} skipped, "
+          f"{totals['failed']} failed, {totals['observations']} observations")
+    if totals["failed"]:
+        print("Re-run the same command to retry the failed chunks.")
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
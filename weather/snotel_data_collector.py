@@ -2,16 +2,24 @@
 """
 SNOTEL Data Collector
 
-Queries USDA AWDB REST API for SNOTEL weather station data and generates
-SQL INSERT statements for the WEATHER_DATA schema in PostgreSQL.
+Queries USDA AWDB REST API for SNOTEL weather station data and either
+generates SQL INSERT statements for the WEATHER_DATA schema in PostgreSQL or
+loads it directly (see snotel_loader.py).
 """
 
 import json
 import requests
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Iterable, Iterator, Optional
 import os
 
+# Optional incremental JSON parser: lets streaming mode parse one station at a
+# time straight off the socket instead of materializing the whole response
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
 
 # SNOTEL elements relevant for ski resort weather/snow data
 SNOW_WEATHER_ELEMENTS = [
@@ -31,6 +39,41 @@ SNOW_WEATHER_ELEMENTS = [
     "RHUMV",   # Relative Humidity Average
 ]
 
+# Element code to snotel_observations column
+ELEMENT_COLUMNS = {
+    "WTEQ": "snow_water_equivalent_in",
+    "SNWD": "snow_depth_in",
+    "SNDN": "snow_density_pct",
+    "SNRR": "snow_rain_ratio",
+    "TMIN": "temp_min_f",
+    "TMAX": "temp_max_f",
+    "TAVG": "temp_avg_f",
+    "TOBS": "temp_observed_f",
+    "PREC": "precip_accum_in",
+    "PRCP": "precip_increment_in",
+    "WSPDV": "wind_speed_avg_mph",
+    "WSPDX": "wind_speed_max_mph",
+    "WDIRV": "wind_direction_avg_deg",
+    "RHUMV": "relative_humidity_avg_pct",
+}
+
+OBSERVATION_KEY_COLUMNS = ["station_triplet", "observation_date", "observation_hour", "duration"]
+OBSERVATION_VALUE_COLUMNS = list(ELEMENT_COLUMNS.values())
+# Column order of the tuples yielded by SNOTELDataCollector.observation_rows
+OBSERVATION_COLUMNS = OBSERVATION_KEY_COLUMNS + OBSERVATION_VALUE_COLUMNS
+
+# Seconds to wait for the AWDB API to respond (connect / between bytes)
+REQUEST_TIMEOUT = 120
+
+# Incremental refreshes re-request this many hours before each station's
+# watermark so late-arriving corrections are merged
+LOOKBACK_HOURS = int(os.environ.get("SNOTEL_LOOKBACK_HOURS", "6"))
+# Days requested for stations that have no watermark yet
+INITIAL_DAYS = int(os.environ.get("SNOTEL_INITIAL_DAYS", "3"))
+
+# Days of data requested per API call in streaming mode
+STREAM_WINDOW_DAYS = {"HOURLY": 7, "DAILY": 90}
+
 
 class SNOTELDataCollector:
     """Collects SNOTEL data for ski resorts and generates SQL statements."""
@@ -104,7 +147,9 @@ class SNOTELDataCollector:
         begin_date: str,
         end_date: str,
         duration: str = "DAILY",
-        elements: Optional[list[str]] = None
+        elements: Optional[list[str]] = None,
+        stations: Optional[list[str]] = None,
+        verbose: bool = True
     ) -> list[dict]:
         """
         Fetch SNOTEL data from the USDA AWDB REST API.
@@ -114,22 +159,104 @@ class SNOTELDataCollector:
             end_date: End date in YYYY-MM-DD format
             duration: Data duration - "HOURLY" or "DAILY"
             elements: List of element codes to fetch (defaults to SNOW_WEATHER_ELEMENTS)
+            stations: Station triplets to fetch (defaults to every mapped station)
+            verbose: Print request details
         
         Returns:
             List of station data dictionaries from the API
         """
-        if elements is None:
-            elements = SNOW_WEATHER_ELEMENTS
+        url, params = self._data_request(begin_date, end_date, duration, elements, stations)
+        
+        if verbose:
+            print(f"Fetching SNOTEL data from {begin_date} to {end_date}...")
+            print(f"Stations: {len(stations or self.unique_stations)}")
+            print(f"Elements: {params['elements']}")
+            print(f"Duration: {duration}")
+        
+        response = requests.get(url, params=params, headers={"accept": "application/json"}, timeout=REQUEST_TIMEOUT)
+        response.raise_for_status()
+        
+        data = response.json()
+        if verbose:
+            print(f"Received data for {len(data)} stations")
+        
+        return data
+    
+    def stream_snotel_data(
+        self,
+        begin_date: str,
+        end_date: str,
+        duration: str = "DAILY",
+        elements: Optional[list[str]] = None,
+        window_days: Optional[int] = None
+    ) -> Iterator[dict]:
+        """
+        Fetch SNOTEL data as a stream of per-station dictionaries.
+        
+        The date range is split into windows of `window_days` (one API call
+        each). With ijson installed each response is parsed incrementally and
+        stations are yielded as soon as they are read, so only one station's
+        window is in memory at a time; without it, one window's response is.
+        Either way peak memory no longer grows with the date range.
+        
+        Args:
+            begin_date: Start date in YYYY-MM-DD format
+            end_date: End date in YYYY-MM-DD format
+            duration: Data duration - "HOURLY" or "DAILY"
+            elements: List of element codes to fetch (defaults to SNOW_WEATHER_ELEMENTS)
+            window_days: Days per request (defaults to STREAM_WINDOW_DAYS[duration])
+        
+        Yields:
+            Station data dictionaries in the same shape as fetch_snotel_data
+        """
+        window_days = window_days or STREAM_WINDOW_DAYS.get(duration, 7)
+        begin = datetime.strptime(begin_date, "%Y-%m-%d")
+        end = datetime.strptime(end_date, "%Y-%m-%d")
         
-        # Join station triplets with comma
-        station_triplets = ",".join(self.unique_stations)
+        windows = []
+        while begin < end:
+            window_end = min(begin + timedelta(days=window_days), end)
+            windows.append((begin.strftime("%Y-%m-%d"), window_end.strftime("%Y-%m-%d")))
+            begin = window_end
+        # A single-day (begin == end) request is still one window
+        windows = windows or [(begin_date, end_date)]
         
-        # Join elements with comma
-        elements_str = ",".join(elements)
+        print(f"Streaming SNOTEL data from {begin_date} to {end_date} in {len(windows)} request(s)...")
+        print(f"Stations: {len(self.unique_stations)}")
+        print(f"Duration: {duration}")
+        print(f"Parser: {'ijson (incremental)' if ijson else 'json (per window)'}")
+        
+        for window_begin, window_end in windows:
+            url, params = self._data_request(window_begin, window_end, duration, elements)
+            response = requests.get(
+                url, params=params, headers={"accept": "application/json"}, stream=True, timeout=REQUEST_TIMEOUT
+            )
+            try:
+                response.raise_for_status()
+                if ijson:
+                    # Let urllib3 undo any gzip/deflate before the parser sees the bytes
+                    response.raw.decode_content = True
+                    yield from ijson.items(response.raw, "item", use_float=True)
+                else:
+                    yield from response.json()
+            finally:
+                response.close()
+    
+    def _data_request(
+        self,
+        begin_date: str,
+        end_date: str,
+        duration: str,
+        elements: Optional[list[str]] = None,
+        stations: Optional[list[str]] = None
+    ) -> tuple[str, dict]:
+        """URL and query parameters for an AWDB /data request (every mapped station by default)."""
+        if elements is None:
+            elements = SNOW_WEATHER_ELEMENTS
         
         params = {
-            "stationTriplets": station_triplets,
-            "elements": elements_str,
+            "stationTriplets": ",".join(stations or self.unique_stations),
+            "elements": ",".join(elements),
             "duration": duration,
             "beginDate": begin_date,
             "endDate": end_date,
@@ -140,24 +267,11 @@ class SNOTELDataCollector:
             "returnSuspectData": "false"
         }
         
-        url = f"{self.BASE_URL}/data"
-        
-        print(f"Fetching SNOTEL data from {begin_date} to {end_date}...")
-        print(f"Stations: {len(self.unique_stations)}")
-        print(f"Elements: {elements_str}")
-        print(f"Duration: {duration}")
-        
-        response = requests.get(url, params=params, headers={"accept": "application/json"})
-        response.raise_for_status()
-        
-        data = response.json()
-        print(f"Received data for {len(data)} stations")
-        
-        return data
+        return f"{self.BASE_URL}/data", params
     
-    def generate_station_inserts(self) -> str:
-        """Generate SQL INSERT statements for SNOTEL stations."""
-        inserts = []
+    def station_rows(self) -> list[tuple]:
+        """(station_triplet, station_name, latitude, longitude) for stations with coordinates."""
+        rows = []
         
         for station_triplet in self.unique_stations:
             # Find station info from mapping
@@ -174,13 +288,30 @@ class SNOTELDataCollector:
                     break
             
             if latitude and longitude:
-                insert = f"""INSERT INTO WEATHER_DATA.snotel_stations (station_triplet, station_name, latitude, longitude)
+                rows.append((station_triplet, station_name, latitude, longitude))
+        
+        return rows
+    
+    def resort_mapping_rows(self) -> list[tuple]:
+        """(resort_name, station_triplet, distance_miles) for every resort-station pair."""
+        return [
+            (resort_info["resort"], station_triplet, resort_info["distance_miles"])
+            for station_triplet, resorts in self.resort_station_lookup.items()
+            for resort_info in resorts
+        ]
+    
+    def generate_station_inserts(self) -> str:
+        """Generate SQL INSERT statements for SNOTEL stations."""
+        inserts = []
+        
+        for station_triplet, station_name, latitude, longitude in self.station_rows():
+            insert = f"""INSERT INTO WEATHER_DATA.snotel_stations (station_triplet, station_name, latitude, longitude)
 VALUES ('{station_triplet}', '{station_name}', {latitude}, {longitude})
 ON CONFLICT (station_triplet) DO UPDATE SET
     station_name = EXCLUDED.station_name,
     latitude = EXCLUDED.latitude,
     longitude = EXCLUDED.longitude;"""
-                inserts.append(insert)
+            inserts.append(insert)
         
         return "\n\n".join(inserts)
     
@@ -188,50 +319,29 @@ ON CONFLICT (station_triplet) DO UPDATE SET
         """Generate SQL INSERT statements for resort-station mappings."""
         inserts = []
         
-        for station_triplet, resorts in self.resort_station_lookup.items():
-            for resort_info in resorts:
-                resort_name = resort_info["resort"]
-                distance = resort_info["distance_miles"]
-                
-                insert = f"""INSERT INTO WEATHER_DATA.resort_station_mapping (resort_name, station_triplet, distance_miles)
+        for resort_name, station_triplet, distance in self.resort_mapping_rows():
+            insert = f"""INSERT INTO WEATHER_DATA.resort_station_mapping (resort_name, station_triplet, distance_miles)
 VALUES ('{resort_name}', '{station_triplet}', {distance})
 ON CONFLICT (resort_name, station_triplet) DO UPDATE SET
     distance_miles = EXCLUDED.distance_miles;"""
-                inserts.append(insert)
+            inserts.append(insert)
         
         return "\n\n".join(inserts)
     
-    def generate_observation_inserts(self, api_data: list[dict], duration: str = "DAILY") -> str:
+    def parse_observations(self, api_data: Iterable[dict]) -> Iterator[tuple[str, str, Optional[int], dict]]:
         """
-        Generate SQL INSERT statements for SNOTEL observations.
+        Pivot the AWDB response into one observation per station and date/hour.
+        
+        Stations are pivoted one at a time, so a streamed response
+        (stream_snotel_data) is never held in memory as a whole.
         
         Args:
-            api_data: Response data from the USDA AWDB API
-            duration: "DAILY" or "HOURLY"
+            api_data: Response data from the USDA AWDB API (any iterable of stations)
         
-        Returns:
-            SQL INSERT statements as a string
+        Yields:
+            (station_triplet, date, hour, {column_name: value}) tuples;
+            hour is None for daily data
         """
-        inserts = []
-        
-        # Element code to column name mapping
-        element_mapping = {
-            "WTEQ": "snow_water_equivalent_in",
-            "SNWD": "snow_depth_in",
-            "SNDN": "snow_density_pct",
-            "SNRR": "snow_rain_ratio",
-            "TMIN": "temp_min_f",
-            "TMAX": "temp_max_f",
-            "TAVG": "temp_avg_f",
-            "TOBS": "temp_observed_f",
-            "PREC": "precip_accum_in",
-            "PRCP": "precip_increment_in",
-            "WSPDV": "wind_speed_avg_mph",
-            "WSPDX": "wind_speed_max_mph",
-            "WDIRV": "wind_direction_avg_deg",
-            "RHUMV": "relative_humidity_avg_pct",
-        }
-        
         for station_data in api_data:
             station_triplet = station_data.get("stationTriplet", "")
             
@@ -244,10 +354,10 @@ ON CONFLICT (resort_name, station_triplet) DO UPDATE SET
             for data_item in station_data.get("data", []):
                 element_code = data_item.get("stationElement", {}).get("elementCode", "")
                 
-                if element_code not in element_mapping:
+                if element_code not in ELEMENT_COLUMNS:
                     continue
                 
-                column_name = element_mapping[element_code]
+                column_name = ELEMENT_COLUMNS[element_code]
                 
                 for value_entry in data_item.get("values", []):
                     date_str = value_entry.get("date", "")
@@ -272,38 +382,171 @@ ON CONFLICT (resort_name, station_triplet) DO UPDATE SET
                     
                     observations[key][column_name] = value
             
-            # Generate INSERT for each observation
             for (date_part, hour), values in observations.items():
-                columns = ["station_triplet", "observation_date", "observation_hour", "duration"]
-                hour_value = "NULL" if hour is None else str(hour)
-                sql_values = [f"'{station_triplet}'", f"'{date_part}'", hour_value, f"'{duration}'"]
-                
-                for col_name, val in values.items():
-                    columns.append(col_name)
-                    sql_values.append(str(val) if val is not None else "NULL")
-                
-                columns_str = ", ".join(columns)
-                values_str = ", ".join(sql_values)
-                
-                # Build update clause for upsert
-                update_cols = [col for col in columns if col not in 
-                              ["station_triplet", "observation_date", "observation_hour", "duration"]]
-                update_clause = ", ".join([f"{col} = EXCLUDED.{col}" for col in update_cols])
-                
-                if update_clause:
-                    insert = f"""INSERT INTO WEATHER_DATA.snotel_observations ({columns_str})
+                yield station_triplet, date_part, hour, values
+    
+    def observation_rows(self, api_data: Iterable[dict], duration: str = "DAILY") -> Iterator[tuple]:
+        """Observation tuples in OBSERVATION_COLUMNS order (None for missing elements)."""
+        for station_triplet, date_part, hour, values in self.parse_observations(api_data):
+            yield (
+                station_triplet, date_part, hour, duration,
+                *(values.get(column) for column in OBSERVATION_VALUE_COLUMNS),
+            )
+    
+    def generate_observation_inserts(self, api_data: list[dict], duration: str = "DAILY") -> str:
+        """
+        Generate SQL INSERT statements for SNOTEL observations.
+        
+        Args:
+            api_data: Response data from the USDA AWDB API
+            duration: "DAILY" or "HOURLY"
+        
+        Returns:
+            SQL INSERT statements as a string
+        """
+        inserts = []
+        
+        for station_triplet, date_part, hour, values in self.parse_observations(api_data):
+            columns = ["station_triplet", "observation_date", "observation_hour", "duration"]
+            hour_value = "NULL" if hour is None else str(hour)
+            sql_values = [f"'{station_triplet}'", f"'{date_part}'", hour_value, f"'{duration}'"]
+            
+            for col_name, val in values.items():
+                columns.append(col_name)
+                sql_values.append(str(val) if val is not None else "NULL")
+            
+            columns_str = ", ".join(columns)
+            values_str = ", ".join(sql_values)
+            
+            # Build update clause for upsert
+            update_cols = [col for col in columns if col not in OBSERVATION_KEY_COLUMNS]
+            update_clause = ", ".join([f"{col} = EXCLUDED.{col}" for col in update_cols])
+            
+            if update_clause:
+                insert = f"""INSERT INTO WEATHER_DATA.snotel_observations ({columns_str})
 VALUES ({values_str})
 ON CONFLICT (station_triplet, observation_date, observation_hour, duration) DO UPDATE SET
     {update_clause};"""
-                else:
-                    insert = f"""INSERT INTO WEATHER_DATA.snotel_observations ({columns_str})
+            else:
+                insert = f"""INSERT INTO WEATHER_DATA.snotel_observations ({columns_str})
 VALUES ({values_str})
 ON CONFLICT (station_triplet, observation_date, observation_hour, duration) DO NOTHING;"""
-                
-                inserts.append(insert)
+            
+            inserts.append(insert)
         
         return "\n\n".join(inserts)
     
+    def collect_and_load(
+        self,
+        conn,
+        begin_date: str,
+        end_date: str,
+        duration: str = "DAILY",
+        stream: bool = False
+    ) -> dict:
+        """
+        Collect SNOTEL data and load it straight into the database.
+        
+        Stations, resort mappings and observations are written in a single
+        transaction: observations go through COPY into a staging table and
+        one INSERT ... ON CONFLICT merge (see snotel_loader.py).
+        
+        Args:
+            conn: Open psycopg / psycopg2 connection
+            begin_date: Start date in YYYY-MM-DD format
+            end_date: End date in YYYY-MM-DD format
+            duration: "DAILY" or "HOURLY"
+            stream: Fetch and parse station by station (stream_snotel_data) and
+                feed rows to COPY as they are produced, for long backfills
+        
+        Returns:
+            Counts of stations, mappings and observations written
+        """
+        from snotel_loader import load_observations
+        
+        if stream:
+            api_data = self.stream_snotel_data(begin_date, end_date, duration)
+        else:
+            api_data = self.fetch_snotel_data(begin_date, end_date, duration)
+        return load_observations(
+            conn,
+            self.observation_rows(api_data, duration),
+            stations=self.station_rows(),
+            mappings=self.resort_mapping_rows(),
+        )
+    
+    def collect_incremental(
+        self,
+        conn,
+        end_date: str,
+        duration: str = "HOURLY",
+        lookback_hours: int = LOOKBACK_HOURS,
+        initial_days: int = INITIAL_DAYS
+    ) -> dict:
+        """
+        Fetch and load only the observations newer than each station's watermark.
+        
+        Each station is requested from its last stored observation minus
+        `lookback_hours` (or `initial_days` before end_date if it has none).
+        Stations that share a start date share one API request, and rows
+        older than a station's cutoff are dropped before loading, so a
+        refresh only moves new data plus the lookback.
+        
+        Args:
+            conn: Open psycopg / psycopg2 connection
+            end_date: End date in YYYY-MM-DD format
+            duration: "DAILY" or "HOURLY"
+            lookback_hours: Hours before the watermark to re-request
+            initial_days: Days to request for stations without a watermark
+        
+        Returns:
+            Counts of stations, mappings and observations written, plus the
+            earliest date requested and the number of requests
+        """
+        from snotel_loader import get_watermarks, load_observations
+        
+        watermarks = get_watermarks(conn, duration)
+        default_cutoff = datetime.strptime(end_date, "%Y-%m-%d") - timedelta(days=initial_days)
+        
+        cutoffs = {}
+        for triplet in self.unique_stations:
+            if triplet in watermarks:
+                last_date, last_hour = watermarks[triplet]
+                last_observed = datetime.combine(last_date, datetime.min.time()) + timedelta(hours=last_hour or 0)
+                cutoffs[triplet] = last_observed - timedelta(hours=lookback_hours)
+            else:
+                cutoffs[triplet] = default_cutoff
+        
+        # One request per distinct start date (normally one or two)
+        groups = {}
+        for triplet, cutoff in cutoffs.items():
+            groups.setdefault(min(cutoff.strftime("%Y-%m-%d"), end_date), []).append(triplet)
+        
+        print(f"Incremental refresh through {end_date} ({duration}, {lookback_hours}h lookback)")
+        missing = sum(1 for triplet in cutoffs if triplet not in watermarks)
+        print(f"Stations: {len(cutoffs)} ({missing} without a watermark)")
+        
+        api_data = []
+        for begin_date, stations in sorted(groups.items()):
+            print(f"  Fetching {begin_date} to {end_date} for {len(stations)} stations...")
+            api_data.extend(self.fetch_snotel_data(begin_date, end_date, duration, stations=stations, verbose=False))
+        
+        def new_rows():
+            for row in self.observation_rows(api_data, duration):
+                observed = datetime.strptime(row[1], "%Y-%m-%d") + timedelta(hours=row[2] or 0)
+                if observed >= cutoffs.get(row[0], default_cutoff):
+                    yield row
+        
+        counts = load_observations(
+            conn,
+            new_rows(),
+            stations=self.station_rows(),
+            mappings=self.resort_mapping_rows(),
+        )
+        counts["begin_date"] = min(groups) if groups else end_date
+        counts["requests"] = len(groups)
+        return counts
+    
     def collect_and_generate_sql(
         self,
         begin_date: str,
@@ -404,6 +647,16 @@ def main():
         default=None,
         help="Filter to a specific resort (case-insensitive). E.g., --resort Steamboat"
     )
+    parser.add_argument(
+        "--load",
+        action="store_true",
+        help="Load directly into the database at DATABASE_URL instead of generating SQL"
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="With --load: fetch and parse station by station to keep memory bounded on long backfills"
+    )
     
     args = parser.parse_args()
     
@@ -416,6 +669,29 @@ def main():
     print(f"Total stations: {len(collector.unique_stations)}")
     print()
     
+    if args.load:
+        import sys
+        from pathlib import Path
+        
+        # Repo root, for the shared ingestion package
+        sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+        from ingestion import get_db_connection
+        
+        database_url = os.getenv("DATABASE_URL")
+        if not database_url:
+            parser.error("--load requires the DATABASE_URL environment variable")
+        
+        conn = get_db_connection(database_url)
+        try:
+            counts = collector.collect_and_load(
+                conn, args.begin_date, args.end_date, args.duration, stream=args.stream
+            )
+        finally:
+            conn.close()
+        print(f"Loaded {counts['observations_copied']} observations "
+              f"({counts['observations_merged']} rows written, {counts['stations']} stations)")
+        return
+    
     sql = collector.collect_and_generate_sql(
         begin_date=args.begin_date,
         end_date=args.end_date,
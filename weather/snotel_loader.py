@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+SNOTEL Loader
+
+Writes parsed SNOTEL data straight to PostgreSQL with parameterized SQL.
+Observations are streamed into a temporary staging table with COPY and merged
+into WEATHER_DATA.snotel_observations with a single INSERT ... SELECT ...
+ON CONFLICT, so a whole refresh is a few round trips and one transaction.
+The same transaction advances the per-station watermarks
+(WEATHER_DATA.snotel_watermarks) that incremental refreshes start from.
+"""
+
+import sys
+from pathlib import Path
+from typing import Iterable, Optional
+
+# Repo root, for the shared ingestion package
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from ingestion.writer import copy_rows, merge_sql, staging_table_name
+from snotel_data_collector import OBSERVATION_COLUMNS, OBSERVATION_KEY_COLUMNS, OBSERVATION_VALUE_COLUMNS
+
+
+OBSERVATIONS_TABLE = "WEATHER_DATA.snotel_observations"
+STAGING_TABLE = staging_table_name(OBSERVATIONS_TABLE)
+
+STATION_UPSERT_SQL = """
+    INSERT INTO WEATHER_DATA.snotel_stations (station_triplet, station_name, latitude, longitude)
+    VALUES (%s, %s, %s, %s)
+    ON CONFLICT (station_triplet) DO UPDATE SET
+        station_name = EXCLUDED.station_name,
+        latitude = EXCLUDED.latitude,
+        longitude = EXCLUDED.longitude
+"""
+
+RESORT_MAPPING_UPSERT_SQL = """
+    INSERT INTO WEATHER_DATA.resort_station_mapping (resort_name, station_triplet, distance_miles)
+    VALUES (%s, %s, %s)
+    ON CONFLICT (resort_name, station_triplet) DO UPDATE SET
+        distance_miles = EXCLUDED.distance_miles
+"""
+
+# Missing elements (NULL in staging) keep whatever an earlier load stored, like
+# the per-observation upserts that only listed the elements they had.
+# Rows for stations that are not in snotel_stations are skipped rather than
+# failing the whole merge on the foreign key.
+MERGE_SQL = merge_sql(
+    OBSERVATIONS_TABLE,
+    OBSERVATION_COLUMNS,
+    OBSERVATION_KEY_COLUMNS,
+    update_columns=OBSERVATION_VALUE_COLUMNS,
+    keep_existing=True,
+    where="EXISTS (SELECT 1 FROM WEATHER_DATA.snotel_stations s WHERE s.station_triplet = st.station_triplet)",
+)
+
+# Advance per-station watermarks to the newest row just staged; never moves
+# them backwards (a backfill of old dates leaves them alone)
+WATERMARK_MERGE_SQL = f"""
+    INSERT INTO WEATHER_DATA.snotel_watermarks AS wm
+        (station_triplet, duration, last_observation_date, last_observation_hour)
+    SELECT DISTINCT ON (station_triplet, duration)
+        station_triplet, duration, observation_date, observation_hour
+    FROM {STAGING_TABLE} st
+    WHERE EXISTS (
+        SELECT 1 FROM WEATHER_DATA.snotel_stations s WHERE s.station_triplet = st.station_triplet
+    )
+    ORDER BY station_triplet, duration, observation_date DESC, observation_hour DESC NULLS LAST
+    ON CONFLICT (station_triplet, duration) DO UPDATE SET
+        last_observation_date = EXCLUDED.last_observation_date,
+        last_observation_hour = EXCLUDED.last_observation_hour,
+        updated_at = CURRENT_TIMESTAMP
+    WHERE (EXCLUDED.last_observation_date, COALESCE(EXCLUDED.last_observation_hour, -1))
+        > (wm.last_observation_date, COALESCE(wm.last_observation_hour, -1))
+"""
+
+WATERMARKS_SQL = """
+    SELECT station_triplet, last_observation_date, last_observation_hour
+    FROM WEATHER_DATA.snotel_watermarks
+    WHERE duration = %s
+"""
+
+
+def upsert_stations(cursor, stations: Iterable[tuple]) -> int:
+    """Upsert (station_triplet, station_name, latitude, longitude) rows"""
+    stations = list(stations)
+    if stations:
+        cursor.executemany(STATION_UPSERT_SQL, stations)
+    return len(stations)
+
+
+def upsert_resort_mappings(cursor, mappings: Iterable[tuple]) -> int:
+    """Upsert (resort_name, station_triplet, distance_miles) rows"""
+    mappings = list(mappings)
+    if mappings:
+        cursor.executemany(RESORT_MAPPING_UPSERT_SQL, mappings)
+    return len(mappings)
+
+
+def copy_observations(cursor, rows: Iterable[tuple]) -> int:
+    """Stream observation tuples (OBSERVATION_COLUMNS order) into the staging table"""
+    return copy_rows(cursor, OBSERVATIONS_TABLE, OBSERVATION_COLUMNS, rows)
+
+
+def merge_observations(cursor) -> int:
+    """Merge the staging table into WEATHER_DATA.snotel_observations; returns rows written"""
+    cursor.execute(MERGE_SQL)
+    return cursor.rowcount
+
+
+def update_watermarks(cursor) -> int:
+    """Advance WEATHER_DATA.snotel_watermarks from the staging table; returns stations advanced"""
+    cursor.execute(WATERMARK_MERGE_SQL)
+    return cursor.rowcount
+
+
+def get_watermarks(conn, duration: str) -> dict:
+    """station_triplet -> (last observation date, hour or None) for a duration"""
+    cursor = conn.cursor()
+    try:
+        cursor.execute(WATERMARKS_SQL, (duration,))
+        return {triplet: (observation_date, observation_hour) for triplet, observation_date, observation_hour in cursor.fetchall()}
+    finally:
+        cursor.close()
+
+
+def write_observations(
+    cursor,
+    rows: Iterable[tuple],
+    stations: Optional[Iterable[tuple]] = None,
+    mappings: Optional[Iterable[tuple]] = None,
+) -> dict:
+    """Upsert stations/mappings, COPY + merge observations and advance watermarks without committing"""
+    station_count = upsert_stations(cursor, stations or [])
+    mapping_count = upsert_resort_mappings(cursor, mappings or [])
+    copied = copy_observations(cursor, rows)
+    merged = merge_observations(cursor)
+    watermarks = update_watermarks(cursor)
+    return {
+        "stations": station_count,
+        "resort_mappings": mapping_count,
+        "observations_copied": copied,
+        "observations_merged": merged,
+        "watermarks_advanced": watermarks,
+    }
+
+
+def load_observations(
+    conn,
+    rows: Iterable[tuple],
+    stations: Optional[Iterable[tuple]] = None,
+    mappings: Optional[Iterable[tuple]] = None,
+) -> dict:
+    """Load stations, resort mappings and observations in one transaction
+
+    Rolls back (and re-raises) on any error, so a failed refresh leaves the
+    previous data untouched.
+    """
+    cursor = conn.cursor()
+    try:
+        counts = write_observations(cursor, rows, stations, mappings)
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        cursor.close()
+
+    return counts